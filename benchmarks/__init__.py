@@ -0,0 +1 @@
+"""Benchmarks for OpenAlchemy, run using airspeed velocity (asv)."""
@@ -0,0 +1,16 @@
+"""Benchmarks for importing open_alchemy in a new interpreter."""
+
+
+class Import:
+    """Benchmark the cold start import time."""
+
+    # Each import is timed in a new interpreter, so repeat it a few times
+    repeat = (5, 20, 60.0)
+
+    def timeraw_import_open_alchemy(self):
+        """Time importing open_alchemy."""
+        return "import open_alchemy"
+
+    def timeraw_import_open_alchemy_models(self):
+        """Time importing open_alchemy and accessing the models."""
+        return "from open_alchemy import models"
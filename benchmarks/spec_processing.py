@@ -0,0 +1,108 @@
+"""Benchmarks for processing specifications of different sizes."""
+
+import copy
+import os
+import tempfile
+
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import build
+from open_alchemy import helpers
+from open_alchemy import models_file
+from open_alchemy import schemas
+
+from . import specs
+
+
+class _Spec:
+    """Generate a specification with the number of models and its remote file."""
+
+    params = specs.MODELS
+    param_names = ["models"]
+    # The benchmarks change their inputs, so each is timed once per setup
+    number = 1
+    repeat = (1, 5, 120.0)
+    timeout = 600.0
+
+    def setup(self, models):
+        """Generate the specification and write the remote file."""
+        self.directory = (
+            tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        )
+        self.spec_path = specs.write_remote(directory=self.directory.name)
+        helpers.ref.set_context(path=self.spec_path)
+        self.spec = specs.generate(models=models)
+        self.schemas = copy.deepcopy(self.spec["components"]["schemas"])
+
+    def teardown(self, _):
+        """Remove the remote file."""
+        self.directory.cleanup()
+
+
+class InitModelFactory(_Spec):
+    """Benchmark initializing the model factory."""
+
+    def time_init_model_factory(self, _):
+        """Time initializing the model factory which defines all models."""
+        open_alchemy.init_model_factory(
+            base=declarative.declarative_base(),
+            spec=self.spec,
+            spec_path=self.spec_path,
+        )
+
+
+class SchemasProcess(_Spec):
+    """Benchmark pre-processing the schemas."""
+
+    def time_process(self, _):
+        """Time pre-processing the schemas."""
+        schemas.process(schemas=self.schemas)
+
+
+class ArtifactsGetFromSchemas(_Spec):
+    """Benchmark calculating the artifacts of the schemas."""
+
+    def setup(self, models):
+        """Pre-process the schemas."""
+        super().setup(models)
+        schemas.process(schemas=self.schemas)
+
+    def time_get_from_schemas(self, _):
+        """Time calculating the artifacts used to construct the models."""
+        schemas.artifacts.get_from_schemas(schemas=self.schemas, stay_within_model=True)
+
+    def time_get_from_schemas_models_file(self, _):
+        """Time calculating the artifacts used to generate the models file."""
+        schemas.artifacts.get_from_schemas(
+            schemas=self.schemas, stay_within_model=False
+        )
+
+
+class ModelsFileGenerate(_Spec):
+    """Benchmark generating the models file."""
+
+    def setup(self, models):
+        """Calculate the artifacts of the schemas."""
+        super().setup(models)
+        schemas.process(schemas=self.schemas)
+        self.artifacts = schemas.artifacts.get_from_schemas(
+            schemas=self.schemas, stay_within_model=False
+        )
+
+    def time_generate(self, _):
+        """Time generating the models file."""
+        models_file.generate(artifacts=self.artifacts)
+
+
+class BuildExecute(_Spec):
+    """Benchmark building a package without a distribution archive."""
+
+    def time_execute(self, _):
+        """Time building the package."""
+        build.execute(
+            spec=self.spec,
+            name="benchmark",
+            path=os.path.join(self.directory.name, "dist"),
+            format_=build.PackageFormat.NONE,
+        )
@@ -0,0 +1,195 @@
+"""Generate synthetic specifications for the benchmarks."""
+
+import json
+import os
+import typing
+
+# The number of models each unit of the generated specification consists of
+MODELS_PER_UNIT = 5
+# The number of models of the specifications the benchmarks are parametrized with
+MODELS = [10, 100, 1000]
+
+REMOTE_FILENAME = "remote.json"
+REMOTE_SCHEMAS = {
+    "Name": {"type": "string", "maxLength": 100, "description": "The name."},
+    "Identifier": {
+        "type": "integer",
+        "x-primary-key": True,
+        "x-autoincrement": True,
+        "description": "Unique identifier.",
+    },
+}
+
+
+def _ref(name: str) -> typing.Dict[str, str]:
+    """Reference a schema in the specification."""
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _remote_ref(name: str) -> typing.Dict[str, str]:
+    """Reference a schema in the remote file."""
+    return {"$ref": f"{REMOTE_FILENAME}#/{name}"}
+
+
+def _generate_unit(index: int) -> typing.Dict[str, typing.Any]:
+    """
+    Generate the schemas of a unit of the specification.
+
+    The unit consists of:
+    Division: a model with a polymorphic type column,
+    Team: inherits from Division using joined table inheritance,
+    Project: a plain model,
+    Employee: many-to-one relationship to Division with a back reference and
+        many-to-many relationship to Project and
+    Manager: inherits from Employee using single table inheritance.
+
+    """
+    division = f"Division{index}"
+    team = f"Team{index}"
+    project = f"Project{index}"
+    employee = f"Employee{index}"
+    manager = f"Manager{index}"
+    return {
+        division: {
+            "type": "object",
+            "x-tablename": division.lower(),
+            "required": ["name"],
+            "properties": {
+                "id": _remote_ref("Identifier"),
+                "name": _remote_ref("Name"),
+                "type": {"type": "string"},
+            },
+            "x-kwargs": {
+                "__mapper_args__": {
+                    "polymorphic_on": "type",
+                    "polymorphic_identity": division.lower(),
+                }
+            },
+        },
+        team: {
+            "allOf": [
+                _ref(division),
+                {
+                    "x-inherits": True,
+                    "x-tablename": team.lower(),
+                    "type": "object",
+                    "properties": {
+                        "id": {
+                            "type": "integer",
+                            "x-primary-key": True,
+                            "x-foreign-key": f"{division.lower()}.id",
+                        },
+                        "size": {"type": "integer", "nullable": True},
+                    },
+                    "x-kwargs": {
+                        "__mapper_args__": {"polymorphic_identity": team.lower()}
+                    },
+                },
+            ]
+        },
+        project: {
+            "type": "object",
+            "x-tablename": project.lower(),
+            "required": ["name"],
+            "properties": {
+                "id": _remote_ref("Identifier"),
+                "name": _remote_ref("Name"),
+                "budget": {
+                    "allOf": [{"type": "number"}, {"description": "The budget."}]
+                },
+            },
+        },
+        employee: {
+            "type": "object",
+            "x-tablename": employee.lower(),
+            "required": ["name"],
+            "properties": {
+                "id": _remote_ref("Identifier"),
+                "name": _remote_ref("Name"),
+                "salary": {"type": "number", "nullable": True},
+                "joined": {"type": "string", "format": "date"},
+                "active": {
+                    "allOf": [{"type": "boolean"}, {"description": "Is active."}]
+                },
+                "type": {"type": "string"},
+                "division": {
+                    "allOf": [
+                        _ref(division),
+                        {"x-backref": "employees", "description": "The division."},
+                    ]
+                },
+                "projects": {
+                    "type": "array",
+                    "items": {
+                        "allOf": [
+                            _ref(project),
+                            {"x-secondary": f"{employee.lower()}_{project.lower()}"},
+                        ]
+                    },
+                },
+            },
+            "x-kwargs": {
+                "__mapper_args__": {
+                    "polymorphic_on": "type",
+                    "polymorphic_identity": employee.lower(),
+                }
+            },
+        },
+        manager: {
+            "allOf": [
+                _ref(employee),
+                {
+                    "x-inherits": True,
+                    "type": "object",
+                    "properties": {"reports": {"type": "integer"}},
+                    "x-kwargs": {
+                        "__mapper_args__": {"polymorphic_identity": manager.lower()}
+                    },
+                },
+            ]
+        },
+    }
+
+
+def generate(*, models: int) -> typing.Dict[str, typing.Any]:
+    """
+    Generate a specification.
+
+    The specification consists of units of models that cover inheritance,
+    relationships, allOf and local and remote references. The remote references
+    point to the file written by write_remote.
+
+    Args:
+        models: The number of models, rounded down to a multiple of the number of
+            models per unit.
+
+    Returns:
+        The specification.
+
+    """
+    schemas: typing.Dict[str, typing.Any] = {}
+    for index in range(max(1, models // MODELS_PER_UNIT)):
+        schemas.update(_generate_unit(index))
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Benchmark", "version": "1"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def write_remote(*, directory: str) -> str:
+    """
+    Write the file the remote references point to.
+
+    Args:
+        directory: The directory to write the file in.
+
+    Returns:
+        The path of a specification in the directory, used to resolve the remote
+        references.
+
+    """
+    with open(os.path.join(directory, REMOTE_FILENAME), "w") as out_file:
+        json.dump(REMOTE_SCHEMAS, out_file)
+    return os.path.join(directory, "spec.json")
@@ -0,0 +1,227 @@
+"""Benchmarks for the utilities added to the models."""
+
+import datetime
+import io
+import tempfile
+
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+from . import specs
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "type": "object",
+                "x-tablename": "employee",
+                "required": ["id", "name"],
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "division": {"type": "string", "nullable": True},
+                    "salary": {"type": "number"},
+                    "joined": {"type": "string", "format": "date"},
+                    "active": {"type": "boolean"},
+                    "password": {"type": "string", "writeOnly": True},
+                },
+            }
+        }
+    }
+}
+
+
+class _NullFile:
+    """File that discards what is written to it."""
+
+    def write(self, value):
+        """Discard the value."""
+
+
+class ToDict:
+    """Benchmark converting model instances to dictionaries."""
+
+    def setup(self):
+        """Construct the model and instances."""
+        base = declarative.declarative_base()
+        model_factory = open_alchemy.init_model_factory(base=base, spec=SPEC)
+        self.model = model_factory(name="Employee")
+        self.instance = self.model(
+            id=1,
+            name="David Andersson",
+            division=None,
+            salary=1000000.0,
+            joined=datetime.date(2020, 1, 1),
+            active=True,
+            password="secret",
+        )
+        self.instances = [self.instance] * 1000
+
+    def time_to_dict(self):
+        """Time converting a single instance."""
+        self.instance.to_dict()
+
+    def time_to_dict_1000(self):
+        """Time converting 1000 instances."""
+        for instance in self.instances:
+            instance.to_dict()
+
+    def time_to_dicts_1000(self):
+        """Time converting 1000 instances in a batch."""
+        for _ in self.model.to_dicts(self.instances):
+            pass
+
+
+class ToStr:
+    """Benchmark converting model instances to JSON strings."""
+
+    def setup(self):
+        """Construct the model and instances."""
+        base = declarative.declarative_base()
+        model_factory = open_alchemy.init_model_factory(base=base, spec=SPEC)
+        self.model = model_factory(name="Employee")
+        self.instance = self.model(
+            id=1,
+            name="David Andersson",
+            division=None,
+            salary=1000000.0,
+            joined=datetime.date(2020, 1, 1),
+            active=True,
+            password="secret",
+        )
+        self.instances = [self.instance] * 1000
+
+    def time_to_str(self):
+        """Time converting a single instance."""
+        self.instance.to_str()
+
+    def time_to_str_1000(self):
+        """Time converting 1000 instances."""
+        for instance in self.instances:
+            instance.to_str()
+
+    def time_stream_json_1000(self):
+        """Time writing 1000 instances as a JSON array."""
+        self.model.stream_json(self.instances, io.StringIO())
+
+    def peakmem_stream_json_10000(self):
+        """Peak memory of writing 10000 instances to a file that discards them."""
+        self.model.stream_json(
+            (self.instance for _ in range(10000)), _NullFile(), chunk_size=100
+        )
+
+
+class FromDict:
+    """Benchmark constructing model instances from dictionaries."""
+
+    def setup(self):
+        """Construct the model and dictionaries."""
+        base = declarative.declarative_base()
+        model_factory = open_alchemy.init_model_factory(base=base, spec=SPEC)
+        self.model = model_factory(name="Employee")
+        self.dictionary = {
+            "id": 1,
+            "name": "David Andersson",
+            "salary": 1000000.0,
+            "joined": "2020-01-01",
+            "active": True,
+            "password": "secret",
+        }
+        self.dictionaries = [self.dictionary] * 1000
+
+    def time_from_dict(self):
+        """Time constructing a single instance."""
+        self.model.from_dict(**self.dictionary)
+
+    def time_from_dict_1000(self):
+        """Time constructing 1000 instances."""
+        for dictionary in self.dictionaries:
+            self.model.from_dict(**dictionary)
+
+    def time_from_dicts_1000(self):
+        """Time constructing 1000 instances in a batch."""
+        for _ in self.model.from_dicts(self.dictionaries):
+            pass
+
+
+class FromDictValidationLevel:
+    """Benchmark constructing model instances for each validation level."""
+
+    params = [level.value for level in open_alchemy.ValidationLevel]
+    param_names = ["validation_level"]
+
+    def setup(self, validation_level):
+        """Construct the model with the validation level and the dictionaries."""
+        base = declarative.declarative_base()
+        model_factory = open_alchemy.init_model_factory(
+            base=base,
+            spec=SPEC,
+            validation_level=open_alchemy.ValidationLevel(validation_level),
+        )
+        self.model = model_factory(name="Employee")
+        self.dictionaries = [
+            {
+                "id": 1,
+                "name": "David Andersson",
+                "salary": 1000000.0,
+                "joined": "2020-01-01",
+                "active": True,
+                "password": "secret",
+            }
+        ] * 1000
+
+    def time_from_dicts_1000(self, _):
+        """Time constructing 1000 instances in a batch."""
+        for _ in self.model.from_dicts(self.dictionaries):
+            pass
+
+
+class Relationships:
+    """Benchmark converting instances with inheritance and relationships."""
+
+    def setup(self):
+        """Construct the models of a generated specification and the dictionaries."""
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        spec_path = specs.write_remote(directory=self.directory.name)
+        base = declarative.declarative_base()
+        model_factory = open_alchemy.init_model_factory(
+            base=base, spec=specs.generate(models=10), spec_path=spec_path
+        )
+        self.model = model_factory(name="Manager0")
+        self.dictionaries = [
+            {
+                "id": 1,
+                "name": "David Andersson",
+                "salary": 1000000.0,
+                "joined": "2020-01-01",
+                "active": True,
+                "reports": 3,
+                "division": {"id": 1, "name": "Engineering"},
+                "projects": [
+                    {"id": 1, "name": "Expand to the USA", "budget": 1000.0},
+                    {"id": 2, "name": "Expand to Europe", "budget": 2000.0},
+                ],
+            }
+        ] * 1000
+        self.instances = list(self.model.from_dicts(self.dictionaries))
+
+    def teardown(self):
+        """Remove the remote file."""
+        self.directory.cleanup()
+
+    def time_from_dicts_1000(self):
+        """Time constructing 1000 instances with related instances."""
+        for _ in self.model.from_dicts(self.dictionaries):
+            pass
+
+    def time_to_dicts_1000(self):
+        """Time converting 1000 instances with related instances."""
+        for _ in self.model.to_dicts(self.instances):
+            pass
+
+    def time_to_str_1000(self):
+        """Time converting 1000 instances with related instances to JSON strings."""
+        for instance in self.instances:
+            instance.to_str()
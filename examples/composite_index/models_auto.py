@@ -81,9 +81,9 @@ class TEmployee(typing.Protocol):
         ...
 
     @classmethod
-    def from_str(cls, value: str) -> "TEmployee":
+    def from_str(cls, value: typing.Union[str, bytes]) -> "TEmployee":
         """
-        Construct from a JSON string (eg. a POST payload).
+        Construct from a JSON string or bytes (eg. a POST payload).
 
         Returns:
             Model instance based on the JSON string.
@@ -91,6 +91,22 @@ class TEmployee(typing.Protocol):
         """
         ...
 
+    @classmethod
+    def from_dicts(
+        cls,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        errors: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> typing.Iterator["TEmployee"]:
+        """
+        Construct from dictionaries (eg. a batch of POST payloads).
+
+        Returns:
+            Iterator with a model instance based on each dictionary.
+
+        """
+        ...
+
     def to_dict(self) -> EmployeeDict:
         """
         Convert to a dictionary (eg. to send back for a GET request).
@@ -101,6 +117,41 @@ class TEmployee(typing.Protocol):
         """
         ...
 
+    @classmethod
+    def to_dicts(
+        cls,
+        instances: typing.Iterable["TEmployee"],
+        *,
+        errors: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> typing.Iterator[EmployeeDict]:
+        """
+        Convert model instances to dictionaries (eg. to send back for a GET request).
+
+        Returns:
+            Iterator with a dictionary based on each model instance.
+
+        """
+        ...
+
+    @classmethod
+    def stream_json(
+        cls,
+        instances: typing.Iterable["TEmployee"],
+        fp: typing.TextIO,
+        *,
+        chunk_size: int = 1000,
+        ndjson: bool = False,
+        errors: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> int:
+        """
+        Write model instances to a file as JSON (eg. to send back for a GET request).
+
+        Returns:
+            The number of instances written.
+
+        """
+        ...
+
     def to_str(self) -> str:
         """
         Convert to a JSON string (eg. to send back for a GET request).
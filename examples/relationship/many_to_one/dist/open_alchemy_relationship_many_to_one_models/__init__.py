@@ -78,9 +78,9 @@ class TDivision(typing.Protocol):
         ...
 
     @classmethod
-    def from_str(cls, value: str) -> "TDivision":
+    def from_str(cls, value: typing.Union[str, bytes]) -> "TDivision":
         """
-        Construct from a JSON string (eg. a POST payload).
+        Construct from a JSON string or bytes (eg. a POST payload).
 
         Returns:
             Model instance based on the JSON string.
@@ -182,9 +182,9 @@ class TEmployee(typing.Protocol):
         ...
 
     @classmethod
-    def from_str(cls, value: str) -> "TEmployee":
+    def from_str(cls, value: typing.Union[str, bytes]) -> "TEmployee":
         """
-        Construct from a JSON string (eg. a POST payload).
+        Construct from a JSON string or bytes (eg. a POST payload).
 
         Returns:
             Model instance based on the JSON string.
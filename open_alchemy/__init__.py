@@ -2,31 +2,79 @@
 
 import functools
 import sys
-import types as py_types
+import threading
+import time
 import typing
 
 from sqlalchemy.ext import declarative
 
 from open_alchemy import types as oa_types
 
-from . import build as _build_module
+from . import cache as _cache
 from . import exceptions
+from . import facades as _facades
 from . import helpers as _helpers
 from . import model_factory as _model_factory
-from . import models_file as _models_file
+from . import profiling as _profiling
+from . import registry as _registry
 from . import schemas as _schemas_module
-from .build import PackageFormat
-
-models = py_types.ModuleType("models")  # pylint: disable=invalid-name
+from .load import LoadResult
+from .load import load_ndjson
+from .profiling import Profile
+from .registry import ModelRegistry
+from .types import PackageFormat
+from .types import ValidationLevel
+
+# The version of the source, used when the distribution is not installed
+_VERSION = "2.1.0"
+if typing.TYPE_CHECKING:  # pragma: no cover
+    # Retrieved when it is first accessed by __getattr__
+    __version__: str
+
+models = _registry.ModelRegistry("models")  # pylint: disable=invalid-name
 sys.modules["open_alchemy.models"] = models
 
 
+@functools.lru_cache(maxsize=None)
+def _get_version() -> str:
+    """
+    Retrieve the version of the installed distribution.
+
+    Falls back to the version of the source if the distribution is not installed or
+    importlib.metadata is not available (before Python 3.8).
+
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from importlib import metadata
+    except ImportError:  # pragma: no cover
+        return _VERSION
+    try:
+        return metadata.version("OpenAlchemy")
+    except metadata.PackageNotFoundError:
+        return _VERSION
+
+
+def __getattr__(name: str) -> str:
+    """Retrieve __version__ when it is first accessed."""
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def init_model_factory(
     *,
     base: typing.Type,
     spec: oa_types.Schema,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    validation_level: oa_types.ValidationLevel = oa_types.ValidationLevel.FULL,
+    cache_dir: typing.Optional[str] = None,
+    lazy: bool = False,
+    profile: typing.Optional[_profiling.Profile] = None,
+    registry: typing.Optional[_registry.ModelRegistry] = None,
+    json_codec: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
 ) -> oa_types.ModelFactory:
     """
     Create factory that generates SQLAlchemy models based on OpenAPI specification.
@@ -37,16 +85,81 @@ def init_model_factory(
         models_filename: The name of the file to write the models typing information to.
         spec_path: The path the the OpenAPI specification. Mainly used to support remote
             references.
+        validation_level: How thoroughly dictionaries passed to from_dict are
+            validated. TYPES only checks the required properties and the type of each
+            property which is much faster than the full validation against the model
+            schema and NONE skips the validation.
+        cache_dir: The directory to cache the pre-processed schemas and artifacts in.
+            They are stored for the hash of the specification and loaded instead of
+            pre-processing the schemas when the specification has not changed. They
+            are pickled, so the directory must be trusted and private. Nothing is
+            loaded from a directory that others can write to.
+        lazy: Whether to define each model (and the models it is related to) when it
+            is first accessed on open_alchemy.models or using the model factory
+            instead of defining all models up front.
+        profile: If passed, the wall time and number of calls of each stage and model
+            are recorded in it. If the OPEN_ALCHEMY_PROFILE environment variable is
+            set, the profile is logged.
+        registry: The registry the base and models are made available on, defaults
+            to open_alchemy.models. Use a separate registry for each specification to
+            load multiple specifications in the same process.
+        json_codec: The name of the JSON codec used by to_str and from_str of the
+            models and to decode remote references. One of json, the default,
+            orjson, rapidjson, ujson or auto, which selects the fastest one that is
+            installed.
+        workers: If passed, the schemas are validated and the models file is
+            generated using a pool with this number of processes, which is faster for
+            specifications with many models.
 
     Returns:
         A factory that returns SQLAlchemy models derived from the base based on the
         OpenAPI specification.
 
     """
-    # Record the spec path
+    codec = _facades.json_codec.get(json_codec)
+
+    # Each specification with a path resolves remote references using its own store
+    remote_store = _helpers.ref.get_store()
     if spec_path is not None:
-        _helpers.ref.set_context(path=spec_path)
+        remote_store = _helpers.ref.RemoteSchemaStore(
+            spec_context=spec_path, json_codec=codec
+        )
+
+    if registry is None:
+        registry = models
+    registry.remote_store = remote_store
 
+    with _helpers.ref.use_store(store=remote_store):
+        return _init_model_factory(
+            base=base,
+            spec=spec,
+            models_filename=models_filename,
+            remote_store=remote_store,
+            validation_level=validation_level,
+            cache_dir=cache_dir,
+            lazy=lazy,
+            profile=profile,
+            registry=registry,
+            json_codec=codec,
+            workers=workers,
+        )
+
+
+def _init_model_factory(
+    *,
+    base: typing.Type,
+    spec: oa_types.Schema,
+    models_filename: typing.Optional[str],
+    remote_store: _helpers.ref.RemoteSchemaStore,
+    validation_level: oa_types.ValidationLevel,
+    cache_dir: typing.Optional[str],
+    lazy: bool,
+    profile: typing.Optional[_profiling.Profile],
+    registry: _registry.ModelRegistry,
+    json_codec: _facades.json_codec.Codec,
+    workers: typing.Optional[int],
+) -> oa_types.ModelFactory:
+    """Implement init_model_factory."""
     # Retrieving the schema from the specification
     if "components" not in spec:
         raise exceptions.MalformedSpecificationError(
@@ -59,45 +172,217 @@ def init_model_factory(
         )
     schemas = components.get("schemas", {})
 
-    # Pre-processing schemas
-    _schemas_module.process(schemas=schemas)
-
-    # Getting artifacts
-    schemas_artifacts = _schemas_module.artifacts.get_from_schemas(
-        schemas=schemas, stay_within_model=True
-    )
+    if profile is None and _profiling.enabled():
+        profile = _profiling.Profile()
+
+    cache_entry: typing.Optional[_cache.Entry] = None
+    if cache_dir is not None:
+        # The remote files are part of the key so they are loaded up front
+        with _profiling.stage(profile, "remote_prefetch"):
+            _helpers.ref.prefetch(schemas=schemas)
+        with _profiling.stage(profile, "cache"):
+            cache_key = _cache.calculate_key(
+                spec=spec,
+                remote_documents=remote_store.get_documents(schemas=schemas),
+            )
+            cache_entry = _cache.load(directory=cache_dir, key=cache_key)
+
+    models_file_artifacts: typing.Optional[oa_types.ModelsModelArtifacts] = None
+    if cache_entry is not None:
+        schemas = cache_entry.schemas
+        schemas_artifacts = cache_entry.artifacts
+        models_file_artifacts = cache_entry.models_file_artifacts
+    else:
+        # Loading remote files
+        if cache_dir is None:
+            with _profiling.stage(profile, "remote_prefetch"):
+                _helpers.ref.prefetch(schemas=schemas)
+
+        # Pre-processing schemas
+        timings: typing.List[_schemas_module.StageTiming] = []
+        _schemas_module.process(
+            schemas=schemas,
+            timings=timings if profile is not None else None,
+            workers=workers,
+        )
+        if profile is not None:
+            for timing in timings:
+                profile.add_stage(name=f"schemas.{timing.name}", seconds=timing.seconds)
+
+        # Getting artifacts
+        with _profiling.stage(profile, "artifacts"):
+            schemas_artifacts = _schemas_module.artifacts.get_from_schemas(
+                schemas=schemas, stay_within_model=True
+            )
+
+        if cache_dir is not None:
+            with _profiling.stage(profile, "artifacts"):
+                models_file_artifacts = _schemas_module.artifacts.get_from_schemas(
+                    schemas=schemas, stay_within_model=False
+                )
+            with _profiling.stage(profile, "cache"):
+                _cache.store(
+                    directory=cache_dir,
+                    key=cache_key,
+                    entry=_cache.Entry(
+                        schemas=schemas,
+                        artifacts=schemas_artifacts,
+                        models_file_artifacts=models_file_artifacts,
+                    ),
+                )
 
     # Binding the base and schemas
     bound_model_factories = functools.partial(
         _model_factory.model_factory,
         schemas=schemas,
         artifacts=schemas_artifacts,
-        get_base=_get_base,
+        get_base=functools.partial(_get_base, registry=registry),
+        validation_level=validation_level,
+        registry=registry,
+        json_codec=json_codec,
     )
     # Caching calls
     cached_model_factories = functools.lru_cache(maxsize=None)(bound_model_factories)
 
     # Making Base importable
-    setattr(models, "Base", base)
+    setattr(registry, "Base", base)
 
     # Intercept factory calls to make models available
     def _register_model(*, name: str) -> typing.Type:
         """Intercept calls to model factory and register model on models."""
-        model = cached_model_factories(name=name)
-        setattr(models, name, model)
+        start = time.perf_counter()
+        with _helpers.ref.use_store(store=remote_store):
+            model = cached_model_factories(name=name)
+        setattr(registry, name, model)
+        if profile is not None:
+            profile.add_model(name=name, seconds=time.perf_counter() - start)
         return model
 
     if models_filename is not None:
-        schemas_artifacts = _schemas_module.artifacts.get_from_schemas(
-            schemas=schemas, stay_within_model=False
+        with _profiling.stage(profile, "models_file"):
+            if models_file_artifacts is None:
+                models_file_artifacts = _schemas_module.artifacts.get_from_schemas(
+                    schemas=schemas, stay_within_model=False
+                )
+            _write_models_file(
+                models_filename=models_filename,
+                artifacts=models_file_artifacts,
+                cache_dir=cache_dir,
+                workers=workers,
+            )
+
+    model_factory: oa_types.ModelFactory = _register_model
+    if lazy:
+        model_factory = _init_lazy(
+            model_factory=_register_model,
+            schemas=schemas,
+            artifacts=schemas_artifacts,
+            remote_store=remote_store,
+            registry=registry,
+        )
+    else:
+        registry.__dict__.pop("__getattr__", None)
+        with _profiling.stage(profile, "define_all"):
+            _helpers.define_all(model_factory=_register_model, schemas=schemas)
+
+    if profile is not None and _profiling.enabled():
+        _profiling.log(profile)
+
+    return model_factory
+
+
+def _write_models_file(
+    *,
+    models_filename: str,
+    artifacts: oa_types.ModelsModelArtifacts,
+    cache_dir: typing.Optional[str],
+    workers: typing.Optional[int],
+) -> None:
+    """
+    Generate and write the models file.
+
+    If there is a cache directory, the source of each model is stored in it and only
+    the models that changed since the models file was last generated are generated.
+
+    Args:
+        models_filename: The name of the models file.
+        artifacts: The artifacts of the models for the models file.
+        cache_dir: The directory the source of each model is cached in.
+        workers: If passed, the models are generated using a pool with this number of
+            processes.
+
+    """
+    # Import as needed since the models file is only generated on request
+    from . import models_file  # pylint: disable=import-outside-toplevel
+
+    if cache_dir is None:
+        source = models_file.generate(artifacts=artifacts, workers=workers)
+    else:
+        cached_model_sources = _cache.load_model_sources(
+            directory=cache_dir, models_filename=models_filename
+        )
+        source, model_sources = models_file.generate_incremental(
+            artifacts=artifacts, model_sources=cached_model_sources, workers=workers
         )
-        models_file_contents = _models_file.generate(artifacts=schemas_artifacts)
-        with open(models_filename, "w") as out_file:
-            out_file.write(models_file_contents)
+        if model_sources != cached_model_sources:
+            _cache.store_model_sources(
+                directory=cache_dir,
+                models_filename=models_filename,
+                model_sources=model_sources,
+            )
+    models_file.write(filename=models_filename, source=source)
 
-    _helpers.define_all(model_factory=_register_model, schemas=schemas)
 
-    return _register_model
+def _init_lazy(
+    *,
+    model_factory: oa_types.ModelFactory,
+    schemas: oa_types.Schemas,
+    artifacts: oa_types.ModelsModelArtifacts,
+    remote_store: _helpers.ref.RemoteSchemaStore,
+    registry: _registry.ModelRegistry,
+) -> oa_types.ModelFactory:
+    """
+    Define each model and the models it is related to on first access.
+
+    Args:
+        model_factory: Factory that constructs a model and registers it on models.
+        schemas: The pre-processed schemas.
+        artifacts: The artifacts of the models.
+        remote_store: Used to resolve remote references when the models are defined.
+        registry: The registry the models are accessed on.
+
+    Returns:
+        A factory that defines a model and the models it is related to.
+
+    """
+    related = _schemas_module.artifacts.related.get(artifacts=artifacts)
+    defined: typing.Set[str] = set()
+    lock = threading.RLock()
+
+    def _define_related(*, name: str) -> typing.Type:
+        """Define a model and the models it is related to."""
+        with lock, _helpers.ref.use_store(store=remote_store):
+            if name in related and name not in defined:
+                names = _schemas_module.artifacts.related.closure(
+                    name=name, related=related
+                )
+                _helpers.define_all(
+                    model_factory=model_factory, schemas=schemas, names=names
+                )
+                defined.update(names)
+            return model_factory(name=name)
+
+    def _getattr(name: str) -> typing.Type:
+        """Define models that have not been defined when they are accessed."""
+        if name not in related:
+            raise AttributeError(
+                f"module {registry.__name__!r} has no attribute {name!r}"
+            )
+        return _define_related(name=name)
+
+    setattr(registry, "__getattr__", _getattr)
+
+    return _define_related
 
 
 BaseAndModelFactory = typing.Tuple[typing.Type, oa_types.ModelFactory]
@@ -109,6 +394,13 @@ def _init_optional_base(
     spec: oa_types.Schema,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    validation_level: oa_types.ValidationLevel = oa_types.ValidationLevel.FULL,
+    cache_dir: typing.Optional[str] = None,
+    lazy: bool = False,
+    profile: typing.Optional[_profiling.Profile] = None,
+    registry: typing.Optional[_registry.ModelRegistry] = None,
+    json_codec: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
 ) -> BaseAndModelFactory:
     """Wrap init_model_factory with optional base."""
     if base is None:
@@ -120,6 +412,13 @@ def _init_optional_base(
             spec=spec,
             models_filename=models_filename,
             spec_path=spec_path,
+            validation_level=validation_level,
+            cache_dir=cache_dir,
+            lazy=lazy,
+            profile=profile,
+            registry=registry,
+            json_codec=json_codec,
+            workers=workers,
         ),
     )
 
@@ -129,6 +428,13 @@ def init_json(
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    validation_level: oa_types.ValidationLevel = oa_types.ValidationLevel.FULL,
+    cache_dir: typing.Optional[str] = None,
+    lazy: bool = False,
+    profile: typing.Optional[_profiling.Profile] = None,
+    registry: typing.Optional[_registry.ModelRegistry] = None,
+    json_codec: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a JSON file.
@@ -139,6 +445,23 @@ def init_json(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        validation_level: (optional) How thoroughly dictionaries passed to from_dict
+            are validated.
+        cache_dir: (optional) The directory to cache the pre-processed schemas and
+            artifacts in. If it is not provided, nothing is cached. The directory
+            must be trusted and private since the cache is pickled.
+        lazy: (optional) Whether to define each model when it is first accessed
+            instead of defining all models up front.
+        profile: (optional) Records the wall time and number of calls of each stage,
+            including loading the specification, and model.
+        registry: (optional) The registry the base and models are made available on,
+            defaults to open_alchemy.models.
+        json_codec: (optional) The name of the JSON codec used to decode the
+            specification and by to_str and from_str of the models, defaults to
+            json.
+        workers: (optional) The number of processes the schemas are validated
+            and the models file is generated with. If it is not provided, they are
+            validated and generated in this process.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -148,18 +471,27 @@ def init_json(
             base based on the OpenAPI specification.
 
     """
-    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
-    # need it:
-    import json  # pylint: disable=import-outside-toplevel
+    codec = _facades.json_codec.get(json_codec)
 
-    with open(spec_filename) as spec_file:
-        spec = json.load(spec_file)
+    if profile is None and _profiling.enabled():
+        profile = _profiling.Profile()
+
+    with _profiling.stage(profile, "load_spec"):
+        with open(spec_filename, "rb") as spec_file:
+            spec = codec.loads(spec_file.read())
 
     return _init_optional_base(
         base=base,
         spec=spec,
         models_filename=models_filename,
         spec_path=spec_filename,
+        validation_level=validation_level,
+        cache_dir=cache_dir,
+        lazy=lazy,
+        profile=profile,
+        registry=registry,
+        json_codec=json_codec,
+        workers=workers,
     )
 
 
@@ -168,6 +500,13 @@ def init_yaml(
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    validation_level: oa_types.ValidationLevel = oa_types.ValidationLevel.FULL,
+    cache_dir: typing.Optional[str] = None,
+    lazy: bool = False,
+    profile: typing.Optional[_profiling.Profile] = None,
+    registry: typing.Optional[_registry.ModelRegistry] = None,
+    json_codec: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a YAML file.
@@ -180,6 +519,22 @@ def init_yaml(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        validation_level: (optional) How thoroughly dictionaries passed to from_dict
+            are validated.
+        cache_dir: (optional) The directory to cache the pre-processed schemas and
+            artifacts in. If it is not provided, nothing is cached. The directory
+            must be trusted and private since the cache is pickled.
+        lazy: (optional) Whether to define each model when it is first accessed
+            instead of defining all models up front.
+        profile: (optional) Records the wall time and number of calls of each stage,
+            including loading the specification, and model.
+        registry: (optional) The registry the base and models are made available on,
+            defaults to open_alchemy.models.
+        json_codec: (optional) The name of the JSON codec used by to_str and
+            from_str of the models, defaults to json.
+        workers: (optional) The number of processes the schemas are validated
+            and the models file is generated with. If it is not provided, they are
+            validated and generated in this process.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -190,24 +545,40 @@ def init_yaml(
 
     """
     try:
-        import yaml  # pylint: disable=import-outside-toplevel
+        import yaml  # pylint: disable=import-outside-toplevel,unused-import
     except ImportError as exc:
         raise ImportError(
             "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
         ) from exc
 
-    with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
+    if profile is None and _profiling.enabled():
+        profile = _profiling.Profile()
+
+    with _profiling.stage(profile, "load_spec"):
+        if cache_dir is not None:
+            spec = _cache.load_yaml(directory=cache_dir, filename=spec_filename)
+        else:
+            with open(spec_filename) as spec_file:
+                spec = _helpers.yaml_.load(spec_file)
 
     return _init_optional_base(
         base=base,
         spec=spec,
         models_filename=models_filename,
         spec_path=spec_filename,
+        validation_level=validation_level,
+        cache_dir=cache_dir,
+        lazy=lazy,
+        profile=profile,
+        registry=registry,
+        json_codec=json_codec,
+        workers=workers,
     )
 
 
-def _get_base(*, name: str, schemas: oa_types.Schemas) -> typing.Type:
+def _get_base(
+    *, name: str, schemas: oa_types.Schemas, registry: _registry.ModelRegistry
+) -> typing.Type:
     """
     Retrieve the base class of a schema considering inheritance.
 
@@ -222,6 +593,7 @@ def _get_base(*, name: str, schemas: oa_types.Schemas) -> typing.Type:
     Args:
         name: The name of the schema to determine the base for.
         schemas: All the schemas.
+        registry: The registry the parent and the usual base are retrieved from.
 
     Returns:
         The base of the model. Either the usual base or the model parent in the case of
@@ -235,13 +607,13 @@ def _get_base(*, name: str, schemas: oa_types.Schemas) -> typing.Type:
     if _helpers.schema.inherits(schema=schema, schemas=schemas):
         parent = _helpers.inheritance.retrieve_parent(schema=schema, schemas=schemas)
         try:
-            return getattr(models, parent)
+            return getattr(registry, parent)
         except AttributeError as exc:
             raise exceptions.InheritanceError(
                 "Any parents of a schema must be constructed before the schema can be "
                 "constructed."
             ) from exc
-    return getattr(models, "Base")
+    return getattr(registry, "Base")
 
 
 def build_json(
@@ -277,9 +649,10 @@ def build_json(
     with open(spec_filename) as spec_file:
         spec = json.load(spec_file)
 
-    return _build_module.execute(
-        spec=spec, name=package_name, path=dist_path, format_=format_
-    )
+    # Import as needed since packages are only built on request
+    from . import build  # pylint: disable=import-outside-toplevel
+
+    return build.execute(spec=spec, name=package_name, path=dist_path, format_=format_)
 
 
 def build_yaml(
@@ -309,18 +682,19 @@ def build_yaml(
 
     """
     try:
-        import yaml  # pylint: disable=import-outside-toplevel
+        import yaml  # pylint: disable=import-outside-toplevel,unused-import
     except ImportError as exc:
         raise ImportError(
             "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
         ) from exc
 
     with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
+        spec = _helpers.yaml_.load(spec_file)
 
-    return _build_module.execute(
-        spec=spec, name=package_name, path=dist_path, format_=format_
-    )
+    # Import as needed since packages are only built on request
+    from . import build  # pylint: disable=import-outside-toplevel
+
+    return build.execute(spec=spec, name=package_name, path=dist_path, format_=format_)
 
 
 __all__ = [
@@ -329,5 +703,10 @@ __all__ = [
     "init_yaml",
     "build_json",
     "build_yaml",
+    "load_ndjson",
+    "LoadResult",
     "PackageFormat",
+    "ModelRegistry",
+    "Profile",
+    "ValidationLevel",
 ]
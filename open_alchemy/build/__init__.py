@@ -1,16 +1,14 @@
 """Build a package with the OpenAlchemy models."""
 
 import dataclasses
-import enum
 import hashlib
 import json
 import pathlib
 import sys
 import typing
 
-import jinja2
-
 from .. import exceptions
+from .. import facades
 from .. import helpers
 from .. import models_file as models_file_module
 from .. import schemas as schemas_module
@@ -21,23 +19,12 @@ from .. import types
 # https://github.com/PyCQA/bandit/issues/211
 
 
-_DIRECTORY = pathlib.Path(__file__).parent.absolute()
-with open(_DIRECTORY / "setup.j2") as in_file:
-    _SETUP_TEMPLATE = in_file.read()
-with open(_DIRECTORY / "MANIFEST.j2") as in_file:
-    _MANIFEST_TEMPLATE = in_file.read()
-with open(_DIRECTORY / "init_init_open_alchemy.j2") as in_file:
-    _INIT_INIT_OPEN_ALCHEMY_TEMPLATE = in_file.read()
-with open(_DIRECTORY / "init.j2") as in_file:
-    _INIT_TEMPLATE = in_file.read()
-
-
-class PackageFormat(enum.Flag):
-    """Define the available package formats for the build."""
+_SETUP_TEMPLATE = "build/setup.j2"
+_MANIFEST_TEMPLATE = "build/MANIFEST.j2"
+_INIT_INIT_OPEN_ALCHEMY_TEMPLATE = "build/init_init_open_alchemy.j2"
+_INIT_TEMPLATE = "build/init.j2"
 
-    NONE = enum.auto()
-    SDIST = enum.auto()
-    WHEEL = enum.auto()
+PackageFormat = types.PackageFormat
 
 
 def validate_dist_format(format_) -> None:
@@ -221,7 +208,7 @@ def generate_setup(*, name: TName, version: TVersion) -> str:
         The contents of the setup.py file for the models package.
 
     """
-    template = jinja2.Template(_SETUP_TEMPLATE)
+    template = facades.jinja2.get_template(name=_SETUP_TEMPLATE)
 
     return template.render(
         name=name,
@@ -240,7 +227,7 @@ def generate_manifest(*, name: TName) -> str:
         The contents of the MANIFEST.in file for the models package.
 
     """
-    template = jinja2.Template(_MANIFEST_TEMPLATE)
+    template = facades.jinja2.get_template(name=_MANIFEST_TEMPLATE)
 
     return template.render(
         name=name,
@@ -255,7 +242,7 @@ def generate_init_open_alchemy() -> str:
         The OpenAlchemy initialization portion of the __init__ file.
 
     """
-    template = jinja2.Template(_INIT_INIT_OPEN_ALCHEMY_TEMPLATE)
+    template = facades.jinja2.get_template(name=_INIT_INIT_OPEN_ALCHEMY_TEMPLATE)
 
     return template.render()
 
@@ -290,7 +277,7 @@ def generate_init(open_alchemy: str, models_file: str) -> str:
         The contents of the __init__ file.
 
     """
-    template = jinja2.Template(_INIT_TEMPLATE)
+    template = facades.jinja2.get_template(name=_INIT_TEMPLATE)
 
     return template.render(
         open_alchemy=open_alchemy,
@@ -0,0 +1,264 @@
+"""
+Cache the processed schemas and artifacts of a specification on disk.
+
+The entries are pickled and unpickling runs any code in the file, so the directory
+of the cache must be trusted and private. The directory is created so that only the
+current user can access it and entries are only read from a directory that only the
+current user can write to.
+
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import stat
+import tempfile
+import typing
+
+import open_alchemy
+
+from . import helpers
+from . import types
+
+_SUFFIX = ".pickle"
+_YAML_SUFFIX = ".yaml.pickle"
+_MODEL_SOURCES_SUFFIX = ".models.pickle"
+
+
+class Entry(typing.NamedTuple):
+    """The cached results of processing the schemas of a specification."""
+
+    # The schemas after they have been pre-processed
+    schemas: types.Schemas
+    # The artifacts of the schemas staying within each model
+    artifacts: types.ModelsModelArtifacts
+    # The artifacts of the schemas not staying within each model for the models file
+    models_file_artifacts: types.ModelsModelArtifacts
+
+
+class ModelSourcesEntry(typing.NamedTuple):
+    """The cached source of each model in a models file."""
+
+    # The source of each model by the key of the model
+    model_sources: typing.Dict[str, str]
+
+
+class YamlEntry(typing.NamedTuple):
+    """The cached result of loading a YAML file."""
+
+    # The loaded document
+    document: typing.Any
+
+
+def calculate_key(
+    *,
+    spec: typing.Any,
+    remote_documents: typing.Optional[typing.Dict[str, typing.Any]] = None,
+) -> str:
+    """
+    Calculate the key of the entry for a specification.
+
+    The key is the hash of the specification, the remotely referenced files and the
+    version of OpenAlchemy, so it changes whenever any of them change.
+
+    Args:
+        spec: The specification before the schemas are pre-processed.
+        remote_documents: The contents of each remotely referenced file by its path.
+
+    Returns:
+        The key for the specification.
+
+    """
+    spec_str = json.dumps(
+        [spec, {} if remote_documents is None else remote_documents],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(f"{open_alchemy.__version__}:{spec_str}".encode()).hexdigest()
+
+
+def _calculate_path(*, directory: str, key: str) -> str:
+    """Calculate the path to the file of an entry."""
+    return os.path.join(directory, f"{key}{_SUFFIX}")
+
+
+def _is_private(*, directory: str) -> bool:
+    """Check that the directory is owned by and only writable by the current user."""
+    if not hasattr(os, "getuid"):  # pragma: no cover
+        # The owner of a directory can't be checked like this on Windows
+        return True
+    try:
+        status = os.stat(directory)
+    except OSError:
+        return False
+    return status.st_uid == os.getuid() and not status.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def _read(*, directory: str, path: str) -> typing.Any:
+    """
+    Read a pickled value, returning None if it can't be read.
+
+    The value is not read if anyone other than the current user can write to the
+    directory since unpickling a file written by someone else can run any code.
+
+    """
+    if not _is_private(directory=directory):
+        return None
+    try:
+        with open(path, "rb") as in_file:
+            return pickle.load(in_file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _write(*, directory: str, path: str, value: typing.Any) -> None:
+    """
+    Write a pickled value.
+
+    The value is written to a temporary file which then replaces any existing file so
+    that concurrent processes never read a partially written value.
+
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as out_file:
+            pickle.dump(value, out_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def load(*, directory: str, key: str) -> typing.Optional[Entry]:
+    """
+    Load an entry from the cache.
+
+    Any entry that can't be read or that is in a directory that others can write to
+    is treated as though it was not in the cache.
+
+    Args:
+        directory: The directory of the cache.
+        key: The key of the entry.
+
+    Returns:
+        The entry or None if it is not in the cache.
+
+    """
+    entry = _read(
+        directory=directory, path=_calculate_path(directory=directory, key=key)
+    )
+    if not isinstance(entry, Entry):
+        return None
+    return entry
+
+
+def store(*, directory: str, key: str, entry: Entry) -> None:
+    """
+    Store an entry in the cache.
+
+    Args:
+        directory: The directory of the cache, created if it does not exist.
+        key: The key of the entry.
+        entry: The entry to store.
+
+    """
+    _write(
+        directory=directory,
+        path=_calculate_path(directory=directory, key=key),
+        value=entry,
+    )
+
+
+def load_yaml(*, directory: str, filename: str) -> typing.Any:
+    """
+    Load a YAML file, using the document stored in the cache if available.
+
+    The document is stored in the cache for the hash of the contents of the file so
+    that it is only parsed again after the file changes. A pickled document loads much
+    faster than parsing the YAML.
+
+    Raise yaml.YAMLError if the file is not valid YAML.
+
+    Args:
+        directory: The directory of the cache, created if it does not exist.
+        filename: The name of the YAML file.
+
+    Returns:
+        The loaded document.
+
+    """
+    with open(filename, "rb") as in_file:
+        contents = in_file.read()
+    key = hashlib.sha256(
+        open_alchemy.__version__.encode() + b":" + contents
+    ).hexdigest()
+    path = os.path.join(directory, f"{key}{_YAML_SUFFIX}")
+
+    entry = _read(directory=directory, path=path)
+    if isinstance(entry, YamlEntry):
+        return entry.document
+
+    document = helpers.yaml_.load(contents)
+    _write(directory=directory, path=path, value=YamlEntry(document=document))
+    return document
+
+
+def _calculate_model_sources_path(*, directory: str, models_filename: str) -> str:
+    """Calculate the path to the model sources of a models file."""
+    filename_hash = hashlib.sha256(os.path.abspath(models_filename).encode())
+    return os.path.join(
+        directory, f"{filename_hash.hexdigest()}{_MODEL_SOURCES_SUFFIX}"
+    )
+
+
+def load_model_sources(
+    *, directory: str, models_filename: str
+) -> typing.Dict[str, str]:
+    """
+    Load the source of each model last generated for a models file.
+
+    Args:
+        directory: The directory of the cache.
+        models_filename: The name of the models file.
+
+    Returns:
+        The source of each model by its key, empty if none are in the cache.
+
+    """
+    entry = _read(
+        directory=directory,
+        path=_calculate_model_sources_path(
+            directory=directory, models_filename=models_filename
+        ),
+    )
+    if not isinstance(entry, ModelSourcesEntry):
+        return {}
+    return entry.model_sources
+
+
+def store_model_sources(
+    *, directory: str, models_filename: str, model_sources: typing.Dict[str, str]
+) -> None:
+    """
+    Store the source of each model generated for a models file.
+
+    Only the sources of the latest models file are kept.
+
+    Args:
+        directory: The directory of the cache, created if it does not exist.
+        models_filename: The name of the models file.
+        model_sources: The source of each model by its key.
+
+    """
+    _write(
+        directory=directory,
+        path=_calculate_model_sources_path(
+            directory=directory, models_filename=models_filename
+        ),
+        value=ModelSourcesEntry(model_sources=model_sources),
+    )
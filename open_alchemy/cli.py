@@ -87,6 +87,22 @@ def build_application_parser() -> argparse.Namespace:
         "specfile", type=str, help="specify the specification file"
     )
     generate_parser.add_argument("output", type=str, help="specify the output file")
+    generate_parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help=(
+            "specify a directory to cache the processed specification and the source "
+            "of each model in, so that only the models that changed are regenerated"
+        ),
+    )
+    generate_parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "specify the number of processes to validate the specification and "
+            "generate the models with, defaults to the current process"
+        ),
+    )
     generate_parser.set_defaults(func=generate)
 
     # Return the parsed arguments for a particular command.
@@ -135,4 +151,9 @@ def generate(args):
 
     # Regenerate the models.
     generator = generators.get(specfile.suffix.lower())
-    generator(args.specfile, models_filename=args.output)
+    generator(
+        args.specfile,
+        models_filename=args.output,
+        cache_dir=args.cache_dir,
+        workers=args.workers,
+    )
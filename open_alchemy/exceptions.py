@@ -74,3 +74,7 @@ class BuildError(BaseError):
 
 class CLIError(BaseError):
     """Raised when an error occurs when the CLI is used."""
+
+
+class InvalidJsonCodecError(BaseError, ValueError):
+    """Raised when the JSON codec is not known."""
@@ -2,6 +2,8 @@
 # pylint: disable=useless-import-alias
 
 from . import code_formatter as code_formatter
+from . import jinja2 as jinja2
+from . import json_codec as json_codec
 from . import jsonschema as jsonschema
 from . import models as models
 from . import sqlalchemy as sqlalchemy
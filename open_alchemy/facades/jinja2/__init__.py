@@ -0,0 +1,49 @@
+"""
+Facade for jinja2.
+
+jinja2 is imported when the first template is loaded so that importing open_alchemy
+does not import it.
+
+"""
+
+import functools
+import os
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import jinja2
+
+# The templates are looked up relative to the open_alchemy package
+_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_environment(*, trim_blocks: bool) -> "jinja2.Environment":
+    """Get the environment for the open_alchemy templates."""
+    import jinja2  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(_DIRECTORY),
+        trim_blocks=trim_blocks,
+        auto_reload=False,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_template(*, name: str, trim_blocks: bool = False) -> "jinja2.Template":
+    """
+    Get a compiled template.
+
+    Each template is only compiled once and the compiled template is shared by every
+    call, so rendering the templates for many models does not compile them again.
+
+    Args:
+        name: The path of the template relative to the open_alchemy package, for
+            example models_file/model/sqlalchemy.j2.
+        trim_blocks: Whether the first newline after a block is removed.
+
+    Returns:
+        The compiled template.
+
+    """
+    return _get_environment(trim_blocks=trim_blocks).get_template(name)
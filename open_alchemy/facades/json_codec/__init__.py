@@ -0,0 +1,144 @@
+"""
+Facade for the libraries that encode and decode JSON.
+
+The optional libraries are imported when the codec that uses them is first requested
+so that importing open_alchemy does not import them.
+
+"""
+
+import enum
+import functools
+import json
+import typing
+
+from ... import exceptions
+
+TJson = typing.Union[str, bytes, bytearray, memoryview]
+
+
+class CodecName(str, enum.Enum):
+    """The names of the JSON codecs."""
+
+    # The json module from the standard library
+    JSON = "json"
+    ORJSON = "orjson"
+    RAPIDJSON = "rapidjson"
+    UJSON = "ujson"
+    # The fastest of the libraries that are installed, falling back to json
+    AUTO = "auto"
+
+
+# The libraries that are tried by AUTO, fastest first
+_AUTO_ORDER = (CodecName.ORJSON, CodecName.RAPIDJSON, CodecName.UJSON)
+
+
+class Codec(typing.NamedTuple):
+    """Encode and decode JSON using a library."""
+
+    # The name of the codec, never AUTO
+    name: CodecName
+    # Encode a value as a JSON string
+    dumps: typing.Callable[[typing.Any], str]
+    # Decode a JSON document, raises ValueError if the document is not valid JSON
+    loads: typing.Callable[[TJson], typing.Any]
+
+
+def _to_bytes(value: TJson) -> typing.Union[str, bytes, bytearray]:
+    """Convert a memoryview to bytes since only some of the libraries accept it."""
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return value
+
+
+def _json() -> Codec:
+    """Construct the codec for the json module."""
+    return Codec(
+        name=CodecName.JSON,
+        dumps=json.dumps,
+        loads=lambda value: json.loads(_to_bytes(value)),
+    )
+
+
+def _orjson() -> Codec:
+    """Construct the codec for orjson."""
+    import orjson  # pylint: disable=import-outside-toplevel,import-error
+
+    return Codec(
+        name=CodecName.ORJSON,
+        dumps=lambda value: orjson.dumps(value).decode(),
+        loads=orjson.loads,
+    )
+
+
+def _rapidjson() -> Codec:
+    """Construct the codec for python-rapidjson."""
+    # pylint: disable=import-outside-toplevel,import-error
+    import rapidjson  # type: ignore
+
+    return Codec(
+        name=CodecName.RAPIDJSON,
+        dumps=rapidjson.dumps,
+        loads=lambda value: rapidjson.loads(_to_bytes(value)),
+    )
+
+
+def _ujson() -> Codec:
+    """Construct the codec for ujson."""
+    # pylint: disable=import-outside-toplevel,import-error
+    import ujson  # type: ignore
+
+    return Codec(
+        name=CodecName.UJSON,
+        dumps=ujson.dumps,
+        # The stubs of ujson only accept either str or bytes
+        loads=lambda value: ujson.loads(_to_bytes(value)),  # type: ignore
+    )
+
+
+_CONSTRUCTORS: typing.Dict[CodecName, typing.Callable[[], Codec]] = {
+    CodecName.JSON: _json,
+    CodecName.ORJSON: _orjson,
+    CodecName.RAPIDJSON: _rapidjson,
+    CodecName.UJSON: _ujson,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get(name: typing.Optional[str] = None) -> Codec:
+    """
+    Get a JSON codec.
+
+    The output of dumps differs between the libraries, for example in the whitespace
+    between the items and whether non-ASCII characters are escaped, so the json module
+    is used unless a codec is requested.
+
+    Raise InvalidJsonCodecError if the name is not a known codec.
+    Raise ImportError if the library of the codec is not installed.
+
+    Args:
+        name: The name of the codec, defaults to json. AUTO selects the fastest of
+            orjson, python-rapidjson and ujson that is installed and json if none of
+            them are.
+
+    Returns:
+        The codec.
+
+    """
+    if name is None:
+        return _json()
+    try:
+        codec_name = CodecName(name)
+    except ValueError as exc:
+        raise exceptions.InvalidJsonCodecError(
+            f"{name!r} is not a known JSON codec, the known codecs are "
+            f"{', '.join(codec.value for codec in CodecName)}."
+        ) from exc
+
+    if codec_name != CodecName.AUTO:
+        return _CONSTRUCTORS[codec_name]()
+    for auto_name in _AUTO_ORDER:
+        try:
+            return _CONSTRUCTORS[auto_name]()
+        except ImportError:
+            continue
+    return _json()
@@ -1,14 +1,66 @@
-"""Facade for jsonschema."""
+"""
+Facade for jsonschema.
+
+jsonschema is imported when it is first used so that importing open_alchemy does not
+import it.
+
+"""
 
 import functools
 import json
 import typing
 
-import jsonschema
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import jsonschema
+
+TValidate = typing.Callable[[typing.Any], None]
+
+# Re mapped values, retrieved from jsonschema when they are first accessed
+_REMAPPED = ("ValidationError", "validate")
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Retrieve the re mapped values from jsonschema."""
+    if name in _REMAPPED:
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import jsonschema
 
-# Re mapping values
-ValidationError = jsonschema.ValidationError
-validate = jsonschema.validate  # pylint: disable=invalid-name
+        return getattr(jsonschema, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def validator(
+    *, schema: typing.Any, resolver: typing.Optional["jsonschema.RefResolver"] = None
+) -> TValidate:
+    """
+    Create a function that validates instances against a schema.
+
+    Equivalent to calling validate with the schema except that the validator is
+    constructed and the schema is checked once instead of for every instance.
+
+    Raise SchemaError if the schema is not valid.
+
+    Args:
+        schema: The schema to validate against.
+        resolver: The resolver for any $ref in the schema.
+
+    Returns:
+        A function that raises ValidationError if an instance is not valid.
+
+    """
+    import jsonschema  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    schema_validator = validator_class(schema, resolver=resolver)
+
+    def validate_(instance: typing.Any) -> None:
+        """Validate an instance against the schema."""
+        error = jsonschema.exceptions.best_match(schema_validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    return validate_
 
 
 def _filename_to_dict(filename: str) -> typing.Dict:
@@ -30,7 +82,7 @@ def _filename_to_dict(filename: str) -> typing.Dict:
 def resolver(
     *filenames: str,
 ) -> typing.Tuple[
-    jsonschema.RefResolver, typing.Tuple[typing.Dict[str, typing.Any], ...]
+    "jsonschema.RefResolver", typing.Tuple[typing.Dict[str, typing.Any], ...]
 ]:
     """
     Create resolver for references to schemas in another file.
@@ -42,6 +94,8 @@ def resolver(
         The resolver and the underlying schemas as a dictionary.
 
     """
+    import jsonschema  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
     schema_dicts = tuple(map(_filename_to_dict, filenames))
     initial: typing.Dict[str, typing.Any] = {}
     merged_schema = functools.reduce(lambda x, y: {**x, **y}, schema_dicts, initial)
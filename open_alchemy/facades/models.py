@@ -3,62 +3,88 @@
 import typing
 
 import open_alchemy
+from open_alchemy import registry as _registry
 from open_alchemy import types
 
 from ..utility_base import TOptUtilityBase
 from ..utility_base import TUtilityBase
 
 
-def get_base() -> typing.Any:
+def _get_registry(
+    registry: typing.Optional[_registry.ModelRegistry],
+) -> _registry.ModelRegistry:
+    """Get the registry or the default registry if it is None."""
+    if registry is None:
+        return open_alchemy.models
+    return registry
+
+
+def get_base(
+    *, registry: typing.Optional[_registry.ModelRegistry] = None
+) -> typing.Any:
     """
     Get the models.Base used as the declarative base for models.
 
+    Args:
+        registry: The registry of the models, defaults to open_alchemy.models.
+
     Returns:
         The models.Base.
 
     """
-    # pylint: disable=no-member
-    return open_alchemy.models.Base  # type: ignore
+    return _get_registry(registry).Base  # type: ignore
 
 
-def get_model(*, name: str) -> TOptUtilityBase:
+def get_model(
+    *, name: str, registry: typing.Optional[_registry.ModelRegistry] = None
+) -> TOptUtilityBase:
     """
     Get a model by name from models.
 
     Args:
         name: The name of the model.
+        registry: The registry of the models, defaults to open_alchemy.models.
 
     Returns:
         The model with the name.
 
     """
-    return getattr(open_alchemy.models, name, None)
+    return getattr(_get_registry(registry), name, None)
 
 
-def get_model_schema(*, name: str) -> typing.Optional[types.Schema]:
+def get_model_schema(
+    *, name: str, registry: typing.Optional[_registry.ModelRegistry] = None
+) -> typing.Optional[types.Schema]:
     """
     Get the schema of a model by name from models.
 
     Args:
         name: The name of the model.
+        registry: The registry of the models, defaults to open_alchemy.models.
 
     Returns:
         The schema of the model with the name.
 
     """
-    model = get_model(name=name)
+    model = get_model(name=name, registry=registry)
     if model is None:
         return None
     return model._schema  # pylint: disable=protected-access
 
 
-def set_model(*, name: str, model: TUtilityBase) -> None:
+def set_model(
+    *,
+    name: str,
+    model: TUtilityBase,
+    registry: typing.Optional[_registry.ModelRegistry] = None,
+) -> None:
     """
     Set model by name on models.
 
     Args:
         model: The model to set.
         name: The name of the model.
+        registry: The registry of the models, defaults to open_alchemy.models.
 
     """
-    setattr(open_alchemy.models, name, model)
+    setattr(_get_registry(registry), name, model)
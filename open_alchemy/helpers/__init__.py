@@ -6,6 +6,7 @@ from . import command
 from . import ext_prop as ext_prop
 from . import foreign_key as foreign_key
 from . import inheritance as inheritance
+from . import memo as memo
 from . import oa_to_py_type as oa_to_py_type
 from . import peek as peek
 from . import property_ as property_
@@ -13,5 +14,6 @@ from . import ref as ref
 from . import relationship as relationship
 from . import schema as schema
 from . import type_ as type_
+from . import yaml_ as yaml_
 from .calculate_nullable import calculate_nullable as calculate_nullable
 from .define_all import define_all as define_all
@@ -1,20 +1,31 @@
 """Define all the models with x-tablename properties."""
 
+import typing
+
 from .. import types
 from . import inheritance as inheritance_helper
 from . import schema as schema_helper
 
 
-def define_all(*, model_factory: types.ModelFactory, schemas: types.Schemas) -> None:
+def define_all(
+    *,
+    model_factory: types.ModelFactory,
+    schemas: types.Schemas,
+    names: typing.Optional[typing.AbstractSet[str]] = None,
+) -> None:
     """
     Define all the models with x-tablename properties.
 
     Args:
         model_factory: Factory used to construct models.
         schemas: The schemas from which to define all.
+        names: If passed, only the models with these names (and their parents) are
+            defined.
 
     """
     for name, schema in schemas.items():
+        if names is not None and name not in names:
+            continue
         if not schema_helper.constructable(schema=schema, schemas=schemas):
             continue
         if schema_helper.inherits(schema=schema, schemas=schemas):
@@ -1,5 +1,6 @@
 """Read the value of an extension property, validate the schema and return it."""
 
+import functools
 import json
 import os
 import typing
@@ -8,12 +9,79 @@ from open_alchemy import exceptions
 from open_alchemy import facades
 from open_alchemy import types
 
+from .. import memo
+
 _DIRECTORY = os.path.dirname(__file__)
 _SCHEMAS_FILE = os.path.join(_DIRECTORY, "extension-schemas.json")
 _COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, "common-schemas.json")
-_resolver, (_SCHEMAS, _) = facades.jsonschema.resolver(  # pylint: disable=invalid-name
-    _SCHEMAS_FILE, _COMMON_SCHEMAS_FILE
-)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schemas() -> typing.Tuple[typing.Any, typing.Dict[str, typing.Any]]:
+    """Load the schemas of the extension properties and their resolver on first use."""
+    resolver, (schemas, _) = facades.jsonschema.resolver(
+        _SCHEMAS_FILE, _COMMON_SCHEMAS_FILE
+    )
+    return resolver, schemas
+
+
+@functools.lru_cache(maxsize=None)
+def _get_keys(name: str) -> typing.Tuple[str, ...]:
+    """Calculate the keys of an extension property for each of the prefixes."""
+    return tuple(name.replace("x-", prefix) for prefix in types.KeyPrefixes)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(name: str) -> facades.jsonschema.TValidate:
+    """Compile the validator for the schema of an extension property on first use."""
+    resolver, schemas = _get_schemas()
+    return facades.jsonschema.validator(schema=schemas.get(name), resolver=resolver)
+
+
+_VALIDATED = memo.ScopedMemo()
+
+
+def cache() -> typing.ContextManager[None]:
+    """
+    Memoize the values that have been validated by get within the context.
+
+    The values are keyed by their identity and retained so that the id is not re-used
+    while the context is active, which means the values must not be modified within
+    the context. The memoized values are only used by the current thread.
+
+    """
+    return _VALIDATED.scope()
+
+
+def _validate(*, name: str, value: typing.Any) -> None:
+    """
+    Validate the value of an extension property against its schema.
+
+    Raise MalformedExtensionPropertyError if the value is not valid.
+
+    Args:
+        name: The name of the extension property.
+        value: The value of the extension property.
+
+    """
+    values = _VALIDATED.entries()
+    memo_key = (name, id(value))
+    if values is not None and memo_key in values:
+        return
+
+    try:
+        _get_validator(name)(value)
+    except facades.jsonschema.ValidationError as exc:
+        _, schemas = _get_schemas()
+        raise exceptions.MalformedExtensionPropertyError(
+            f"The value of the {json.dumps(name)} extension property is not "
+            "valid. "
+            f"The expected schema is {json.dumps(schemas.get(name))}. "
+            f"The given value is {json.dumps(value)}."
+        ) from exc
+
+    if values is not None:
+        values[memo_key] = value
 
 
 def get(
@@ -45,15 +113,8 @@ def get(
 
     """
     # Check for presence of name
-    keys = [name.replace("x-", prefix) for prefix in types.KeyPrefixes]
-    key, found = next(
-        filter(
-            lambda key_value: key_value[1] is True,
-            map(lambda key: (key, key in source), keys),
-        ),
-        ("", False),
-    )
-    if not found:
+    key = next((key for key in _get_keys(name) if key in source), None)
+    if key is None:
         return default
 
     # Retrieve value
@@ -63,16 +124,7 @@ def get(
             f"The value of the {name} extension property cannot be null."
         )
 
-    schema = _SCHEMAS.get(name)
-    try:
-        facades.jsonschema.validate(instance=value, schema=schema, resolver=_resolver)
-    except facades.jsonschema.ValidationError as exc:
-        raise exceptions.MalformedExtensionPropertyError(
-            f"The value of the {json.dumps(name)} extension property is not "
-            "valid. "
-            f"The expected schema is {json.dumps(schema)}. "
-            f"The given value is {json.dumps(value)}."
-        ) from exc
+    _validate(name=name, value=value)
     if pop:
         del source[key]  # type: ignore
     return value
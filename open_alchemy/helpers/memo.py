@@ -0,0 +1,42 @@
+"""Memoize values for the duration of a context in the current thread."""
+
+import contextlib
+import threading
+import typing
+
+
+class ScopedMemo:
+    """
+    Values memoized within a context that are only used by the current thread.
+
+    Contexts may be nested, the innermost context of the current thread is used. Any
+    enclosing context is cleared on exit because the values the memoized values were
+    calculated from may have been modified within the context.
+
+    """
+
+    def __init__(self) -> None:
+        """Construct."""
+        self._local = threading.local()
+
+    def entries(self) -> typing.Optional[typing.Dict[typing.Any, typing.Any]]:
+        """
+        Get the memoized values of the innermost context of the current thread.
+
+        Returns:
+            The memoized values by their key or None if there is no active context.
+
+        """
+        return getattr(self._local, "entries", None)
+
+    @contextlib.contextmanager
+    def scope(self) -> typing.Iterator[None]:
+        """Memoize values within the context."""
+        previous = self.entries()
+        self._local.entries = {}
+        try:
+            yield
+        finally:
+            if previous is not None:
+                previous.clear()
+            self._local.entries = previous
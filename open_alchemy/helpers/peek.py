@@ -1,5 +1,7 @@
 """Assemble the final schema and return its type."""
 
+import contextlib
+import functools
 import typing
 
 from open_alchemy import exceptions
@@ -7,9 +9,41 @@ from open_alchemy import facades
 from open_alchemy import types
 
 from . import ext_prop as ext_prop_helper
+from . import memo
 from . import ref as ref_helper
 
 
+_CACHE = memo.ScopedMemo()
+
+
+class _CacheEntry(typing.NamedTuple):
+    """A memoized value of peek_key."""
+
+    # The schema and schemas the value was looked up in, retained so that their id is
+    # not re-used while the entry exists
+    schema: types.Schema
+    schemas: types.Schemas
+    # The value of the key
+    value: typing.Any
+
+
+@contextlib.contextmanager
+def cache() -> typing.Iterator[None]:
+    """
+    Memoize the values looked up by peek_key within the context.
+
+    The values of extension properties that have been validated are also memoized.
+
+    The values are keyed by the identity of the schema and schemas so the schemas must
+    not be modified within the context. The memoized values are only used by the
+    current thread. Any enclosing context is cleared on exit because the schemas may
+    have been modified within the context.
+
+    """
+    with _CACHE.scope(), ext_prop_helper.cache():
+        yield
+
+
 class PeekValue(types.Protocol):
     """Defines interface for peek functions."""
 
@@ -827,6 +861,8 @@ def peek_key(
     """
     Recursive type lookup.
 
+    The value is memoized within a cache context.
+
     Raise MalformedSchemaError of a $ref value is seen again.
 
     Args:
@@ -840,7 +876,17 @@ def peek_key(
         The key value (if found) or None.
 
     """
-    return _peek_key(schema, schemas, key, set(), skip_ref=skip_ref)
+    entries: typing.Optional[typing.Dict[typing.Any, _CacheEntry]] = _CACHE.entries()
+    if entries is None:
+        return _peek_key(schema, schemas, key, set(), skip_ref=skip_ref)
+
+    cache_key = (id(schema), id(schemas), key, skip_ref)
+    entry = entries.get(cache_key)
+    if entry is not None:
+        return entry.value
+    value = _peek_key(schema, schemas, key, set(), skip_ref=skip_ref)
+    entries[cache_key] = _CacheEntry(schema=schema, schemas=schemas, value=value)
+    return value
 
 
 def _check_schema_schemas_dict(schema: types.Schema, schemas: types.Schemas) -> None:
@@ -882,6 +928,14 @@ def _check_sub_schema_dict(sub_schema: typing.Any) -> dict:
     return sub_schema
 
 
+@functools.lru_cache(maxsize=None)
+def _prefixed_keys(key: str) -> typing.Tuple[str, ...]:
+    """Calculate the keys to look for including any prefix of extension properties."""
+    if key.startswith("x-"):
+        return tuple(key.replace("x-", prefix) for prefix in types.KeyPrefixes)
+    return (key,)
+
+
 def _peek_key(
     schema: types.Schema,
     schemas: types.Schemas,
@@ -893,14 +947,10 @@ def _peek_key(
     _check_schema_schemas_dict(schema, schemas)
 
     # Base case, look for type key
-    keys = (
-        [key.replace("x-", prefix) for prefix in types.KeyPrefixes]
-        if key.startswith("x-")
-        else [key]
-    )
-    value = next(filter(lambda value: value is not None, map(schema.get, keys)), None)
-    if value is not None:
-        return value
+    for prefixed_key in _prefixed_keys(key):
+        value = schema.get(prefixed_key)
+        if value is not None:
+            return value
 
     # Recursive case, look for $ref
     ref_value = schema.get(types.OpenApiProperties.REF)
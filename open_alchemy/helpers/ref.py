@@ -1,16 +1,25 @@
 """Used to resolve schema references."""
 
-import functools
-import json
+import concurrent.futures
+import contextlib
+import copy
+import dataclasses
 import os
 import re
+import threading
+import time
 import typing
 from urllib import error
-from urllib import request
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import types
 
+from . import yaml_
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from open_alchemy import registry as registry_module
+
 _REF_PATTER = re.compile(r"^#\/components\/schemas\/(\w+)$")
 
 
@@ -226,32 +235,71 @@ def _add_remote_context(*, context: str, ref: str) -> str:
     return f"{context_hostname}{norm_new_ref_context_path}#{ref_schema}"
 
 
-def _handle_match(match: typing.Match, *, context: str) -> str:
+def _map_remote_refs(value: typing.Any, context: str) -> typing.Any:
+    """Copy a value and add the context to the value of any $ref within it."""
+    if isinstance(value, dict):
+        return {
+            key: _add_remote_context(context=context, ref=item)
+            if key == types.OpenApiProperties.REF and isinstance(item, str)
+            else _map_remote_refs(item, context)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_map_remote_refs(item, context) for item in value]
+    return value
+
+
+def _iter_refs(value: typing.Any) -> typing.Iterator[str]:
+    """Iterate over the value of any $ref within a value."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == types.OpenApiProperties.REF and isinstance(item, str):
+                yield item
+            else:
+                yield from _iter_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_refs(item)
+
+
+def _calculate_remote_contexts(
+    *, schemas: typing.Any, context: typing.Optional[str]
+) -> typing.Set[str]:
     """
-    Map a match to the updated value.
+    Calculate the normalized contexts of the remote references within schemas.
+
+    Any reference that is not valid is skipped, it is reported when it is resolved.
 
     Args:
-        match: The match to the regular expression for the reference.
-        context: The context to use to update the reference.
+        schemas: The schemas to look for remote references in.
+        context: The context of the document the schemas are from, None for the
+            OpenAPI specification.
 
     Returns:
-        The updated reference.
+        The contexts the remote references point to.
 
     """
-    ref = match.group(1)
-    mapped_ref = _add_remote_context(context=context, ref=ref)
-    return match.group(0).replace(ref, mapped_ref)
-
-
-# Pattern used to look for any $ref after converting the schema to JSON
-_REF_VALUE_PATTERN = re.compile(r'"\$ref": "(.*?)"')
+    contexts: typing.Set[str] = set()
+    for ref in _iter_refs(schemas):
+        try:
+            if context is not None:
+                ref = _add_remote_context(context=context, ref=ref)
+            if ref.startswith("#"):
+                continue
+            ref_context, _ = _separate_context_path(ref=ref)
+        except exceptions.BaseError:
+            continue
+        contexts.add(_norm_context(context=ref_context))
+    return contexts
 
 
 def _map_remote_schema_ref(*, schema: types.Schema, context: str) -> types.Schema:
     """
     Update any $ref within the schema with the remote context.
 
-    Serialize the schema, look for $ref and update value to include context.
+    Walk the schema and update the value of any $ref to include the context. The
+    schema is copied so that the schemas loaded from the remote document are not
+    modified.
 
     Args:
         schema: The schema to update.
@@ -261,30 +309,82 @@ def _map_remote_schema_ref(*, schema: types.Schema, context: str) -> types.Schem
         The schema with any $ref mapped to include the context.
 
     """
-    # Define context for mapping
-    handle_match_context = functools.partial(_handle_match, context=context)
+    return _map_remote_refs(schema, context)
+
+
+@dataclasses.dataclass
+class RemoteFileStats:
+    """Diagnostics about the references to a remote file."""
+
+    # The number of references that were resolved using a stored schema
+    hits: int = 0
+    # The number of references that had to be retrieved from the file
+    misses: int = 0
+    # The time taken to load the file in seconds
+    load_seconds: float = 0.0
+
+
+# The maximum number of remote files that are loaded at the same time
+_PREFETCH_WORKERS = 8
 
-    str_schema = json.dumps(schema)
-    mapped_str_schema = _REF_VALUE_PATTERN.sub(handle_match_context, str_schema)
-    mapped_schema = json.loads(mapped_str_schema)
-    return mapped_schema
 
+class RemoteSchemaStore:
+    """
+    Store remote schemas in memory to speed up use.
+
+    Each initialization with the path to the OpenAPI specification uses its own store
+    so that multiple specifications can be processed at the same time. The store may
+    be used from multiple threads.
 
-class _RemoteSchemaStore:
-    """Store remote schemas in memory to speed up use."""
+    """
 
     _schemas: typing.Dict[str, types.Schemas]
+    _mapped_schemas: typing.Dict[typing.Tuple[str, str], NameSchema]
+    _refs: typing.Dict[str, typing.Tuple[str, NameSchema]]
+    _lock: threading.RLock
+    stats: typing.Dict[str, RemoteFileStats]
     spec_context: typing.Optional[str]
+    json_codec: facades.json_codec.Codec
+
+    def __init__(
+        self,
+        *,
+        spec_context: typing.Optional[str] = None,
+        json_codec: typing.Optional[facades.json_codec.Codec] = None,
+    ) -> None:
+        """
+        Construct.
 
-    def __init__(self) -> None:
-        """Construct."""
+        Args:
+            spec_context: The path to the OpenAPI specification.
+            json_codec: The codec the remote JSON files are decoded with, defaults to
+                json.
+
+        """
         self._schemas = {}
-        self.spec_context = None
+        self._mapped_schemas = {}
+        self._refs = {}
+        self._lock = threading.RLock()
+        self.stats = {}
+        self.spec_context = spec_context
+        self.json_codec = facades.json_codec.get() if json_codec is None else json_codec
 
     def reset(self):
         """Reset the state of the schema store."""
-        self._schemas = {}
-        self.spec_context = None
+        with self._lock:
+            self._schemas = {}
+            self._mapped_schemas = {}
+            self._refs = {}
+            self.stats = {}
+            self.spec_context = None
+
+    def _get_stats(self, *, context: str) -> RemoteFileStats:
+        """Retrieve the stats for a context."""
+        stats = self.stats.get(context)
+        if stats is None:
+            stats = RemoteFileStats()
+            self.stats[context] = stats
+        return stats
 
     def get_schemas(self, *, context: str) -> types.Schema:
         """
@@ -303,10 +403,40 @@ class _RemoteSchemaStore:
             The schemas.
 
         """
-        # Check whether the context is already loaded
-        if context in self._schemas:
-            return self._schemas[context]
+        with self._lock:
+            # Check whether the context is already loaded
+            if context in self._schemas:
+                return self._schemas[context]
+
+            schemas, seconds = self._load(context=context)
+            self._add(context=context, schemas=schemas, seconds=seconds)
+            return schemas
+
+    def _add(self, *, context: str, schemas: types.Schemas, seconds: float) -> None:
+        """Store the schemas loaded for a context for faster future retrieval."""
+        with self._lock:
+            self._get_stats(context=context).load_seconds += seconds
+            self._schemas[context] = schemas
+
+    def _load(self, *, context: str) -> typing.Tuple[types.Schemas, float]:
+        """
+        Load the schemas for a context.
 
+        Only reads the state of the store, so it may be called from multiple threads.
+
+        Raise MissingArgumentError if the context for the original OpenAPI specification
+            has not been set.
+        Raise SchemaNotFoundError if the context doesn't exist or is not a json nor yaml
+            file.
+
+        Args:
+            context: The path, relative to the original OpenAPI specification, for the
+                file containing the schemas.
+
+        Returns:
+            The schemas and the time taken to load them in seconds.
+
+        """
         if self.spec_context is None:
             raise exceptions.MissingArgumentError(
                 "Cannot find the file containing the remote reference, either "
@@ -324,8 +454,12 @@ class _RemoteSchemaStore:
             )
 
         # Get context manager with file
+        start = time.perf_counter()
         try:
             if _URL_REF_PATTERN.search(context) is not None:
+                # Import as needed since it is slow to import
+                from urllib import request  # pylint: disable=import-outside-toplevel
+
                 file_cm = request.urlopen(context)
             else:
                 spec_dir = os.path.dirname(self.spec_context)
@@ -341,8 +475,8 @@ class _RemoteSchemaStore:
         with file_cm as in_file:
             if extension == ".json":
                 try:
-                    schemas = json.load(in_file)
-                except json.JSONDecodeError as exc:
+                    schemas = self.json_codec.loads(in_file.read())
+                except ValueError as exc:
                     raise exceptions.SchemaNotFoundError(
                         "The remote reference file is not valid JSON. The path "
                         f"is: {context}"
@@ -352,19 +486,204 @@ class _RemoteSchemaStore:
                 import yaml  # pylint: disable=import-outside-toplevel
 
                 try:
-                    schemas = yaml.safe_load(in_file)
+                    schemas = yaml_.load(in_file)
                 except yaml.scanner.ScannerError as exc:
                     raise exceptions.SchemaNotFoundError(
                         "The remote reference file is not valid YAML. The path "
                         f"is: {context}"
                     ) from exc
 
-        # Store for faster future retrieval
-        self._schemas[context] = schemas
-        return schemas
+        return schemas, time.perf_counter() - start
+
+    def get_schema(self, *, context: str, path: str) -> NameSchema:
+        """
+        Retrieve a schema with any $ref within it mapped to include the context.
 
+        The mapped schema is stored so that it is only retrieved and mapped once for
+        each context and path.
 
-_remote_schema_store = _RemoteSchemaStore()  # pylint: disable=invalid-name
+        Raise SchemaNotFoundError if the schema is not found.
+
+        Args:
+            context: The normalized path, relative to the original OpenAPI
+                specification, for the file containing the schema.
+            path: The path to the schema within the file.
+
+        Returns:
+            The name of the schema and the mapped schema.
+
+        """
+        key = (context, path)
+        with self._lock:
+            name_schema = self._mapped_schemas.get(key)
+            if name_schema is None:
+                schemas = self.get_schemas(context=context)
+                name, schema = _retrieve_schema(schemas=schemas, path=path)
+                name_schema = (
+                    name,
+                    _map_remote_schema_ref(schema=schema, context=context),
+                )
+                self._mapped_schemas[key] = name_schema
+                self._get_stats(context=context).misses += 1
+            else:
+                self._get_stats(context=context).hits += 1
+            return name_schema
+
+    def get_ref(self, *, ref: str) -> NameSchema:
+        """
+        Retrieve the schema a remote reference points to.
+
+        The schema is stored for the reference so that the reference is only
+        separated and normalized once.
+
+        Raise MalformedSchemaError if the reference does not contain #.
+        Raise SchemaNotFoundError if the schema is not found.
+
+        Args:
+            ref: The remote reference.
+
+        Returns:
+            The name of the schema and the schema with any $ref within it mapped to
+            include the context.
+
+        """
+        with self._lock:
+            context_name_schema = self._refs.get(ref)
+            if context_name_schema is not None:
+                context, name_schema = context_name_schema
+                self._get_stats(context=context).hits += 1
+                return name_schema
+
+            context, path = _separate_context_path(ref=ref)
+            context = _norm_context(context=context)
+            name_schema = self.get_schema(context=context, path=path)
+            self._refs[ref] = (context, name_schema)
+            return name_schema
+
+    def copy_stats(self) -> typing.Dict[str, RemoteFileStats]:
+        """Copy the stats for the path of each remote file that has been referenced."""
+        with self._lock:
+            return copy.deepcopy(self.stats)
+
+    def get_documents(self, *, schemas: types.Schemas) -> typing.Dict[str, typing.Any]:
+        """
+        Get the loaded remote files referenced by the schemas.
+
+        Any remote files referenced by those files are also included. Files that have
+        not been loaded are skipped.
+
+        Args:
+            schemas: The schemas of the OpenAPI specification.
+
+        Returns:
+            The contents of each file by its normalized path.
+
+        """
+        documents: typing.Dict[str, typing.Any] = {}
+        with self._lock:
+            pending = _calculate_remote_contexts(schemas=schemas, context=None)
+            seen = set(pending)
+            while pending:
+                context = pending.pop()
+                document = self._schemas.get(context)
+                if document is None:
+                    continue
+                documents[context] = document
+                new_contexts = _calculate_remote_contexts(
+                    schemas=document, context=context
+                )
+                pending |= new_contexts - seen
+                seen |= new_contexts
+        return documents
+
+    def prefetch(self, *, schemas: types.Schemas) -> None:
+        """
+        Load the remote files referenced by the schemas concurrently.
+
+        Any remote files referenced by the loaded files are also loaded. Files that
+        can't be loaded are skipped, the error is raised when a reference to them is
+        resolved.
+
+        Args:
+            schemas: The schemas of the OpenAPI specification.
+
+        """
+        if self.spec_context is None:
+            return
+        pending = _calculate_remote_contexts(schemas=schemas, context=None)
+        with self._lock:
+            pending -= self._schemas.keys()
+        if not pending:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_PREFETCH_WORKERS
+        ) as executor:
+            futures = {
+                executor.submit(self._load, context=context): context
+                for context in pending
+            }
+            seen = set(pending)
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    context = futures.pop(future)
+                    try:
+                        context_schemas, seconds = future.result()
+                    except (exceptions.BaseError, OSError):
+                        continue
+                    self._add(context=context, schemas=context_schemas, seconds=seconds)
+
+                    new_contexts = _calculate_remote_contexts(
+                        schemas=context_schemas, context=context
+                    )
+                    with self._lock:
+                        new_contexts -= self._schemas.keys()
+                    for new_context in new_contexts - seen:
+                        seen.add(new_context)
+                        futures[
+                            executor.submit(self._load, context=new_context)
+                        ] = new_context
+
+
+# Used when no store is in use in the current thread
+_remote_schema_store = RemoteSchemaStore()  # pylint: disable=invalid-name
+# The store in use in each thread
+_SCOPE = threading.local()
+
+
+def get_store() -> RemoteSchemaStore:
+    """
+    Get the store in use in the current thread.
+
+    Returns:
+        The store passed to the innermost use_store in the current thread or the
+        default store if there is none.
+
+    """
+    store: typing.Optional[RemoteSchemaStore] = getattr(_SCOPE, "store", None)
+    if store is None:
+        return _remote_schema_store
+    return store
+
+
+@contextlib.contextmanager
+def use_store(*, store: RemoteSchemaStore) -> typing.Iterator[None]:
+    """
+    Use a store to resolve remote references in the current thread.
+
+    Args:
+        store: The store to use within the context.
+
+    """
+    previous_store = getattr(_SCOPE, "store", None)
+    _SCOPE.store = store
+    try:
+        yield
+    finally:
+        _SCOPE.store = previous_store
 
 
 def set_context(*, path: str) -> None:
@@ -375,7 +694,32 @@ def set_context(*, path: str) -> None:
         path: The path to the OpenAPI specification
 
     """
-    _remote_schema_store.spec_context = path
+    get_store().spec_context = path
+
+
+def get_context() -> typing.Optional[str]:
+    """
+    Get the context for the initial OpenAPI specification.
+
+    Returns:
+        The path to the OpenAPI specification, if it has been set.
+
+    """
+    return get_store().spec_context
+
+
+def prefetch(*, schemas: types.Schemas) -> None:
+    """
+    Load the remote files referenced by the schemas concurrently.
+
+    Remote files are otherwise loaded one at a time as the references are resolved.
+    Does nothing if the context has not been set.
+
+    Args:
+        schemas: The schemas of the OpenAPI specification.
+
+    """
+    get_store().prefetch(schemas=schemas)
 
 
 def _retrieve_schema(*, schemas: types.Schemas, path: str) -> NameSchema:
@@ -417,6 +761,8 @@ def get_remote_ref(*, ref: str) -> NameSchema:
     """
     Retrieve remote schema based on reference.
 
+    The same schema is returned every time the same schema is referenced.
+
     Args:
         ref: The reference to the remote schema.
 
@@ -424,9 +770,26 @@ def get_remote_ref(*, ref: str) -> NameSchema:
         The remote schema.
 
     """
-    context, path = _separate_context_path(ref=ref)
-    context = _norm_context(context=context)
-    schemas = _remote_schema_store.get_schemas(context=context)
-    name, schema = _retrieve_schema(schemas=schemas, path=path)
-    schema = _map_remote_schema_ref(schema=schema, context=context)
-    return name, schema
+    return get_store().get_ref(ref=ref)
+
+
+def get_remote_stats(
+    *, registry: typing.Optional["registry_module.ModelRegistry"] = None
+) -> typing.Dict[str, RemoteFileStats]:
+    """
+    Retrieve diagnostics about the references to each remote file.
+
+    Args:
+        registry: If passed, the stats of the store used by the last initialization
+            with the registry, for example open_alchemy.models after init_yaml, are
+            retrieved instead of the stats of the store in use in the current thread.
+
+    Returns:
+        A copy of the stats for the path of each remote file that has been
+        referenced.
+
+    """
+    store = get_store() if registry is None else registry.remote_store
+    if store is None:
+        return {}
+    return store.copy_stats()
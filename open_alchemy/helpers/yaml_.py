@@ -0,0 +1,27 @@
+"""Load YAML documents."""
+
+import typing
+
+
+def load(stream: typing.Union[str, bytes, typing.IO]) -> typing.Any:
+    """
+    Load a YAML document using the safe loader.
+
+    The libyaml based CSafeLoader is used if PyYAML was built with it since it is much
+    faster than the pure Python SafeLoader for large documents.
+
+    Raise ImportError if PyYAML is not installed.
+    Raise yaml.YAMLError if the document is not valid YAML.
+
+    Args:
+        stream: The YAML document.
+
+    Returns:
+        The loaded document.
+
+    """
+    # Import as needed to make yaml optional
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
@@ -0,0 +1,392 @@
+"""Load the instances of a model from a JSON file into a session in batches."""
+
+import codecs
+import itertools
+import json
+import logging
+import os
+import re
+import time
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+from . import exceptions
+from . import utility_base
+
+_LOGGER = logging.getLogger(__name__)
+
+# The number of characters or bytes read from the file at a time
+_READ_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# The end of a number, literal or escape in a string that may continue in the next
+# chunk
+_PARTIAL_TOKEN = re.compile(r"[\w+\-.]*")
+
+TSource = typing.Union[str, "os.PathLike[str]", typing.IO]
+
+
+class LoadResult(typing.NamedTuple):
+    """The outcome of loading a file."""
+
+    # The number of rows that were added to the session
+    rows: int
+    # The number of batches the rows were flushed or inserted in
+    batches: int
+    # The wall time taken to load the file in seconds
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """The number of rows that were loaded per second."""
+        if self.seconds <= 0:
+            return 0.0
+        return self.rows / self.seconds
+
+
+class _InvalidLine(typing.NamedTuple):
+    """A line of newline delimited JSON that is not valid JSON."""
+
+    line: str
+    error: ValueError
+
+
+def _read_chunks(stream: typing.IO) -> typing.Iterator[str]:
+    """Read the file in chunks, decoding binary files as UTF-8."""
+    decoder: typing.Optional[codecs.IncrementalDecoder] = None
+    while True:
+        chunk = stream.read(_READ_SIZE)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(chunk)
+        yield chunk
+    if decoder is not None:
+        yield decoder.decode(b"", final=True)
+
+
+def _iter_lines(
+    *,
+    buffer: str,
+    chunks: typing.Iterator[str],
+    loads: typing.Callable[[str], typing.Any],
+) -> typing.Iterator[typing.Any]:
+    """Decode each line of newline delimited JSON that is not blank."""
+    remainder = ""
+    for chunk in itertools.chain((buffer,), chunks):
+        lines = (remainder + chunk).split("\n")
+        remainder = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield _load_line(line=line, loads=loads)
+    if remainder.strip():
+        yield _load_line(line=remainder, loads=loads)
+
+
+def _load_line(*, line: str, loads: typing.Callable[[str], typing.Any]) -> typing.Any:
+    """Decode a line, returning it with the error if it is not valid JSON."""
+    try:
+        return loads(line)
+    except ValueError as exc:
+        return _InvalidLine(line=line, error=exc)
+
+
+def _check_end(*, buffer: str, chunks: typing.Iterator[str]) -> None:
+    """
+    Check that only whitespace follows the JSON array.
+
+    Raise MalformedModelDictionaryError if anything else follows the array.
+
+    """
+    for chunk in itertools.chain((buffer,), chunks):
+        if _WHITESPACE.fullmatch(chunk) is None:
+            raise exceptions.MalformedModelDictionaryError(
+                "Only whitespace may follow the JSON array.",
+                value=chunk.strip()[:80],
+            )
+
+
+def _is_truncated(*, buffer: str, error: json.JSONDecodeError) -> bool:
+    """
+    Check whether a JSON value could not be decoded because the buffer ends early.
+
+    The value may be truncated if the error is at the end of the buffer, in a string
+    that is not closed before the end of the buffer or in a number, literal or escape
+    that runs to the end of the buffer. Any other error can't be fixed by reading
+    more of the file.
+
+    """
+    return (
+        error.pos >= len(buffer) - 1
+        or error.msg.startswith("Unterminated string")
+        or _PARTIAL_TOKEN.fullmatch(buffer, error.pos) is not None
+    )
+
+
+def _iter_array(
+    *, buffer: str, chunks: typing.Iterator[str]
+) -> typing.Iterator[typing.Any]:
+    """
+    Decode the items of a JSON array as they are read.
+
+    The buffer starts after the opening bracket of the array. Only the items that have
+    not been decoded yet are kept in the buffer. The items are decoded using the json
+    module since it can decode a value at a position in the buffer and report where
+    the value ends, which the other JSON codecs can't.
+
+    Raise MalformedModelDictionaryError if the array is not valid JSON or anything
+    other than whitespace follows it.
+
+    """
+    decoder = json.JSONDecoder()
+    position = 0
+    first = True
+    after_item = False
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()  # type: ignore
+        if position == len(buffer):
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise exceptions.MalformedModelDictionaryError(
+                    "The JSON array is not closed."
+                )
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+
+        char = buffer[position]
+        if after_item or (first and char == "]"):
+            if char == "]":
+                _check_end(buffer=buffer[position + 1 :], chunks=chunks)
+                return
+            if char != ",":
+                raise exceptions.MalformedModelDictionaryError(
+                    "The items of the JSON array must be separated by a comma.",
+                    value=buffer[position : position + 80],
+                )
+            position += 1
+            first = after_item = False
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as exc:
+            # The item may continue in the next chunk if it is truncated
+            chunk = (
+                next(chunks, None) if _is_truncated(buffer=buffer, error=exc) else None
+            )
+            if chunk is None:
+                raise exceptions.MalformedModelDictionaryError(
+                    "An item of the JSON array is not valid JSON.",
+                    value=buffer[position : position + 80],
+                ) from exc
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        if _PARTIAL_TOKEN.fullmatch(buffer, end) is not None:
+            # Numbers and literals at the end of the buffer may be truncated
+            chunk = next(chunks, None)
+            if chunk is not None:
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+
+        yield value
+        position = end
+        after_item = True
+
+
+def _iter_values(
+    *, stream: typing.IO, loads: typing.Callable[[str], typing.Any]
+) -> typing.Iterator[typing.Any]:
+    """Decode the values in a file with a JSON array or newline delimited JSON."""
+    chunks = _read_chunks(stream)
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        if buffer.strip():
+            break
+
+    stripped = buffer.lstrip()
+    if stripped.startswith("["):
+        return _iter_array(buffer=stripped[1:], chunks=chunks)
+    return _iter_lines(buffer=buffer, chunks=chunks, loads=loads)
+
+
+def _construct(
+    *,
+    model: typing.Type[utility_base.UtilityBase],
+    values: typing.Iterable[typing.Any],
+    errors: typing.Optional[typing.List[utility_base.types.RowError]],
+) -> typing.Iterator[utility_base.UtilityBase]:
+    """Construct an instance of the model for each value as in from_dicts."""
+    for position, value in enumerate(values):
+        try:
+            if isinstance(value, _InvalidLine):
+                raise exceptions.MalformedModelDictionaryError(
+                    "The line is not valid JSON.", value=value.line
+                ) from value.error
+            if not isinstance(value, dict):
+                raise exceptions.MalformedModelDictionaryError(
+                    "Each value in the file must be an object.",
+                    value=value,
+                    value_type=type(value),
+                )
+            instance = model.from_dict(**value)
+        except exceptions.BaseError as exc:
+            if errors is None:
+                raise
+            errors.append(
+                utility_base.types.RowError(position=position, value=value, error=exc)
+            )
+            continue
+        yield instance
+
+
+def _get_column_keys(
+    model: typing.Type[utility_base.UtilityBase],
+) -> typing.List[typing.Tuple[str, str]]:
+    """
+    Get the attribute and column key of each column of a model for core inserts.
+
+    Raise FeatureNotImplementedError if the model inherits or has subclasses since the
+    rows of those models are spread over tables or need a discriminator.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    if mapper.inherits is not None or mapper.polymorphic_on is not None:
+        raise exceptions.FeatureNotImplementedError(
+            "Loading models that use inheritance using core inserts is not supported."
+        )
+    return [(prop.key, prop.columns[0].key) for prop in mapper.column_attrs]
+
+
+def _to_rows(
+    *,
+    instances: typing.Sequence[utility_base.UtilityBase],
+    column_keys: typing.List[typing.Tuple[str, str]],
+    relationship_keys: typing.Set[str],
+) -> typing.Dict[typing.Tuple[str, ...], typing.List[typing.Dict[str, typing.Any]]]:
+    """
+    Convert instances to rows grouped by the columns they set.
+
+    The columns that are not set are left out so that their defaults apply, which
+    means rows that set different columns are inserted separately.
+
+    Raise FeatureNotImplementedError if a relationship is set on an instance since it
+    would not be inserted.
+
+    """
+    groups: typing.Dict[
+        typing.Tuple[str, ...], typing.List[typing.Dict[str, typing.Any]]
+    ] = {}
+    for instance in instances:
+        values = instance.__dict__
+        if not relationship_keys.isdisjoint(values):
+            raise exceptions.FeatureNotImplementedError(
+                "Relationships are not inserted using core inserts, load the related "
+                "models separately and set the foreign keys instead. The relationships "
+                f"are: {sorted(relationship_keys.intersection(values))}."
+            )
+        row = {
+            column_key: values[attr_key]
+            for attr_key, column_key in column_keys
+            if attr_key in values
+        }
+        groups.setdefault(tuple(row), []).append(row)
+    return groups
+
+
+def load_ndjson(
+    model: typing.Type[utility_base.UtilityBase],
+    source: TSource,
+    session: orm.Session,
+    *,
+    batch_size: int = 1000,
+    core: bool = False,
+    errors: typing.Optional[typing.List[utility_base.types.RowError]] = None,
+) -> LoadResult:
+    """
+    Load the instances of a model from a JSON file into a session in batches.
+
+    The file contains newline delimited JSON with an object on each line or a JSON
+    array of objects, for example written by stream_json. It is read in chunks and
+    each object is validated and converted using from_dict of the model as it is
+    decoded, so the memory used does not grow with the size of the file. The instances
+    are added to the session and flushed batch_size at a time. The session is not
+    committed.
+
+    Each line of newline delimited JSON is decoded using the JSON codec of the model.
+    The items of a JSON array are decoded using the json module because the end of
+    each item has to be found while decoding it, which the other codecs don't support,
+    so newline delimited JSON is faster to load with a faster codec.
+
+    Raise MalformedModelDictionaryError when a value is not valid JSON, not an object or
+    does not satisfy the model schema, unless errors is passed. Raise it irrespective
+    of errors if the JSON array is not valid or anything other than whitespace follows
+    it.
+    Raise FeatureNotImplementedError if core is True and the model uses inheritance or
+    a relationship is set on an instance.
+
+    Args:
+        model: The model to load the instances of.
+        source: The path to the file or the file, in text or binary mode.
+        session: The session to load the instances into.
+        batch_size: The number of instances that are flushed or inserted at a time.
+        core: Whether to insert the columns of the instances using a core insert with
+            many parameters for each batch instead of flushing them using the unit of
+            work, which is faster but does not insert relationships or make the
+            instances available in the session.
+        errors: If passed, any error for a value is appended to it, with the position of
+            the value in the file, instead of being raised and the value is skipped.
+
+    Returns:
+        The number of rows, the number of batches and the time taken.
+
+    """
+    if not hasattr(source, "read"):
+        with open(source, "rb") as stream:  # type: ignore
+            return load_ndjson(
+                model,
+                stream,
+                session,
+                batch_size=batch_size,
+                core=core,
+                errors=errors,
+            )
+
+    column_keys: typing.List[typing.Tuple[str, str]] = []
+    relationship_keys: typing.Set[str] = set()
+    if core:
+        column_keys = _get_column_keys(model)
+        relationship_keys = set(sqlalchemy.inspect(model).relationships.keys())
+
+    start = time.perf_counter()
+    rows = 0
+    batches = 0
+    loads = model._json_codec.loads  # pylint: disable=protected-access
+    values = _iter_values(stream=typing.cast(typing.IO, source), loads=loads)
+    instances = _construct(model=model, values=values, errors=errors)
+    while True:
+        batch = list(itertools.islice(instances, batch_size))
+        if not batch:
+            break
+        if core:
+            groups = _to_rows(
+                instances=batch,
+                column_keys=column_keys,
+                relationship_keys=relationship_keys,
+            )
+            for group_rows in groups.values():
+                session.execute(model.__table__.insert(), group_rows)  # type: ignore
+        else:
+            session.add_all(batch)
+            session.flush()
+        rows += len(batch)
+        batches += 1
+        seconds = time.perf_counter() - start
+        _LOGGER.debug(
+            "loaded %d rows of %s in %.1f seconds", rows, model.__name__, seconds
+        )
+
+    return LoadResult(rows=rows, batches=batches, seconds=time.perf_counter() - start)
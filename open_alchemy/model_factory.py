@@ -4,8 +4,10 @@ import typing
 
 from . import column_factory
 from . import exceptions
+from . import facades
 from . import helpers
 from . import mixins
+from . import registry as registry_module
 from . import table_args
 from . import types
 from . import utility_base
@@ -25,6 +27,9 @@ def model_factory(
     get_base: GetBase,
     schemas: types.Schemas,
     artifacts: types.ModelsModelArtifacts,
+    validation_level: types.ValidationLevel = types.ValidationLevel.FULL,
+    registry: typing.Optional[registry_module.ModelRegistry] = None,
+    json_codec: typing.Optional[facades.json_codec.Codec] = None,
 ) -> typing.Type:
     """
     Convert OpenAPI schema to SQLAlchemy model.
@@ -34,6 +39,11 @@ def model_factory(
         get_base: Funcrtion to retrieve the base class for the model.
         schemas: The OpenAPI schemas.
         artifacts: The artifacts for the models.
+        validation_level: How thoroughly dictionaries passed to from_dict are
+            validated.
+        registry: The registry the parent model and any referenced models are
+            retrieved from, defaults to open_alchemy.models.
+        json_codec: The codec used by to_str and from_str, defaults to json.
 
     Returns:
         The model as a class.
@@ -92,6 +102,16 @@ def model_factory(
         (base, utility_base.UtilityBase, *mixin_classes),
         {
             "_schema": model_schema,
+            "_to_dict_plan": utility_base.to_dict.compile_(schema=model_schema),
+            "_from_dict_plan": utility_base.from_dict.compile_(
+                schema=model_schema,
+                validation_level=validation_level,
+                registry=registry,
+            ),
+            "_registry": registry,
+            "_json_codec": (
+                facades.json_codec.get() if json_codec is None else json_codec
+            ),
             **model_class_vars,
             "__table_args__": table_args.construct(schema=schema),
             **_get_kwargs(schema=schema),
@@ -2,8 +2,13 @@
 # pylint: disable=useless-import-alias
 
 import dataclasses
+import functools
+import hashlib
+import os
+import sys
 import typing
 
+import open_alchemy
 from open_alchemy import facades
 from open_alchemy import schemas
 from open_alchemy import types as oa_types
@@ -11,25 +16,161 @@ from open_alchemy import types as oa_types
 from . import artifacts as _artifacts
 from . import model as _model
 from . import models as _models
+from . import parallel as _parallel
 from . import types as types
 
+# The directory with the templates the models file is generated from
+_TEMPLATES_DIRECTORY = os.path.dirname(__file__)
 
-def generate(*, artifacts: schemas.artifacts.types.ModelsModelArtifacts) -> str:
+TModelSources = typing.Dict[str, str]
+
+
+class ModelTiming(typing.NamedTuple):
+    """The time taken to generate the source of a model."""
+
+    # The name of the model
+    name: str
+    # The wall time taken to generate the source in seconds
+    seconds: float
+
+
+@functools.lru_cache(maxsize=None)
+def _calculate_templates_hash() -> str:
+    """Calculate the hash of the templates the models file is generated from."""
+    templates_hash = hashlib.sha256()
+    for directory, _, filenames in sorted(os.walk(_TEMPLATES_DIRECTORY)):
+        for filename in sorted(filenames):
+            if not filename.endswith(".j2"):
+                continue
+            path = os.path.join(directory, filename)
+            templates_hash.update(
+                os.path.relpath(path, _TEMPLATES_DIRECTORY).encode() + b":"
+            )
+            with open(path, "rb") as in_file:
+                templates_hash.update(in_file.read())
+    return templates_hash.hexdigest()
+
+
+def calculate_model_key(
+    *, name: str, artifacts: schemas.artifacts.types.ModelArtifacts
+) -> str:
+    """
+    Calculate the key of the source generated for a model.
+
+    The key is the hash of the name and the artifacts of the model, the templates and
+    the version of OpenAlchemy, so it changes whenever the source of the model would
+    change.
+
+    Args:
+        name: The name of the model.
+        artifacts: The artifacts of the model.
+
+    Returns:
+        The key of the source of the model.
+
+    """
+    python_version = ".".join(map(str, sys.version_info[:2]))
+    key_str = (
+        f"{open_alchemy.__version__}:{_calculate_templates_hash()}:{python_version}:"
+        f"{name}:{artifacts!r}"
+    )
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def generate_incremental(
+    *,
+    artifacts: schemas.artifacts.types.ModelsModelArtifacts,
+    model_sources: typing.Mapping[str, str],
+    workers: typing.Optional[int] = None,
+    timings: typing.Optional[typing.List[ModelTiming]] = None,
+) -> typing.Tuple[str, TModelSources]:
+    """
+    Generate the models file reusing the sources of models that have not changed.
+
+    Args:
+        artifacts: The artifacts from the schemas.
+        model_sources: The previously generated source of models by their key.
+        workers: If passed, the models are generated using a pool with this number of
+            processes.
+        timings: If passed, the time taken to generate each model that was not reused
+            is appended to it.
+
+    Returns:
+        The models file and the source of each model in it by their key.
+
+    """
+    keys = [
+        calculate_model_key(name=name, artifacts=model_artifacts)
+        for name, model_artifacts in artifacts.items()
+    ]
+    models = [
+        (name, model_artifacts)
+        for key, (name, model_artifacts) in zip(keys, artifacts.items())
+        if key not in model_sources
+    ]
+    generated = iter(_parallel.map_models(models=models, workers=workers))
+
+    new_model_sources: TModelSources = {}
+    for key, name in zip(keys, artifacts):
+        source = model_sources.get(key)
+        if source is None:
+            model_source = next(generated)
+            source = model_source.source
+            if timings is not None:
+                timings.append(ModelTiming(name=name, seconds=model_source.seconds))
+        new_model_sources[key] = source
+
+    raw_source = _models.generate(models=list(new_model_sources.values()))
+    return facades.code_formatter.apply(source=raw_source), new_model_sources
+
+
+def generate(
+    *,
+    artifacts: schemas.artifacts.types.ModelsModelArtifacts,
+    workers: typing.Optional[int] = None,
+    timings: typing.Optional[typing.List[ModelTiming]] = None,
+) -> str:
     """
     Generate the models file from schema artifacts.
 
     Args:
         artifacts: The artifacts from the schemas.
+        workers: If passed, the models are generated using a pool with this number of
+            processes.
+        timings: If passed, the time taken to generate each model is appended to it.
 
     Returns:
         The models file.
 
     """
-    model_sources = list(
-        map(
-            lambda args: _model.generate(artifacts=args[1], name=args[0]),
-            artifacts.items(),
-        )
+    source, _ = generate_incremental(
+        artifacts=artifacts, model_sources={}, workers=workers, timings=timings
     )
-    raw_source = _models.generate(models=model_sources)
-    return facades.code_formatter.apply(source=raw_source)
+    return source
+
+
+def write(*, filename: str, source: str) -> bool:
+    """
+    Write the models file unless it already contains the source.
+
+    Leaving an unchanged file alone keeps its modification time so that tools watching
+    the file are not triggered.
+
+    Args:
+        filename: The name of the models file.
+        source: The source of the models file.
+
+    Returns:
+        Whether the file was written.
+
+    """
+    try:
+        with open(filename) as in_file:
+            if in_file.read() == source:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    with open(filename, "w") as out_file:
+        out_file.write(source)
+    return True
@@ -1,32 +1,13 @@
 """Generate source code for a model."""
 
-import os
-
-import jinja2
+from open_alchemy import facades
 
 from .. import types
 
-_DIRECTORY = os.path.dirname(__file__)
-# SQLAlchemy template
-_SQLALCHEMY_TEMPLATE_FILENAME = os.path.join(_DIRECTORY, "sqlalchemy.j2")
-with open(_SQLALCHEMY_TEMPLATE_FILENAME) as in_file:
-    _SQLALCHEMY_TEMPLATE = in_file.read()
-# TypedDict required template
-_TYPED_DICT_REQUIRED_TEMPLATE_FILENAME = os.path.join(
-    _DIRECTORY, "typed_dict_required.j2"
-)
-with open(_TYPED_DICT_REQUIRED_TEMPLATE_FILENAME) as in_file:
-    _TYPED_DICT_REQUIRED_TEMPLATE = in_file.read()
-# TypedDict not required template
-_TYPED_DICT_NOT_REQUIRED_TEMPLATE_FILENAME = os.path.join(
-    _DIRECTORY, "typed_dict_not_required.j2"
-)
-with open(_TYPED_DICT_NOT_REQUIRED_TEMPLATE_FILENAME) as in_file:
-    _TYPED_DICT_NOT_REQUIRED_TEMPLATE = in_file.read()
-# Overall template
-_TEMPLATE_FILENAME = os.path.join(_DIRECTORY, "template.j2")
-with open(_TEMPLATE_FILENAME) as in_file:
-    _TEMPLATE = in_file.read()
+_SQLALCHEMY_TEMPLATE = "models_file/model/sqlalchemy.j2"
+_TYPED_DICT_REQUIRED_TEMPLATE = "models_file/model/typed_dict_required.j2"
+_TYPED_DICT_NOT_REQUIRED_TEMPLATE = "models_file/model/typed_dict_not_required.j2"
+_TEMPLATE = "models_file/model/template.j2"
 
 
 def sqlalchemy(*, artifacts: types.SQLAlchemyModelArtifacts) -> str:
@@ -40,7 +21,7 @@ def sqlalchemy(*, artifacts: types.SQLAlchemyModelArtifacts) -> str:
         The SQLAlchemy model source code.
 
     """
-    template = jinja2.Template(_SQLALCHEMY_TEMPLATE)
+    template = facades.jinja2.get_template(name=_SQLALCHEMY_TEMPLATE)
 
     arg_init_source = arg_init(artifacts=artifacts.arg)
     arg_from_dict_source = arg_from_dict(artifacts=artifacts.arg)
@@ -63,7 +44,7 @@ def typed_dict_required(*, artifacts: types.TypedDictArtifacts) -> str:
         The TypedDict for required properties source code.
 
     """
-    template = jinja2.Template(_TYPED_DICT_REQUIRED_TEMPLATE)
+    template = facades.jinja2.get_template(name=_TYPED_DICT_REQUIRED_TEMPLATE)
     return template.render(artifacts=artifacts)
 
 
@@ -78,7 +59,7 @@ def typed_dict_not_required(*, artifacts: types.TypedDictArtifacts) -> str:
         The TypedDict for not required properties source code.
 
     """
-    template = jinja2.Template(_TYPED_DICT_NOT_REQUIRED_TEMPLATE)
+    template = facades.jinja2.get_template(name=_TYPED_DICT_NOT_REQUIRED_TEMPLATE)
     return template.render(artifacts=artifacts)
 
 
@@ -205,7 +186,7 @@ def generate(*, artifacts: types.ModelArtifacts) -> str:
     )
 
     # Construct overall source code
-    template = jinja2.Template(_TEMPLATE, trim_blocks=True)
+    template = facades.jinja2.get_template(name=_TEMPLATE, trim_blocks=True)
     return template.render(
         artifacts=artifacts,
         typed_dict_required=typed_dict_required_source,
@@ -1,15 +1,11 @@
 """Generate models files based on individual models."""
 
-import os
 import sys
 import typing
 
-import jinja2
+from open_alchemy import facades
 
-_DIRECTORY = os.path.dirname(__file__)
-_TEMPLATE_FILE = os.path.join(_DIRECTORY, "template.j2")
-with open(_TEMPLATE_FILE) as in_file:
-    _TEMPLATE = in_file.read()
+_TEMPLATE = "models_file/models/template.j2"
 
 _ALL_IMPORTS = {"datetime", "typing"}
 
@@ -32,7 +28,7 @@ def generate(*, models: typing.List[str]) -> str:
         if "datetime." in model:
             imports.add("datetime")
 
-    template = jinja2.Template(_TEMPLATE, trim_blocks=True)
+    template = facades.jinja2.get_template(name=_TEMPLATE, trim_blocks=True)
     return template.render(
         imports=sorted(list(imports)),
         models=models,
@@ -0,0 +1,71 @@
+"""Generate the source of models in parallel using a pool of processes."""
+
+import concurrent.futures
+import math
+import time
+import typing
+
+from open_alchemy import schemas
+
+from . import model as _model
+
+# The number of chunks each worker is given on average, more chunks balance the work
+# better if some models take longer to generate than others
+_CHUNKS_PER_WORKER = 4
+
+TModel = typing.Tuple[str, schemas.artifacts.types.ModelArtifacts]
+
+
+class ModelSource(typing.NamedTuple):
+    """The source generated for a model."""
+
+    # The source of the model
+    source: str
+    # The wall time taken to generate the source in seconds
+    seconds: float
+
+
+def _generate(
+    name: str, artifacts: schemas.artifacts.types.ModelArtifacts
+) -> ModelSource:
+    """Generate the source of a model and time it."""
+    start = time.perf_counter()
+    source = _model.generate(artifacts=artifacts, name=name)
+    return ModelSource(source=source, seconds=time.perf_counter() - start)
+
+
+def _generate_chunk(models: typing.List[TModel]) -> typing.List[ModelSource]:
+    """Generate the source of each model in a chunk in the worker process."""
+    return [_generate(name, artifacts) for name, artifacts in models]
+
+
+def map_models(
+    *, models: typing.Sequence[TModel], workers: typing.Optional[int]
+) -> typing.List[ModelSource]:
+    """
+    Generate the source of models, in parallel if there are multiple workers.
+
+    The models are split into contiguous chunks which are generated by a pool of
+    processes. The sources are returned in the order of the models irrespective of
+    which worker finishes first.
+
+    Args:
+        models: The name and artifacts of each model.
+        workers: The number of worker processes, the models are generated in this
+            process if it is not passed.
+
+    Returns:
+        The source of each model.
+
+    """
+    if workers is None or workers <= 1 or len(models) <= 1:
+        return [_generate(name, artifacts) for name, artifacts in models]
+
+    chunk_size = max(1, math.ceil(len(models) / (workers * _CHUNKS_PER_WORKER)))
+    chunks = [
+        list(models[start : start + chunk_size])
+        for start in range(0, len(models), chunk_size)
+    ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks_sources = executor.map(_generate_chunk, chunks)
+        return [source for chunk_sources in chunks_sources for source in chunk_sources]
@@ -0,0 +1,116 @@
+"""Record where the time goes when the models are initialized."""
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import time
+import typing
+
+from . import types
+
+# Set to a non-empty value to log the profile of every initialization
+ENV_VAR = "OPEN_ALCHEMY_PROFILE"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TTimingDict(types.TypedDict):
+    """Dictionary representation of a timing."""
+
+    seconds: float
+    calls: int
+
+
+class TProfileDict(types.TypedDict):
+    """Dictionary representation of a profile."""
+
+    seconds: float
+    stages: typing.Dict[str, TTimingDict]
+    models: typing.Dict[str, TTimingDict]
+
+
+@dataclasses.dataclass
+class Timing:
+    """The accumulated wall time and number of calls of a stage or model."""
+
+    seconds: float = 0.0
+    calls: int = 0
+
+    def to_dict(self) -> TTimingDict:
+        """Convert to dictionary."""
+        return {"seconds": self.seconds, "calls": self.calls}
+
+
+def _add(timings: typing.Dict[str, Timing], name: str, seconds: float) -> None:
+    """Add a call to the timing with a name."""
+    timing = timings.setdefault(name, Timing())
+    timing.seconds += seconds
+    timing.calls += 1
+
+
+@dataclasses.dataclass
+class Profile:
+    """
+    The wall time and number of calls of each stage and model of an initialization.
+
+    The stages are, in the order they are executed:
+    load_spec (only for init_yaml and init_json), cache, remote_prefetch,
+    schemas.validation, schemas.backref, schemas.foreign_key, schemas.association,
+    artifacts, models_file and define_all.
+
+    The time for a model includes the time taken to construct any models it depends
+    on that had not been constructed yet, such as its parents.
+
+    """
+
+    stages: typing.Dict[str, Timing] = dataclasses.field(default_factory=dict)
+    models: typing.Dict[str, Timing] = dataclasses.field(default_factory=dict)
+
+    @property
+    def seconds(self) -> float:
+        """The total time of all the stages."""
+        return sum(timing.seconds for timing in self.stages.values())
+
+    def add_stage(self, *, name: str, seconds: float) -> None:
+        """Record a call of a stage."""
+        _add(self.stages, name, seconds)
+
+    def add_model(self, *, name: str, seconds: float) -> None:
+        """Record a call of the model factory for a model."""
+        _add(self.models, name, seconds)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> typing.Iterator[None]:
+        """Record the time taken by the body of the context as a call of a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name=name, seconds=time.perf_counter() - start)
+
+    def to_dict(self) -> TProfileDict:
+        """Convert to dictionary."""
+        return {
+            "seconds": self.seconds,
+            "stages": {name: timing.to_dict() for name, timing in self.stages.items()},
+            "models": {name: timing.to_dict() for name, timing in self.models.items()},
+        }
+
+
+def enabled() -> bool:
+    """Whether the environment variable requests the profile to be logged."""
+    return bool(os.environ.get(ENV_VAR))
+
+
+def stage(profile: typing.Optional[Profile], name: str) -> typing.ContextManager[None]:
+    """Record a stage if there is a profile."""
+    if profile is None:
+        return contextlib.nullcontext()
+    return profile.stage(name)
+
+
+def log(profile: Profile) -> None:
+    """Log the profile as JSON."""
+    _LOGGER.info("startup profile: %s", json.dumps(profile.to_dict()))
@@ -0,0 +1,33 @@
+"""Registries that the constructed models are made available on."""
+
+import types
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .helpers import ref
+
+
+class ModelRegistry(types.ModuleType):
+    """
+    The declarative base and the models constructed for a specification.
+
+    The models are attributes of the registry, for example registry.Employee. The
+    default registry is open_alchemy.models, which is importable. Pass a separate
+    registry to each initialization for multiple specifications to be loaded in the
+    same process without the models with the same name replacing each other.
+
+    """
+
+    # The store remote references were resolved with by the last initialization
+    remote_store: typing.Optional["ref.RemoteSchemaStore"]
+
+    def __init__(self, name: str = "models") -> None:
+        """
+        Construct.
+
+        Args:
+            name: The name of the registry used in error messages.
+
+        """
+        super().__init__(name)
+        self.remote_store = None
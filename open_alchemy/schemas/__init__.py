@@ -1,5 +1,9 @@
 """Performs operations on the schemas to prepare them for further processing."""
 
+import time
+import typing
+
+from .. import helpers as _oa_helpers
 from .. import types as _types
 from . import artifacts
 from . import association
@@ -9,18 +13,88 @@ from . import helpers
 from . import validation
 
 
-def process(*, schemas: _types.Schemas) -> None:
+class _TStageProcess(_types.Protocol):
+    """Defines interface for the process function of a stage."""
+
+    def __call__(self, *, schemas: _types.Schemas) -> None:
+        """Call signature for the process function of a stage."""
+        ...
+
+
+class _TStageProcessParallel(_types.Protocol):
+    """Defines interface for the process function of a stage using processes."""
+
+    def __call__(self, *, schemas: _types.Schemas, workers: int) -> None:
+        """Call signature for the parallel process function of a stage."""
+        ...
+
+
+class Stage(typing.NamedTuple):
+    """A stage of pre-processing the schemas."""
+
+    # The name of the stage
+    name: str
+    # Pre-processes the schemas in place
+    process: _TStageProcess
+    # Pre-processes the schemas in place using a pool of processes, if supported
+    process_parallel: typing.Optional[_TStageProcessParallel] = None
+
+
+class StageTiming(typing.NamedTuple):
+    """The time taken by a stage of pre-processing the schemas."""
+
+    # The name of the stage
+    name: str
+    # The wall time taken by the stage in seconds
+    seconds: float
+
+
+STAGES: typing.Tuple[Stage, ...] = (
+    Stage(
+        name="validation",
+        process=validation.process,
+        process_parallel=validation.process,
+    ),
+    Stage(name="backref", process=backref.process),
+    Stage(name="foreign_key", process=foreign_key.process),
+    Stage(name="association", process=association.process),
+)
+
+
+def process(
+    *,
+    schemas: _types.Schemas,
+    timings: typing.Optional[typing.List[StageTiming]] = None,
+    workers: typing.Optional[int] = None,
+) -> None:
     """
     Pre-process schemas.
 
-    The processing actions executed are:
-    1. Calculate the back references.
+    The processing stages executed in order are:
+    1. validate the schemas,
+    2. calculate the back references,
+    3. calculate the foreign keys and
+    4. calculate the association tables.
+
+    Each stage only modifies the schemas after it has looked up everything it needs,
+    so the values looked up in the schemas are memoized for the duration of each
+    stage.
 
     Args:
         schemas: The schemas to pre-process in place.
+        timings: If passed, the time taken by each stage is appended to it.
+        workers: If passed, the stages that support it, which is the validation,
+            use a pool with this number of processes.
 
     """
-    validation.process(schemas=schemas)
-    backref.process(schemas=schemas)
-    foreign_key.process(schemas=schemas)
-    association.process(schemas=schemas)
+    for stage in STAGES:
+        start = time.perf_counter()
+        with _oa_helpers.peek.cache():
+            if workers is not None and stage.process_parallel is not None:
+                stage.process_parallel(schemas=schemas, workers=workers)
+            else:
+                stage.process(schemas=schemas)
+        if timings is not None:
+            timings.append(
+                StageTiming(name=stage.name, seconds=time.perf_counter() - start)
+            )
@@ -7,6 +7,7 @@ from .. import helpers as _helpers
 from .. import validation
 from . import model
 from . import property_
+from . import related
 from . import types
 
 
@@ -0,0 +1,95 @@
+"""Calculate the models each model depends on to be constructed and mapped."""
+
+import collections
+import typing
+
+from ... import types as oa_types
+from . import types
+
+TRelated = typing.Dict[str, typing.Set[str]]
+
+
+def _calculate_tablename_names(
+    artifacts: types.ModelsModelArtifacts,
+) -> typing.Dict[str, typing.List[str]]:
+    """Map each tablename to the models that define the table."""
+    tablename_names: typing.Dict[str, typing.List[str]] = collections.defaultdict(list)
+    for name, model_artifacts in artifacts.items():
+        if not model_artifacts.inherits:
+            tablename_names[model_artifacts.tablename].append(name)
+    return tablename_names
+
+
+def _iter_model_related(
+    model_artifacts: types.ModelArtifacts,
+    tablename_names: typing.Dict[str, typing.List[str]],
+) -> typing.Iterator[str]:
+    """Iterate over the names of the models directly related to a model."""
+    if model_artifacts.parent is not None:
+        yield model_artifacts.parent
+    for _, backref_artifacts in model_artifacts.backrefs:
+        yield backref_artifacts.child
+
+    for _, property_artifacts in model_artifacts.properties:
+        if property_artifacts.type == oa_types.PropertyType.RELATIONSHIP:
+            yield property_artifacts.parent
+            if property_artifacts.sub_type == oa_types.RelationshipType.MANY_TO_MANY:
+                yield from tablename_names.get(property_artifacts.secondary, [])
+            continue
+
+        extension = getattr(property_artifacts, "extension", None)
+        foreign_key = getattr(extension, "foreign_key", None)
+        if foreign_key is not None:
+            tablename = foreign_key.split(".")[0]
+            yield from tablename_names.get(tablename, [])
+
+
+def get(*, artifacts: types.ModelsModelArtifacts) -> TRelated:
+    """
+    Calculate the models each model is directly related to.
+
+    A model is related to its parent and children, the models with a relationship to it
+    that define back references on it, the targets of its relationships, the
+    association tables of its many-to-many relationships and the tables its foreign
+    keys point to. These all need to be constructed before the model can be mapped by
+    SQLAlchemy.
+
+    Args:
+        artifacts: The artifacts of all the models.
+
+    Returns:
+        The names of the models directly related to each model.
+
+    """
+    tablename_names = _calculate_tablename_names(artifacts)
+    related: TRelated = {name: set() for name in artifacts}
+    for name, model_artifacts in artifacts.items():
+        for related_name in _iter_model_related(model_artifacts, tablename_names):
+            if related_name != name and related_name in related:
+                related[name].add(related_name)
+        # A parent needs its children to load instances of the children
+        if model_artifacts.parent is not None and model_artifacts.parent in related:
+            related[model_artifacts.parent].add(name)
+    return related
+
+
+def closure(*, name: str, related: TRelated) -> typing.Set[str]:
+    """
+    Calculate all the models a model is directly or indirectly related to.
+
+    Args:
+        name: The name of the model.
+        related: The models directly related to each model.
+
+    Returns:
+        The names of the related models including the model.
+
+    """
+    seen = {name}
+    queue = collections.deque([name])
+    while queue:
+        for related_name in related.get(queue.popleft(), ()):
+            if related_name not in seen:
+                seen.add(related_name)
+                queue.append(related_name)
+    return seen
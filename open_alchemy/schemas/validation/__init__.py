@@ -7,6 +7,7 @@ from ... import types as _oa_types
 from .. import helpers as _helpers
 from . import association
 from . import model
+from . import parallel
 from . import property_
 from . import schemas_validation
 from . import spec_validation
@@ -58,6 +59,62 @@ def _process_model(
         )
 
 
+class _ModelOutcome(typing.NamedTuple):
+    """The outcome of validating a model and its properties."""
+
+    # The result of validating the model
+    model_result: types.Result
+    # The error raised validating the properties, None if the model is invalid
+    error: typing.Optional[_exceptions.BaseError]
+
+
+def _process_model_outcome(schemas: _oa_types.Schemas, name: str) -> _ModelOutcome:
+    """Validate a model and, if it is valid, its properties."""
+    schema = schemas[name]
+    model_result = model.check(schemas, schema)
+    if not model_result.valid:
+        return _ModelOutcome(model_result=model_result, error=None)
+    try:
+        _process_model(schemas, name, schema)
+    except _exceptions.BaseError as exc:
+        return _ModelOutcome(model_result=model_result, error=exc)
+    return _ModelOutcome(model_result=model_result, error=None)
+
+
+def _process_models_parallel(*, schemas: _oa_types.Schemas, workers: int) -> None:
+    """
+    Validate the constructable schemas using a pool of processes.
+
+    Raise the same error as validating sequentially: the first invalid model, or if
+    all models are valid, the first model with invalid properties.
+
+    Args:
+        schemas: The schemas to validate.
+        workers: The number of worker processes.
+
+    """
+    names = [name for name, _ in _helpers.iterate.constructable(schemas=schemas)]
+    outcomes = parallel.map_models(
+        schemas=schemas, names=names, check=_process_model_outcome, workers=workers
+    )
+
+    invalid_model_outcome = next(
+        filter(lambda args: not args[1].model_result.valid, zip(names, outcomes)),
+        None,
+    )
+    if invalid_model_outcome is not None:
+        name, outcome = invalid_model_outcome
+        raise _exceptions.MalformedSchemaError(
+            f"{name} :: {outcome.model_result.reason}"
+        )
+
+    error = next(
+        (outcome.error for outcome in outcomes if outcome.error is not None), None
+    )
+    if error is not None:
+        raise error
+
+
 def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
     """
     Check that at least 1 model is defined and for multiple tablename.
@@ -88,18 +145,40 @@ def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
     return types.Result(valid=True, reason=None)
 
 
-def process(*, schemas: _oa_types.Schemas) -> None:
+def process(
+    *, schemas: _oa_types.Schemas, workers: typing.Optional[int] = None
+) -> None:
     """
     Validate schemas.
 
     Args:
         schemas: The schemas to validate.
+        workers: If passed, the models are validated using a pool with this number of
+            processes.
 
     """
     schemas_result = schemas_validation.check(schemas=schemas)
     if not schemas_result.valid:
         raise _exceptions.MalformedSchemaError(schemas_result.reason)
 
+    if workers is not None:
+        _process_models_parallel(schemas=schemas, workers=workers)
+    else:
+        _process_models(schemas=schemas)
+
+    other_results_result = _other_schemas_checks(schemas=schemas)
+    if not other_results_result.valid:
+        raise _exceptions.MalformedSchemaError(other_results_result.reason)
+
+
+def _process_models(*, schemas: _oa_types.Schemas) -> None:
+    """
+    Validate the constructable schemas.
+
+    Args:
+        schemas: The schemas to validate.
+
+    """
     # Check constructable schemas model
     constructables = _helpers.iterate.constructable(schemas=schemas)
     model_results = map(
@@ -118,10 +197,6 @@ def process(*, schemas: _oa_types.Schemas) -> None:
         name, schema = constructable
         _process_model(schemas, name, schema)
 
-    other_results_result = _other_schemas_checks(schemas=schemas)
-    if not other_results_result.valid:
-        raise _exceptions.MalformedSchemaError(other_results_result.reason)
-
 
 def check_one_model(*, schemas: _oa_types.Schemas) -> types.Result:
     """
@@ -185,7 +260,14 @@ def _check_model(schemas: _oa_types.Schemas, schema: _oa_types.Schema) -> types.
     }
 
 
-def check_models(*, schemas: _oa_types.Schemas) -> types.TModels:
+def _check_model_by_name(schemas: _oa_types.Schemas, name: str) -> types.TModel:
+    """Check the model with a name."""
+    return _check_model(schemas, schemas[name])
+
+
+def check_models(
+    *, schemas: _oa_types.Schemas, workers: typing.Optional[int] = None
+) -> types.TModels:
     """
     Check the models of a schema.
 
@@ -193,11 +275,20 @@ def check_models(*, schemas: _oa_types.Schemas) -> types.TModels:
 
     Args:
         schemas: The schemas to check.
+        workers: If passed, the models are checked using a pool with this number of
+            processes.
 
     Returns:
         The result for each model.
 
     """
+    if workers is not None:
+        names = [name for name, _ in _helpers.iterate.constructable(schemas=schemas)]
+        models_results = parallel.map_models(
+            schemas=schemas, names=names, check=_check_model_by_name, workers=workers
+        )
+        return dict(zip(names, models_results))
+
     constructables = _helpers.iterate.constructable(schemas=schemas)
     constructables_result = map(
         lambda args: (args[0], _check_model(schemas, args[1])), constructables
@@ -205,12 +296,14 @@ def check_models(*, schemas: _oa_types.Schemas) -> types.TModels:
     return dict(constructables_result)
 
 
-def check(*, spec: typing.Any) -> types.TSpec:
+def check(*, spec: typing.Any, workers: typing.Optional[int] = None) -> types.TSpec:
     """
     Check a specification.
 
     Args:
         spec: The specification to check.
+        workers: If passed, the models are checked using a pool with this number of
+            processes.
 
     Returns:
         Whether the specification is valid with a reason if it is not.
@@ -236,4 +329,7 @@ def check(*, spec: typing.Any) -> types.TSpec:
         # Something else is wrong
         pass
 
-    return {"result": {"valid": True}, "models": check_models(schemas=schemas)}
+    return {
+        "result": {"valid": True},
+        "models": check_models(schemas=schemas, workers=workers),
+    }
@@ -0,0 +1,82 @@
+"""Validate models in parallel using a pool of processes."""
+
+import concurrent.futures
+import functools
+import math
+import typing
+
+from ... import helpers as _oa_helpers
+from ... import types as _oa_types
+
+# The number of chunks each worker is given on average, more chunks balance the work
+# better if some models take longer to validate than others
+_CHUNKS_PER_WORKER = 4
+
+# The schemas in each worker process, set once when the worker starts so that they are
+# not sent with every chunk
+_WORKER_SCHEMAS: typing.Optional[_oa_types.Schemas] = None
+
+TResult = typing.TypeVar("TResult")
+TCheck = typing.Callable[[_oa_types.Schemas, str], TResult]
+
+
+def _init_worker(
+    schemas: _oa_types.Schemas, spec_context: typing.Optional[str]
+) -> None:
+    """Record the schemas and the context for remote references in the worker."""
+    global _WORKER_SCHEMAS  # pylint: disable=global-statement
+    _WORKER_SCHEMAS = schemas
+    if spec_context is not None:
+        _oa_helpers.ref.set_context(path=spec_context)
+
+
+def _check_chunk(
+    check: TCheck[TResult], names: typing.List[str]
+) -> typing.List[TResult]:
+    """Check each model in a chunk in the worker process."""
+    assert _WORKER_SCHEMAS is not None
+    with _oa_helpers.peek.cache():
+        return [check(_WORKER_SCHEMAS, name) for name in names]
+
+
+def map_models(
+    *,
+    schemas: _oa_types.Schemas,
+    names: typing.Sequence[str],
+    check: TCheck[TResult],
+    workers: int,
+) -> typing.List[TResult]:
+    """
+    Check models in parallel.
+
+    The models are split into contiguous chunks which are checked by a pool of
+    processes. The results are returned in the order of the names irrespective of
+    which worker finishes first.
+
+    Args:
+        schemas: All the schemas.
+        names: The names of the models to check.
+        check: Checks a model, must be defined at the module level so that it can be
+            sent to the workers.
+        workers: The number of worker processes.
+
+    Returns:
+        The result of the check for each model.
+
+    """
+    if workers <= 1 or len(names) <= 1:
+        with _oa_helpers.peek.cache():
+            return [check(schemas, name) for name in names]
+
+    chunk_size = max(1, math.ceil(len(names) / (workers * _CHUNKS_PER_WORKER)))
+    chunks = [
+        list(names[start : start + chunk_size])
+        for start in range(0, len(names), chunk_size)
+    ]
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(schemas, _oa_helpers.ref.get_context()),
+    ) as executor:
+        chunks_results = executor.map(functools.partial(_check_chunk, check), chunks)
+        return [result for chunk_results in chunks_results for result in chunk_results]
@@ -15,10 +15,15 @@ from open_alchemy import types
 _DIRECTORY = os.path.dirname(__file__)
 _PATHS = ("..", "helpers", "ext_prop")
 _COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, *_PATHS, "common-schemas.json")
-(
-    _resolver,  # pylint: disable=invalid-name
-    (_COMMON_SCHEMAS,),
-) = facades.jsonschema.resolver(_COMMON_SCHEMAS_FILE)
+with open(_COMMON_SCHEMAS_FILE) as in_file:
+    _COMMON_SCHEMAS = json.load(in_file)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_resolver() -> typing.Any:
+    """Construct the resolver for the common schemas on first use."""
+    resolver, _ = facades.jsonschema.resolver(_COMMON_SCHEMAS_FILE)
+    return resolver
 
 
 def _spec_to_schema_name(
@@ -46,7 +51,7 @@ def _spec_to_schema_name(
     for name in schema_names:
         try:
             facades.jsonschema.validate(
-                instance=spec, schema=_COMMON_SCHEMAS[name], resolver=_resolver
+                instance=spec, schema=_COMMON_SCHEMAS[name], resolver=_get_resolver()
             )
             return name
         except facades.jsonschema.ValidationError:
@@ -73,6 +73,26 @@ class ExtensionProperties(str, enum.Enum):
     DE_REF: Literal["x-de-$ref"] = "x-de-$ref"
 
 
+@enum.unique
+class ValidationLevel(str, enum.Enum):
+    """The validation of dictionaries passed to from_dict."""
+
+    # Validate against the model schema using jsonschema
+    FULL = "full"
+    # Only check for required properties and the type of each property
+    TYPES = "types"
+    # Skip validation
+    NONE = "none"
+
+
+class PackageFormat(enum.Flag):
+    """Define the available package formats for the build."""
+
+    NONE = enum.auto()
+    SDIST = enum.auto()
+    WHEEL = enum.auto()
+
+
 class ModelFactory(Protocol):
     """Defines interface for model factory."""
 
@@ -1,15 +1,19 @@
 """Base class providing utilities for SQLAlchemy models."""
 
-import json
 import typing
 
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import orm
+
 from .. import exceptions
 from .. import facades
 from .. import helpers
+from .. import registry as oa_registry
 from .. import types as oa_types
 from . import from_dict
 from . import repr_
 from . import to_dict
+from . import types
 
 TUtilityBase = typing.TypeVar("TUtilityBase", bound="UtilityBase")
 TOptUtilityBase = typing.Optional[TUtilityBase]
@@ -23,6 +27,17 @@ class UtilityBase:
     # be recorded as a free-form object and have a x-de-$ref extension property with
     # the de-referenced name of the schema.
     _schema: typing.ClassVar[oa_types.Schema]
+    # The pre-calculated plan for converting instances of the model to a dictionary.
+    # Calculated by the model factory or on first use for the schema of the model.
+    _to_dict_plan: typing.ClassVar[to_dict.Plan]
+    # The pre-calculated plan for constructing instances of the model from a
+    # dictionary. Calculated in the same way as the plan for converting to a dictionary.
+    _from_dict_plan: typing.ClassVar[from_dict.Plan]
+    # The registry used to retrieve the parent model and the models referenced by
+    # the model. None means open_alchemy.models.
+    _registry: typing.ClassVar[typing.Optional[oa_registry.ModelRegistry]] = None
+    # The codec used by to_str and from_str.
+    _json_codec: typing.ClassVar[facades.json_codec.Codec] = facades.json_codec.get()
 
     def __init__(self, **kwargs: typing.Any) -> None:
         """Construct."""
@@ -68,9 +83,9 @@ class UtilityBase:
             )
         return properties
 
-    @staticmethod
-    def _get_parent(*, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
-        """Get the parent model of a model."""
+    @classmethod
+    def _get_parent(cls, *, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
+        """Get the parent model of a model from the registry of the model."""
         parent_name = helpers.peek.inherits(schema=schema, schemas={})
         if parent_name is None or not isinstance(parent_name, str):
             raise exceptions.MalformedSchemaError(
@@ -81,54 +96,83 @@ class UtilityBase:
                 x_inherits_type=type(parent_name),
             )
         # Try to get model
-        parent: TOptUtilityBase = facades.models.get_model(name=parent_name)
+        parent: TOptUtilityBase = facades.models.get_model(
+            name=parent_name, registry=cls._registry
+        )
         if parent is None:
             raise exceptions.SchemaNotFoundError(
-                "The parent model was not found on open_alchemy.models.",
+                "The parent model was not found in the models.",
                 schema=schema,
                 parent_model_name=parent_name,
             )
         return parent
 
+    @classmethod
+    def _get_from_dict_plan(cls) -> from_dict.Plan:
+        """
+        Get the plan for constructing instances of the model from a dictionary.
+
+        The plan is cached on the model and re-calculated, keeping the validation
+        level, if the schema changes.
+
+        Raise ModelAttributeError if _schema is not defined.
+        Raise MalformedSchemaError if the schema does not have any properties.
+
+        Returns:
+            The plan for the model.
+
+        """
+        schema = cls._get_schema()
+        plan: typing.Optional[from_dict.Plan] = cls.__dict__.get("_from_dict_plan")
+        if plan is None or plan.schema is not schema:
+            validation_level = (
+                oa_types.ValidationLevel.FULL if plan is None else plan.validation_level
+            )
+            plan = from_dict.compile_(
+                schema=schema,
+                validation_level=validation_level,
+                registry=cls._registry,
+            )
+            setattr(cls, "_from_dict_plan", plan)
+        return plan
+
     @classmethod
     def construct_from_dict_init(
         cls: typing.Type[TUtilityBase], **kwargs: typing.Any
     ) -> typing.Dict[str, typing.Any]:
         """Construct the dictionary passed to model construction."""
+        plan = cls._get_from_dict_plan()
+
         # Check dictionary
-        schema = cls._get_schema()
         try:
-            facades.jsonschema.validate(instance=kwargs, schema=schema)
+            plan.validate(kwargs)
         except facades.jsonschema.ValidationError as exc:
             raise exceptions.MalformedModelDictionaryError(
                 "The dictionary passed to from_dict is not a valid instance of the "
                 "model schema.",
-                schema=schema,
+                schema=plan.schema,
                 kwargs=kwargs,
             ) from exc
 
         # Assemble dictionary for construction
-        properties = cls.get_properties()
         model_dict: typing.Dict[str, typing.Any] = {}
         for name, value in kwargs.items():
-            # Get the specification and type of the property
-            property_schema = properties.get(name)
-            if property_schema is None:
+            # Get the conversion for the property
+            property_plan = plan.properties.get(name)
+            if property_plan is None:
                 raise exceptions.MalformedModelDictionaryError(
                     "A parameter was passed in that is not a property in the model "
                     "schema.",
                     parameter_name=name,
-                    schema=schema,
+                    schema=plan.schema,
                 )
 
             # Convert to column value
             try:
-                model_dict[name] = from_dict.convert(
-                    value=value, schema=property_schema
-                )
+                model_dict[name] = property_plan.convert(value)
             except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
+                exc.schema = plan.schema  # type: ignore
+                exc.property_schema = property_plan.schema  # type: ignore
                 exc.property_name = name  # type: ignore
                 exc.property_value = value  # type: ignore
                 raise
@@ -150,15 +194,15 @@ class UtilityBase:
             An instance of the model constructed using the dictionary.
 
         """
-        schema = cls._get_schema()
+        plan = cls._get_from_dict_plan()
         # Handle model that inherits
-        if helpers.schema.inherits(schema=schema, schemas={}):
+        if plan.inherits:
             # Retrieve parent model
-            parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
+            parent: typing.Type[UtilityBase] = cls._get_parent(schema=plan.schema)
 
             # Construct parent initialization dictionary
             # Get properties for schema
-            properties = cls.get_properties()
+            properties = plan.properties
             # Pass kwargs that don't belong to the current model to the parent
             parent_kwargs = {
                 key: value for key, value in kwargs.items() if key not in properties
@@ -179,27 +223,73 @@ class UtilityBase:
         return cls(**init_dict)
 
     @classmethod
-    def from_str(cls: typing.Type[TUtilityBase], value: str) -> TUtilityBase:
+    def from_dicts(
+        cls: typing.Type[TUtilityBase],
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        errors: typing.Optional[typing.List[types.RowError]] = None,
+    ) -> typing.Iterator[TUtilityBase]:
+        """
+        Construct model instances from dictionaries.
+
+        The instances are constructed as the returned iterator is consumed, each using
+        the same pre-calculated validator and conversions.
+
+        Raise MalformedModelDictionaryError when a value is not a dictionary or does
+        not satisfy the model schema, unless errors is passed.
+
+        Args:
+            values: The dictionaries to construct the instances with.
+            errors: If passed, any error for a dictionary is appended to it instead of
+                being raised and no instance is returned for the dictionary.
+
+        Returns:
+            An iterator with an instance of the model for each dictionary.
+
+        """
+        for position, value in enumerate(values):
+            try:
+                if not isinstance(value, dict):
+                    raise exceptions.MalformedModelDictionaryError(
+                        "Each value passed to from_dicts must be a dictionary.",
+                        value=value,
+                        value_type=type(value),
+                    )
+                instance = cls.from_dict(**value)
+            except exceptions.BaseError as exc:
+                if errors is None:
+                    raise
+                errors.append(types.RowError(position=position, value=value, error=exc))
+                continue
+            yield instance
+
+    @classmethod
+    def from_str(
+        cls: typing.Type[TUtilityBase], value: facades.json_codec.TJson
+    ) -> TUtilityBase:
         """
         Construct model instance from a JSON string.
 
-        Raise MalformedModelDictionaryError when the value is not a string or the string
-        is not valid JSON.
+        The JSON may also be passed as bytes, for example the body of a request, which
+        is decoded without first converting it to a string.
+
+        Raise MalformedModelDictionaryError when the value is not a string or bytes or
+        the value is not valid JSON.
 
         Args:
-            kwargs: The values to construct the class with.
+            value: The JSON string to construct the model with.
 
         Returns:
             An instance of the model constructed using the dictionary.
 
         """
-        if not isinstance(value, str):
+        if not isinstance(value, (str, bytes, bytearray, memoryview)):
             raise exceptions.MalformedModelDictionaryError(
                 "The value is not of type string.", value=value, value_type=type(value)
             )
         try:
-            dict_value = json.loads(value)
-        except json.JSONDecodeError as exc:
+            dict_value = cls._json_codec.loads(value)
+        except ValueError as exc:
             raise exceptions.MalformedModelDictionaryError(
                 "The string value is not valid JSON.", value=value
             ) from exc
@@ -211,33 +301,47 @@ class UtilityBase:
             )
         return cls.from_dict(**dict_value)
 
+    @classmethod
+    def _get_to_dict_plan(cls) -> to_dict.Plan:
+        """
+        Get the plan for converting instances of the model to a dictionary.
+
+        The plan is cached on the model and re-calculated if the schema changes.
+
+        Raise ModelAttributeError if _schema is not defined.
+        Raise MalformedSchemaError if the schema does not have any properties.
+
+        Returns:
+            The plan for the model.
+
+        """
+        schema = cls._get_schema()
+        plan: typing.Optional[to_dict.Plan] = cls.__dict__.get("_to_dict_plan")
+        if plan is None or plan.schema is not schema:
+            plan = to_dict.compile_(schema=schema)
+            setattr(cls, "_to_dict_plan", plan)
+        return plan
+
     @classmethod
     def instance_to_dict(cls, instance: TUtilityBase) -> typing.Dict[str, typing.Any]:
         """Convert instance of the model to a dictionary."""
-        schema = cls._get_schema()
-        properties = cls.get_properties()
+        plan = cls._get_to_dict_plan()
 
         # Collecting the values of the properties
         return_dict: typing.Dict[str, typing.Any] = {}
-        for name, property_schema in properties.items():
-            # Handle for writeOnly
-            if helpers.peek.write_only(schema=property_schema, schemas={}):
-                continue
-
+        for name, property_schema, convert, return_none in plan.properties:
             value = getattr(instance, name, None)
 
             # Handle none value
             if value is None:
-                return_none = to_dict.return_none(schema=schema, property_name=name)
-                if return_none is True:
+                if return_none:
                     return_dict[name] = None
-                # Don't consider for coverage due to coverage bug
-                continue  # pragma: no cover
+                continue
 
             try:
-                return_dict[name] = to_dict.convert(schema=property_schema, value=value)
+                return_dict[name] = convert(value)
             except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
+                exc.schema = plan.schema  # type: ignore
                 exc.property_schema = property_schema  # type: ignore
                 exc.property_name = name  # type: ignore
                 exc.property_value = value  # type: ignore
@@ -253,15 +357,122 @@ class UtilityBase:
             The dictionary representation of the model.
 
         """
-        schema = self._get_schema()
-        if helpers.schema.inherits(schema=schema, schemas={}):
+        plan = self._get_to_dict_plan()
+        if plan.inherits:
             # Retrieve parent model and convert to dict
-            parent: typing.Type[UtilityBase] = self._get_parent(schema=schema)
+            parent: typing.Type[UtilityBase] = self._get_parent(schema=plan.schema)
             parent_dict = parent.instance_to_dict(self)
             return {**parent_dict, **self.instance_to_dict(self)}
 
         return self.instance_to_dict(self)
 
+    @classmethod
+    def to_dicts(
+        cls,
+        instances: typing.Iterable[TUtilityBase],
+        *,
+        errors: typing.Optional[typing.List[types.RowError]] = None,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Convert model instances to dictionaries.
+
+        The dictionaries are calculated as the returned iterator is consumed, each using
+        the same pre-calculated conversions.
+
+        Raise InvalidModelInstanceError when a value is not an instance of the model,
+        unless errors is passed.
+
+        Args:
+            instances: The instances of the model to convert.
+            errors: If passed, any error for an instance is appended to it instead of
+                being raised and no dictionary is returned for the instance.
+
+        Returns:
+            An iterator with the dictionary representation of each instance.
+
+        """
+        for position, instance in enumerate(instances):
+            try:
+                if not isinstance(instance, cls):
+                    raise exceptions.InvalidModelInstanceError(
+                        f"Each value passed to to_dicts must be an instance of "
+                        f"{cls.__name__}.",
+                        value=instance,
+                        value_type=type(instance),
+                    )
+                instance_dict = instance.to_dict()
+            except exceptions.BaseError as exc:
+                if errors is None:
+                    raise
+                errors.append(
+                    types.RowError(position=position, value=instance, error=exc)
+                )
+                continue
+            yield instance_dict
+
+    @classmethod
+    def stream_json(
+        cls,
+        instances: typing.Iterable[TUtilityBase],
+        fp: typing.TextIO,
+        *,
+        chunk_size: int = 1000,
+        ndjson: bool = False,
+        errors: typing.Optional[typing.List[types.RowError]] = None,
+    ) -> int:
+        """
+        Write model instances to a file as JSON as they are converted.
+
+        Each instance is converted using to_dicts, encoded using the JSON codec of the
+        model and the encoded instances are written chunk_size at a time, so the memory
+        used does not grow with the number of instances. A query is consumed using
+        yield_per with chunk_size so that the rows are also fetched in chunks, unless it
+        eagerly loads a collection using a join or subquery which yield_per does not
+        support.
+
+        Raise InvalidModelInstanceError when a value is not an instance of the model,
+        unless errors is passed.
+
+        Args:
+            instances: The instances of the model to write, for example a query.
+            fp: The text file to write the JSON to.
+            chunk_size: The number of instances that are written at a time.
+            ndjson: Whether to write each instance on a separate line (newline
+                delimited JSON) instead of as the items of a JSON array.
+            errors: If passed, any error for an instance is appended to it instead of
+                being raised and the instance is not written.
+
+        Returns:
+            The number of instances that were written.
+
+        """
+        if isinstance(instances, orm.Query):
+            try:
+                instances = iter(instances.yield_per(chunk_size))
+            except sa_exc.InvalidRequestError:
+                # Collections that are eagerly loaded using a join or subquery can't
+                # be loaded using yield_per, the query is consumed as usual instead
+                pass
+
+        if not ndjson:
+            fp.write("[")
+        count = 0
+        chunk: typing.List[str] = []
+        for instance_dict in cls.to_dicts(instances, errors=errors):
+            value = cls._json_codec.dumps(instance_dict)
+            if ndjson:
+                chunk.append(f"{value}\n")
+            else:
+                chunk.append(f",{value}" if count else value)
+            count += 1
+            if len(chunk) >= chunk_size:
+                fp.write("".join(chunk))
+                chunk.clear()
+        fp.write("".join(chunk))
+        if not ndjson:
+            fp.write("]")
+        return count
+
     def to_str(self) -> str:
         """
         Convert model instance to a string.
@@ -271,7 +482,7 @@ class UtilityBase:
 
         """
         instance_dict = self.to_dict()
-        return json.dumps(instance_dict)
+        return self._json_codec.dumps(instance_dict)
 
     __str__ = to_str
 
@@ -1,14 +1,20 @@
 """Convert from a dictionary to a column value."""
 
+import functools
 import typing
 
 from ... import exceptions
+from ... import facades
 from ... import helpers
+from ... import registry as oa_registry
 from ... import types as oa_types
 from .. import types
 from . import array
 from . import object_
 from . import simple
+from . import validate as validate_
+
+TConvert = typing.Callable[[typing.Any], types.TAnyCol]
 
 
 def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyCol:
@@ -39,3 +45,120 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyCol:
     if type_ in helpers.type_.SIMPLE_TYPES:
         return simple.convert(value, schema=schema)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+
+
+def _identity(value: typing.Any) -> typing.Any:
+    """Return the value unchanged."""
+    return value
+
+
+def compile_convert(
+    *,
+    schema: oa_types.Schema,
+    registry: typing.Optional[oa_registry.ModelRegistry] = None,
+) -> TConvert:
+    """
+    Calculate the function that converts values for a schema to a column value.
+
+    If the conversion can't be calculated for the schema, the function defers to
+    convert so that the error is raised when a value is converted.
+
+    Args:
+        schema: The schema of the value.
+        registry: The registry to retrieve referenced models from, defaults to
+            open_alchemy.models.
+
+    Returns:
+        The function that converts a value.
+
+    """
+    try:
+        type_ = helpers.peek.type_(schema=schema, schemas={})
+        read_only = helpers.peek.read_only(schema=schema, schemas={})
+        if not read_only:
+            json = helpers.peek.json(schema=schema, schemas={})
+            if json:
+                return _identity
+            if type_ == "object":
+                return object_.compile_(schema=schema, registry=registry)
+            if type_ == "array":
+                return array.compile_(schema=schema, registry=registry)
+            if type_ in helpers.type_.SIMPLE_TYPES:
+                return simple.compile_(schema=schema)
+    except exceptions.BaseError:
+        pass
+    return functools.partial(_convert_positional, schema=schema)
+
+
+def _convert_positional(value: typing.Any, *, schema: oa_types.Schema) -> types.TAnyCol:
+    """Call convert with a positional value."""
+    return convert(schema=schema, value=value)
+
+
+class PropertyPlan(typing.NamedTuple):
+    """The pre-calculated information to convert a property from a dictionary."""
+
+    # The schema of the property
+    schema: oa_types.Schema
+    # Converts a value for the property
+    convert: TConvert
+
+
+class Plan(typing.NamedTuple):
+    """The pre-calculated information to construct a model from a dictionary."""
+
+    # The schema of the model the plan was calculated for
+    schema: oa_types.Schema
+    # Whether the model inherits from a parent model
+    inherits: bool
+    # How thoroughly dictionaries are validated
+    validation_level: oa_types.ValidationLevel
+    # Raises ValidationError if a dictionary is not valid for the model schema
+    validate: facades.jsonschema.TValidate
+    # The plan for each property by name
+    properties: typing.Dict[str, PropertyPlan]
+
+
+def compile_(
+    *,
+    schema: oa_types.Schema,
+    validation_level: oa_types.ValidationLevel = oa_types.ValidationLevel.FULL,
+    registry: typing.Optional[oa_registry.ModelRegistry] = None,
+) -> Plan:
+    """
+    Calculate the plan to construct instances of a model from a dictionary.
+
+    Constructs the validator for the schema and resolves the conversion for each
+    property once so that they do not have to be calculated for every dictionary.
+
+    Raise MalformedSchemaError if the schema does not have properties.
+
+    Args:
+        schema: The schema of the model.
+        validation_level: How thoroughly dictionaries are validated.
+        registry: The registry to retrieve referenced models from, defaults to
+            open_alchemy.models.
+
+    Returns:
+        The plan for the model.
+
+    """
+    properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
+    if properties is None:
+        raise exceptions.MalformedSchemaError(
+            "The model schema does not have any properties.", schema=schema
+        )
+
+    return Plan(
+        schema=schema,
+        inherits=bool(helpers.schema.inherits(schema=schema, schemas={})),
+        validation_level=validation_level,
+        validate=validate_.compile_(schema=schema, level=validation_level),
+        properties={
+            name: PropertyPlan(
+                schema=property_schema,
+                convert=compile_convert(schema=property_schema, registry=registry),
+            )
+            for name, property_schema in properties.items()
+        },
+    )
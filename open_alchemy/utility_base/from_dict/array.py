@@ -1,13 +1,16 @@
 """Convert array values to columns."""
 
-import functools
+import typing
 
 from ... import exceptions
 from ... import helpers
+from ... import registry as oa_registry
 from ... import types as oa_types
 from .. import types
 from . import object_
 
+TConvert = typing.Callable[[typing.Any], types.TOptArrayCol]
+
 
 def convert(
     value: types.TOptArrayDict, *, schema: oa_types.Schema
@@ -26,6 +29,29 @@ def convert(
     Returns:
         The converted value.
 
+    """
+    return compile_(schema=schema)(value)
+
+
+def compile_(
+    *,
+    schema: oa_types.Schema,
+    registry: typing.Optional[oa_registry.ModelRegistry] = None,
+) -> TConvert:
+    """
+    Calculate the function that converts array values from a dictionary to a column.
+
+    Raises MalformedSchemaError if the items schema is missing from the schema.
+    Raises MalformedSchemaError if the items type is not object.
+
+    Args:
+        schema: The schema of the value.
+        registry: The registry to retrieve the models of the items from, defaults to
+            open_alchemy.models.
+
+    Returns:
+        The function that converts a value.
+
     """
     # Check the schema
     items_schema = helpers.peek.items(schema=schema, schemas={})
@@ -40,13 +66,18 @@ def convert(
         raise exceptions.MalformedSchemaError(
             "The type of the array items must be object."
         )
+    item_conversion = object_.compile_(schema=items_schema, registry=registry)
+
+    def convert_items(value: types.TOptArrayDict) -> types.TOptArrayCol:
+        """Convert each item of the array."""
+        if value is None:
+            return None
+        try:
+            converted_items = map(item_conversion, value)
+        except TypeError as exc:
+            raise exceptions.InvalidInstanceError(
+                "Array values must be iterable."
+            ) from exc
+        return list(converted_items)
 
-    if value is None:
-        return None
-    # Convert values
-    item_conversion = functools.partial(object_.convert, schema=items_schema)
-    try:
-        converted_items = map(item_conversion, value)
-    except TypeError as exc:
-        raise exceptions.InvalidInstanceError("Array values must be iterable.") from exc
-    return list(converted_items)
+    return convert_items
@@ -1,11 +1,16 @@
 """Convert object dictionary to column value."""
 
+import typing
+
 from ... import exceptions
 from ... import facades
 from ... import helpers
+from ... import registry as oa_registry
 from ... import types as oa_types
 from .. import types
 
+TConvert = typing.Callable[[typing.Any], types.TOptObjectCol]
+
 
 def convert(
     value: types.TObjectDict, *, schema: oa_types.Schema
@@ -22,6 +27,28 @@ def convert(
     Returns:
         The converted value.
 
+    """
+    return compile_(schema=schema)(value)
+
+
+def compile_(
+    *,
+    schema: oa_types.Schema,
+    registry: typing.Optional[oa_registry.ModelRegistry] = None,
+) -> TConvert:
+    """
+    Calculate the function that converts dictionary values to model instances.
+
+    Raises MalformedSchemaError if the schema does not have x-de-$ref.
+
+    Args:
+        schema: The schema for the value.
+        registry: The registry to retrieve the referenced model from, defaults to
+            open_alchemy.models.
+
+    Returns:
+        The function that converts a value to a model instance.
+
     """
     ref_model_name = helpers.ext_prop.get(
         source=schema, name=oa_types.ExtensionProperties.DE_REF
@@ -32,13 +59,18 @@ def convert(
             "include the x-de-$ref extension property with the name of the "
             "model to construct for the property."
         )
-    if not isinstance(value, dict):
-        raise exceptions.InvalidInstanceError(
-            "The value for an object parameter must be a dictionary."
-        )
-    ref_model = facades.models.get_model(name=ref_model_name)
-    if ref_model is None:
-        raise exceptions.SchemaNotFoundError(
-            f"The referenced model {ref_model} was not found in the models."
-        )
-    return ref_model.from_dict(**value)
+
+    def convert_(value: types.TObjectDict) -> types.TOptObjectCol:
+        """Construct the referenced model from the value."""
+        if not isinstance(value, dict):
+            raise exceptions.InvalidInstanceError(
+                "The value for an object parameter must be a dictionary."
+            )
+        ref_model = facades.models.get_model(name=ref_model_name, registry=registry)
+        if ref_model is None:
+            raise exceptions.SchemaNotFoundError(
+                f"The referenced model {ref_model} was not found in the models."
+            )
+        return ref_model.from_dict(**value)
+
+    return convert_
@@ -1,12 +1,15 @@
 """Convert simple type from dictionary to the column equivalent."""
 
 import datetime
+import typing
 
 from ... import exceptions
 from ... import helpers
 from ... import types as oa_types
 from .. import types
 
+TConvert = typing.Callable[[typing.Any], types.TOptSimpleCol]
+
 
 def convert(
     value: types.TOptSimpleDict, *, schema: oa_types.Schema
@@ -24,58 +27,126 @@ def convert(
         The value converted for a column.
 
     """
-    type_ = helpers.peek.type_(schema=schema, schemas={})
+    helpers.peek.type_(schema=schema, schemas={})
     if value is None:
         return None
 
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: oa_types.Schema) -> TConvert:
+    """
+    Calculate the function that converts simple values from a dictionary for a schema.
+
+    Raises TypeMissingError if the schema does not have a type.
+    Raises FeatureNotImplementedError if the type is not supported.
+
+    Args:
+        schema: The schema for the value.
+
+    Returns:
+        The function that converts a value for a column.
+
+    """
+    type_ = helpers.peek.type_(schema=schema, schemas={})
+
     if type_ == "integer":
-        if not isinstance(value, int):
-            raise exceptions.InvalidInstanceError(
-                "Integer type columns must have int values."
-            )
-        return value
+        return _convert_integer
     if type_ == "number":
-        if not isinstance(value, float):
-            raise exceptions.InvalidInstanceError(
-                "Number type columns must have float values."
-            )
-        return value
+        return _convert_number
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        format_ = helpers.peek.format_(schema=schema, schemas={})
+        return _STRING_FORMAT_CONVERTERS.get(format_, _convert_string)
     if type_ == "boolean":
-        if not isinstance(value, bool):
-            raise exceptions.InvalidInstanceError(
-                "Boolean type columns must have bool values."
-            )
-        return value
+        return _convert_boolean
 
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
-def _handle_string(
-    value: types.TSimpleDict, *, schema: oa_types.Schema
-) -> types.TStringCol:
-    """
-    Convert string type value to column type.
+def _optional(
+    convert_value: typing.Callable[[typing.Any], types.TSimpleCol]
+) -> TConvert:
+    """Wrap a conversion function so that None is returned for None values."""
 
-    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+    def convert_optional(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+        """Return None for None and convert any other value."""
+        if value is None:
+            return None
+        return convert_value(value)
 
-    Args:
-        value: The value to convert.
+    return convert_optional
 
-    Returns:
-        The converted value.
+
+@_optional
+def _convert_integer(value: types.TSimpleDict) -> int:
+    """Convert integer value for a column."""
+    if not isinstance(value, int):
+        raise exceptions.InvalidInstanceError(
+            "Integer type columns must have int values."
+        )
+    return value
+
+
+@_optional
+def _convert_number(value: types.TSimpleDict) -> float:
+    """Convert number value for a column."""
+    if not isinstance(value, float):
+        raise exceptions.InvalidInstanceError(
+            "Number type columns must have float values."
+        )
+    return value
+
+
+@_optional
+def _convert_boolean(value: types.TSimpleDict) -> bool:
+    """Convert boolean value for a column."""
+    if not isinstance(value, bool):
+        raise exceptions.InvalidInstanceError(
+            "Boolean type columns must have bool values."
+        )
+    return value
+
+
+def _check_string(value: types.TSimpleDict) -> str:
+    """
+    Check that a string type value is a str.
+
+    Raises InvalidInstanceError if the value is not a str.
 
     """
     if not isinstance(value, str):
         raise exceptions.InvalidInstanceError(
             "String type columns must have str values."
         )
-    format_ = helpers.peek.format_(schema=schema, schemas={})
-    if format_ == "date":
-        return datetime.date.fromisoformat(value)
-    if format_ == "date-time":
-        return datetime.datetime.fromisoformat(value)
-    if format_ == "binary":
-        return value.encode()
     return value
+
+
+@_optional
+def _convert_string(value: types.TSimpleDict) -> str:
+    """Convert string value without a format for a column."""
+    return _check_string(value)
+
+
+@_optional
+def _convert_date(value: types.TSimpleDict) -> datetime.date:
+    """Convert string value with date format for a column."""
+    return datetime.date.fromisoformat(_check_string(value))
+
+
+@_optional
+def _convert_date_time(value: types.TSimpleDict) -> datetime.datetime:
+    """Convert string value with date-time format for a column."""
+    return datetime.datetime.fromisoformat(_check_string(value))
+
+
+@_optional
+def _convert_binary(value: types.TSimpleDict) -> bytes:
+    """Convert string value with binary format for a column."""
+    return _check_string(value).encode()
+
+
+_STRING_FORMAT_CONVERTERS: typing.Dict[typing.Optional[str], TConvert] = {
+    "date": _convert_date,
+    "date-time": _convert_date_time,
+    "binary": _convert_binary,
+}
@@ -0,0 +1,149 @@
+"""Calculate the validation of dictionaries passed to from_dict."""
+
+import typing
+
+from ... import exceptions
+from ... import facades
+from ... import helpers
+from ... import types as oa_types
+
+# The Python types of each type as jsonschema checks them, int is a number for
+# jsonschema and is rejected by the converter for both validation levels
+_PY_TYPES: typing.Dict[str, typing.Tuple[typing.Type, ...]] = {
+    "integer": (int,),
+    "number": (int, float),
+    "string": (str,),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list,),
+}
+
+
+class _PropertyTypes(typing.NamedTuple):
+    """The allowed Python types for the value of a property."""
+
+    # The name of the type in the schema
+    type_: str
+    # The Python types of the values
+    py_types: typing.Tuple[typing.Type, ...]
+
+
+def _calculate_property_types(
+    schema: oa_types.Schema,
+) -> typing.Optional[_PropertyTypes]:
+    """Calculate the allowed types of a property or None if it can't be checked."""
+    try:
+        type_ = helpers.peek.type_(schema=schema, schemas={})
+    except exceptions.BaseError:
+        return None
+    py_types = _PY_TYPES.get(type_)
+    if py_types is None:
+        return None
+    return _PropertyTypes(type_=type_, py_types=py_types)
+
+
+def _check_value(name: str, value: typing.Any, property_types: _PropertyTypes) -> None:
+    """Raise ValidationError if the value is not of the allowed types."""
+    if isinstance(value, property_types.py_types) and (
+        not isinstance(value, bool) or bool in property_types.py_types
+    ):
+        return
+    raise facades.jsonschema.ValidationError(
+        f"The value of {name} is not of type {property_types.type_}."
+    )
+
+
+def types_(*, schema: oa_types.Schema) -> facades.jsonschema.TValidate:
+    """
+    Calculate the function that checks the required properties and types.
+
+    Much faster than validating against the schema using jsonschema because it only
+    checks that the required properties are present and that the value of each
+    property has the type of the property. The types are checked as jsonschema checks
+    them so that a dictionary with the wrong types is rejected in the same way as for
+    full validation, for example None is rejected because jsonschema does not know
+    the OpenAPI nullable keyword.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        A function that raises ValidationError if a dictionary is not valid.
+
+    """
+    required = tuple(schema.get(oa_types.OpenApiProperties.REQUIRED, []))
+    properties = schema.get(oa_types.OpenApiProperties.PROPERTIES, {})
+    properties_types = {
+        name: property_types
+        for name, property_types in (
+            (name, _calculate_property_types(property_schema))
+            for name, property_schema in properties.items()
+        )
+        if property_types is not None
+    }
+
+    def validate_(instance: typing.Dict[str, typing.Any]) -> None:
+        """Check the required properties and types of a dictionary."""
+        for name in required:
+            if name not in instance:
+                raise facades.jsonschema.ValidationError(
+                    f"{name} is a required property."
+                )
+        for name, value in instance.items():
+            property_types = properties_types.get(name)
+            if property_types is not None:
+                _check_value(name, value, property_types)
+
+    return validate_
+
+
+def _skip(_: typing.Any) -> None:
+    """Skip validation."""
+
+
+def full(*, schema: oa_types.Schema) -> facades.jsonschema.TValidate:
+    """
+    Calculate the function that validates dictionaries against the schema.
+
+    The jsonschema validator is only constructed when the first dictionary is
+    validated so that models can be constructed, for example from the cache, without
+    importing jsonschema.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        A function that raises ValidationError if a dictionary is not valid.
+
+    """
+    schema_validate: typing.Optional[facades.jsonschema.TValidate] = None
+
+    def validate_(instance: typing.Dict[str, typing.Any]) -> None:
+        """Validate a dictionary against the schema."""
+        nonlocal schema_validate
+        if schema_validate is None:
+            schema_validate = facades.jsonschema.validator(schema=schema)
+        schema_validate(instance)
+
+    return validate_
+
+
+def compile_(
+    *, schema: oa_types.Schema, level: oa_types.ValidationLevel
+) -> facades.jsonschema.TValidate:
+    """
+    Calculate the function that validates dictionaries for a validation level.
+
+    Args:
+        schema: The schema of the model.
+        level: How thoroughly dictionaries are validated.
+
+    Returns:
+        A function that raises ValidationError if a dictionary is not valid.
+
+    """
+    if level == oa_types.ValidationLevel.NONE:
+        return _skip
+    if level == oa_types.ValidationLevel.TYPES:
+        return types_(schema=schema)
+    return full(schema=schema)
@@ -1,5 +1,6 @@
 """Functions to convert to dictionary."""
 
+import functools
 import typing
 
 from ... import exceptions
@@ -10,6 +11,8 @@ from . import array
 from . import object_
 from . import simple
 
+TConvert = typing.Callable[[typing.Any], types.TAnyDict]
+
 
 def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
     """
@@ -36,6 +39,115 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
+def _identity(value: typing.Any) -> typing.Any:
+    """Return the value unchanged."""
+    return value
+
+
+def compile_convert(*, schema: oa_types.Schema) -> TConvert:
+    """
+    Calculate the function that converts values for a schema to a dictionary.
+
+    The returned function assumes that the value is not None. If the conversion can't
+    be calculated for the schema, the function defers to convert so that the error is
+    raised when a value is converted.
+
+    Args:
+        schema: The schema of the value.
+
+    Returns:
+        The function that converts a value.
+
+    """
+    try:
+        json = helpers.peek.json(schema=schema, schemas={})
+        if json:
+            return _identity
+        type_ = helpers.peek.type_(schema=schema, schemas={})
+        if type_ == "object":
+            return object_.compile_(schema=schema)
+        if type_ == "array":
+            return array.compile_(schema=schema)
+        if type_ in helpers.type_.SIMPLE_TYPES:
+            return simple.compile_(schema=schema)
+    except exceptions.BaseError:
+        pass
+    return functools.partial(_convert_positional, schema=schema)
+
+
+def _convert_positional(
+    value: typing.Any, *, schema: oa_types.Schema
+) -> types.TAnyDict:
+    """Call convert with a positional value."""
+    return convert(schema=schema, value=value)
+
+
+class PropertyPlan(typing.NamedTuple):
+    """The pre-calculated information to convert a property to a dictionary."""
+
+    # The name of the property
+    name: str
+    # The schema of the property
+    schema: oa_types.Schema
+    # Converts a value that is not None for the property
+    convert: TConvert
+    # Whether a None value is included in the dictionary
+    return_none: bool
+
+
+class Plan(typing.NamedTuple):
+    """The pre-calculated information to convert a model instance to a dictionary."""
+
+    # The schema of the model the plan was calculated for
+    schema: oa_types.Schema
+    # Whether the model inherits from a parent model
+    inherits: bool
+    # The plan for each property that is not writeOnly
+    properties: typing.Tuple[PropertyPlan, ...]
+
+
+def compile_(*, schema: oa_types.Schema) -> Plan:
+    """
+    Calculate the plan to convert instances of a model to a dictionary.
+
+    Resolves writeOnly, required and nullable for each property once so that they do
+    not have to be looked up for every instance that is converted.
+
+    Raise MalformedSchemaError if the schema does not have properties.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        The plan for the model.
+
+    """
+    properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
+    if properties is None:
+        raise exceptions.MalformedSchemaError(
+            "The model schema does not have any properties.", schema=schema
+        )
+
+    property_plans: typing.List[PropertyPlan] = []
+    for name, property_schema in properties.items():
+        if helpers.peek.write_only(schema=property_schema, schemas={}):
+            continue
+        property_plans.append(
+            PropertyPlan(
+                name=name,
+                schema=property_schema,
+                convert=compile_convert(schema=property_schema),
+                return_none=return_none(schema=schema, property_name=name),
+            )
+        )
+
+    return Plan(
+        schema=schema,
+        inherits=bool(helpers.schema.inherits(schema=schema, schemas={})),
+        properties=tuple(property_plans),
+    )
+
+
 def return_none(*, schema: oa_types.Schema, property_name: str) -> bool:
     """
     Check whether a null value for a property should be returned.
@@ -1,6 +1,5 @@
 """Convert array to dictionary."""
 
-import functools
 import typing
 
 from ... import exceptions
@@ -9,6 +8,8 @@ from ... import types as ao_types
 from .. import types
 from . import object_
 
+TConvert = typing.Callable[[typing.Any], types.TOptArrayDict]
+
 
 def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDict:
     """
@@ -28,6 +29,23 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
     """
     if value is None:
         return None
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: ao_types.Schema) -> TConvert:
+    """
+    Calculate the function that converts array property values to a list.
+
+    Raises MalformedSchemaError if schema does not define item schema.
+    Raises FeatureNotImplementedError if the item schema is not of type object.
+
+    Args:
+        schema: The schema for the value.
+
+    Returns:
+        The function that converts a value to a list of dictionaries.
+
+    """
     item_schema = helpers.peek.items(schema=schema, schemas={})
     if item_schema is None:
         raise exceptions.MalformedSchemaError(
@@ -39,11 +57,18 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
             "The array item schema must be of type object."
         )
     read_only = helpers.peek.read_only(schema=schema, schemas={})
-    item_conversion = functools.partial(
-        object_.convert, schema=item_schema, read_only=read_only
-    )
-    try:
-        converted_items = map(item_conversion, value)
-    except TypeError as exc:
-        raise exceptions.InvalidInstanceError("Array values must be iterable.") from exc
-    return list(converted_items)
+    item_conversion = object_.compile_(schema=item_schema, read_only=read_only)
+
+    def convert_items(value: typing.Any) -> types.TOptArrayDict:
+        """Convert each item of the array."""
+        if value is None:
+            return None
+        try:
+            converted_items = map(item_conversion, value)
+        except TypeError as exc:
+            raise exceptions.InvalidInstanceError(
+                "Array values must be iterable."
+            ) from exc
+        return list(converted_items)
+
+    return convert_items
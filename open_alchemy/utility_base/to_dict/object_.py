@@ -7,6 +7,8 @@ from ... import helpers
 from ... import types as oa_types
 from .. import types
 
+TConvert = typing.Callable[[typing.Any], types.TOptObjectDict]
+
 
 def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
     """
@@ -84,8 +86,25 @@ def convert(
         schema: The schema for the value.
         read_only (optional): Whether the schema is read only.
 
+    """
+    return compile_(schema=schema, read_only=read_only)(value)
+
+
+def compile_(
+    *, schema: oa_types.Schema, read_only: typing.Optional[bool] = None
+) -> TConvert:
+    """
+    Calculate the function that converts object schema values to dictionaries.
+
+    Args:
+        schema: The schema for the value.
+        read_only (optional): Whether the schema is read only.
+
+    Returns:
+        The function that converts a value to a dictionary.
+
     """
     schema_read_only = helpers.peek.read_only(schema=schema, schemas={})
     if read_only or schema_read_only:
-        return _convert_read_only(schema=schema, value=value)
-    return _convert_relationship(value=value)
+        return lambda value: _convert_read_only(schema=schema, value=value)
+    return lambda value: _convert_relationship(value=value)
@@ -1,12 +1,15 @@
 """Convert simple types (not object nor array)."""
 
 import datetime
+import typing
 
 from ... import exceptions
 from ... import helpers
 from ... import types as oa_types
 from .. import types
 
+TConvert = typing.Callable[[typing.Any], types.TOptSimpleDict]
+
 
 def convert(
     value: types.TOptSimpleCol, *, schema: oa_types.Schema
@@ -24,69 +27,109 @@ def convert(
         The value converted to the expected dictionary value.
 
     """
-    type_ = helpers.peek.type_(schema=schema, schemas={})
+    helpers.peek.type_(schema=schema, schemas={})
     if value is None:
         return None
 
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: oa_types.Schema) -> TConvert:
+    """
+    Calculate the function that converts values with basic types for a schema.
+
+    The returned function assumes that the value is not None.
+
+    Raises TypeMissingError if the schema does not have a type.
+    Raises FeatureNotImplementedError if the type is not supported.
+
+    Args:
+        schema: The schema for the value.
+
+    Returns:
+        The function that converts a value to the expected dictionary value.
+
+    """
+    type_ = helpers.peek.type_(schema=schema, schemas={})
+
     if type_ == "integer":
-        if not isinstance(value, int):
-            raise exceptions.InvalidInstanceError(
-                "Integer type columns must have int values."
-            )
-        return value
+        return _convert_integer
     if type_ == "number":
-        if not isinstance(value, float):
-            raise exceptions.InvalidInstanceError(
-                "Number type columns must have float values."
-            )
-        return value
+        return _convert_number
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        format_ = helpers.peek.format_(schema=schema, schemas={})
+        return _STRING_FORMAT_CONVERTERS.get(format_, _convert_string)
     if type_ == "boolean":
-        if not isinstance(value, bool):
-            raise exceptions.InvalidInstanceError(
-                "Boolean type columns must have bool values."
-            )
-        return value
+        return _convert_boolean
 
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
-def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
-    """
-    Convert string type column to str.
+def _convert_integer(value: types.TSimpleCol) -> int:
+    """Convert integer type column to int."""
+    if not isinstance(value, int):
+        raise exceptions.InvalidInstanceError(
+            "Integer type columns must have int values."
+        )
+    return value
 
-    Raises InvalidInstanceError if the value is not of the type implied by the schema.
 
-    Args:
-        value: The value to convert.
+def _convert_number(value: types.TSimpleCol) -> float:
+    """Convert number type column to float."""
+    if not isinstance(value, float):
+        raise exceptions.InvalidInstanceError(
+            "Number type columns must have float values."
+        )
+    return value
 
-    Returns:
-        The converted value.
 
-    """
-    format_ = helpers.peek.format_(schema=schema, schemas={})
-    if format_ == "date":
-        if not isinstance(value, datetime.date):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with date format must have date values."
-            )
-        return value.isoformat()
-    if format_ == "date-time":
-        if not isinstance(value, datetime.datetime):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with date-time format must have datetime "
-                "values."
-            )
-        return value.isoformat()
-    if format_ == "binary":
-        if not isinstance(value, bytes):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with binary format must have bytes values."
-            )
-        return value.decode()
+def _convert_boolean(value: types.TSimpleCol) -> bool:
+    """Convert boolean type column to bool."""
+    if not isinstance(value, bool):
+        raise exceptions.InvalidInstanceError(
+            "Boolean type columns must have bool values."
+        )
+    return value
+
+
+def _convert_string(value: types.TSimpleCol) -> str:
+    """Convert string type column without a format to str."""
     if not isinstance(value, str):
         raise exceptions.InvalidInstanceError(
             "String type columns must have str values."
         )
     return value
+
+
+def _convert_date(value: types.TSimpleCol) -> str:
+    """Convert string type column with date format to str."""
+    if not isinstance(value, datetime.date):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with date format must have date values."
+        )
+    return value.isoformat()
+
+
+def _convert_date_time(value: types.TSimpleCol) -> str:
+    """Convert string type column with date-time format to str."""
+    if not isinstance(value, datetime.datetime):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with date-time format must have datetime values."
+        )
+    return value.isoformat()
+
+
+def _convert_binary(value: types.TSimpleCol) -> str:
+    """Convert string type column with binary format to str."""
+    if not isinstance(value, bytes):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with binary format must have bytes values."
+        )
+    return value.decode()
+
+
+_STRING_FORMAT_CONVERTERS: typing.Dict[typing.Optional[str], TConvert] = {
+    "date": _convert_date,
+    "date-time": _convert_date_time,
+    "binary": _convert_binary,
+}
@@ -3,6 +3,7 @@
 import datetime
 import typing
 
+from .. import exceptions
 from .. import types as oa_types
 
 # Types for converting to dictionary
@@ -32,3 +33,14 @@ class TModel(oa_types.Protocol):
     def to_dict(self) -> TObjectDict:
         """Interface for to_dict."""
         ...
+
+
+class RowError(typing.NamedTuple):
+    """The error for a value that could not be converted in a batch."""
+
+    # The position of the value in the batch
+    position: int
+    # The value that could not be converted
+    value: typing.Any
+    # The error raised for the value
+    error: exceptions.BaseError
@@ -131,6 +131,7 @@ def mocked_facades_sqlalchemy(monkeypatch):
 @pytest.fixture(autouse=True)
 def cleanup_models():
     """Remove any new attributes on open_alchemy.models."""
+    models.__dict__.pop("__getattr__", None)
     for key in set(models.__dict__.keys()):
         if key.startswith("__"):
             continue
@@ -140,6 +141,7 @@ def cleanup_models():
 
     yield
 
+    models.__dict__.pop("__getattr__", None)
     for key in set(models.__dict__.keys()):
         if key.startswith("__"):
             continue
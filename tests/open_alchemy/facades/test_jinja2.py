@@ -0,0 +1,43 @@
+"""Tests for jinja2 facade."""
+
+import pytest
+
+from open_alchemy import facades
+
+
+@pytest.mark.facade
+def test_get_template():
+    """
+    GIVEN name of a template
+    WHEN get_template is called with the name twice
+    THEN the same compiled template is returned both times.
+    """
+    name = "models_file/model/typed_dict_required.j2"
+
+    template = facades.jinja2.get_template(name=name)
+
+    assert facades.jinja2.get_template(name=name) is template
+    assert facades.jinja2.get_template(name=name, trim_blocks=True) is not template
+
+
+@pytest.mark.parametrize(
+    "trim_blocks, expected_source",
+    [
+        pytest.param(False, "\n\nimport sqlalchemy\n\nfrom", id="trim_blocks false"),
+        pytest.param(True, "\nimport sqlalchemy\nfrom", id="trim_blocks true"),
+    ],
+)
+@pytest.mark.facade
+def test_get_template_trim_blocks(trim_blocks, expected_source):
+    """
+    GIVEN trim_blocks
+    WHEN get_template is called with a template with a block and rendered
+    THEN the newlines after the blocks are only kept if trim_blocks is false.
+    """
+    template = facades.jinja2.get_template(
+        name="models_file/models/template.j2", trim_blocks=trim_blocks
+    )
+
+    source = template.render(imports=["typing"], models=[], python_minor_version=8)
+
+    assert expected_source in source
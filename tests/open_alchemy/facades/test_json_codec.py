@@ -0,0 +1,111 @@
+"""Tests for JSON codec facade."""
+
+import sys
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import facades
+
+NAMES = [
+    pytest.param(name, id=name) for name in ("json", "orjson", "rapidjson", "ujson")
+]
+
+
+@pytest.mark.parametrize("name", NAMES)
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param('{"key": ["value", 1]}', id="str"),
+        pytest.param(b'{"key": ["value", 1]}', id="bytes"),
+        pytest.param(bytearray(b'{"key": ["value", 1]}'), id="bytearray"),
+        pytest.param(memoryview(b'{"key": ["value", 1]}'), id="memoryview"),
+    ],
+)
+@pytest.mark.facade
+def test_loads_dumps(name, value):
+    """
+    GIVEN name of an installed codec and JSON document
+    WHEN the codec is retrieved and the document is decoded and encoded again
+    THEN the decoded value is returned and the encoded value decodes to it.
+    """
+    pytest.importorskip(name)
+    codec = facades.json_codec.get(name)
+
+    decoded = codec.loads(value)
+    encoded = codec.dumps(decoded)
+
+    assert codec.name == name
+    assert decoded == {"key": ["value", 1]}
+    assert isinstance(encoded, str)
+    assert codec.loads(encoded) == decoded
+
+
+@pytest.mark.parametrize("name", NAMES)
+@pytest.mark.parametrize(
+    "value",
+    [pytest.param("{", id="str"), pytest.param(b"\xff", id="bytes not utf-8")],
+)
+@pytest.mark.facade
+def test_loads_invalid(name, value):
+    """
+    GIVEN name of an installed codec and invalid JSON document
+    WHEN the document is decoded
+    THEN ValueError is raised.
+    """
+    pytest.importorskip(name)
+    codec = facades.json_codec.get(name)
+
+    with pytest.raises(ValueError):
+        codec.loads(value)
+
+
+@pytest.mark.facade
+def test_get_default():
+    """
+    GIVEN no name
+    WHEN get is called without a name
+    THEN the json codec is returned which encodes the same as the json module.
+    """
+    codec = facades.json_codec.get()
+
+    assert codec.name == facades.json_codec.CodecName.JSON
+    assert codec.dumps({"key": "välue"}) == '{"key": "v\\u00e4lue"}'
+
+
+@pytest.mark.facade
+def test_get_unknown():
+    """
+    GIVEN name that is not a codec
+    WHEN get is called with the name
+    THEN InvalidJsonCodecError is raised.
+    """
+    with pytest.raises(exceptions.InvalidJsonCodecError):
+        facades.json_codec.get("unknown")
+
+
+@pytest.mark.parametrize(
+    "missing, expected_name",
+    [
+        pytest.param((), "orjson", id="all installed"),
+        pytest.param(("orjson",), "rapidjson", id="orjson missing"),
+        pytest.param(("orjson", "rapidjson"), "ujson", id="ujson installed"),
+        pytest.param(("orjson", "rapidjson", "ujson"), "json", id="none installed"),
+    ],
+)
+@pytest.mark.facade
+def test_get_auto(monkeypatch, missing, expected_name):
+    """
+    GIVEN libraries that are not installed
+    WHEN get is called with auto
+    THEN the fastest codec that is installed is returned.
+    """
+    for name in ("orjson", "rapidjson", "ujson"):
+        if name not in missing:
+            pytest.importorskip(name)
+    for name in missing:
+        monkeypatch.setitem(sys.modules, name, None)
+
+    codec = facades.json_codec.get.__wrapped__("auto")
+
+    assert codec.name == expected_name
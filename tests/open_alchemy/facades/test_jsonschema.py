@@ -77,3 +77,56 @@ def test_resolver_multiple(tmp_path):
     jsonschema.validate(instance, schema, resolver=resolver)
     assert schema1_dict == {"RefSchema1": {"type": "string"}}
     assert schema2_dict == {"RefSchema2": {"type": "integer"}}
+
+
+@pytest.mark.parametrize(
+    "schema, instance, expected_valid",
+    [
+        pytest.param({"type": "string"}, "value", True, id="valid"),
+        pytest.param({"type": "string"}, 1, False, id="invalid"),
+        pytest.param(
+            {"type": "object", "properties": {"key": {"type": "integer"}}},
+            {"key": "value"},
+            False,
+            id="invalid nested",
+        ),
+    ],
+)
+@pytest.mark.facade
+def test_validator(schema, instance, expected_valid):
+    """
+    GIVEN schema, instance and whether the instance is expected to be valid
+    WHEN validator is called with the schema and the result with the instance
+    THEN ValidationError is raised if the instance is not expected to be valid.
+    """
+    validate = facades.jsonschema.validator(schema=schema)
+
+    if expected_valid:
+        validate(instance)
+    else:
+        with pytest.raises(facades.jsonschema.ValidationError):
+            validate(instance)
+
+
+@pytest.mark.facade
+def test_validator_invalid_schema():
+    """
+    GIVEN schema that is not valid
+    WHEN validator is called with the schema
+    THEN SchemaError is raised.
+    """
+    with pytest.raises(jsonschema.SchemaError):
+        facades.jsonschema.validator(schema={"type": 1})
+
+
+@pytest.mark.facade
+def test_remapped():
+    """
+    GIVEN jsonschema facade
+    WHEN the re mapped values and a value that does not exist are accessed
+    THEN the jsonschema values are returned and AttributeError is raised.
+    """
+    assert facades.jsonschema.ValidationError is jsonschema.ValidationError
+    assert facades.jsonschema.validate is jsonschema.validate
+    with pytest.raises(AttributeError):
+        facades.jsonschema.missing  # pylint: disable=pointless-statement
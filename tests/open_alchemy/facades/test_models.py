@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+import open_alchemy
 from open_alchemy.facades import models
 
 
@@ -93,3 +94,28 @@ def test_set_model(mocked_models):
     models.set_model(model=model, name=name)
 
     assert getattr(mocked_models, name) == model
+
+
+@pytest.mark.facade
+def test_registry(_mocked_models):
+    """
+    GIVEN registry
+    WHEN set_model is called with the registry and then get_base, get_model and
+        get_model_schema are called with the registry
+    THEN the registry is used instead of the default models.
+    """
+    registry = open_alchemy.ModelRegistry()
+    base = mock.MagicMock()
+    setattr(registry, "Base", base)
+    model = mock.MagicMock()
+    name = "Model"
+
+    models.set_model(model=model, name=name, registry=registry)
+
+    assert models.get_base(registry=registry) == base
+    assert models.get_model(name=name, registry=registry) == model
+    assert models.get_model(name="Other", registry=registry) is None
+    assert (
+        models.get_model_schema(name=name, registry=registry)
+        == model._schema  # pylint: disable=protected-access
+    )
@@ -631,3 +631,52 @@ def test_mixins_valid(prefix, value):
     )
 
     assert returned_value == value
+
+
+@pytest.mark.helper
+def test_cache(monkeypatch):
+    """
+    GIVEN source with an extension property
+    WHEN get is called with the source multiple times within a cache context and
+        after the context
+    THEN the value is only validated once within the context.
+    """
+    name = "x-mixins"
+    source = {name: ["mixin 1"]}
+    validated_values = []
+    get_validator = helpers.ext_prop._get_validator  # pylint: disable=protected-access
+
+    def _get_validator(name):
+        validator = get_validator(name)
+
+        def _validate(value):
+            validated_values.append(value)
+            validator(value)
+
+        return _validate
+
+    monkeypatch.setattr(helpers.ext_prop, "_get_validator", _get_validator)
+
+    with helpers.peek.cache():
+        helpers.ext_prop.get(source=source, name=name)
+        helpers.ext_prop.get(source=source, name=name)
+    assert validated_values == [["mixin 1"]]
+
+    helpers.ext_prop.get(source=source, name=name)
+    assert len(validated_values) == 2
+
+
+@pytest.mark.helper
+def test_cache_invalid():
+    """
+    GIVEN source with an invalid extension property
+    WHEN get is called with the source multiple times within a cache context
+    THEN MalformedExtensionPropertyError is raised each time.
+    """
+    name = "x-mixins"
+    source = {name: [None]}
+
+    with helpers.ext_prop.cache():
+        for _ in range(2):
+            with pytest.raises(exceptions.MalformedExtensionPropertyError):
+                helpers.ext_prop.get(source=source, name=name)
@@ -0,0 +1,61 @@
+"""Tests for the scoped memo helper."""
+
+import concurrent.futures
+
+import pytest
+
+from open_alchemy import helpers
+
+
+@pytest.mark.helper
+def test_scope():
+    """
+    GIVEN scoped memo
+    WHEN entries is called outside, inside and after a context
+    THEN None is returned outside the context and the memoized values within it.
+    """
+    memo = helpers.memo.ScopedMemo()
+
+    assert memo.entries() is None
+    with memo.scope():
+        entries = memo.entries()
+        assert entries == {}
+        entries["key"] = "value"
+        assert memo.entries() == {"key": "value"}
+    assert memo.entries() is None
+
+
+@pytest.mark.helper
+def test_scope_nested():
+    """
+    GIVEN scoped memo with an active context with a value
+    WHEN a nested context is entered and exited
+    THEN the nested context starts empty and the enclosing context is cleared on exit.
+    """
+    memo = helpers.memo.ScopedMemo()
+
+    with memo.scope():
+        outer_entries = memo.entries()
+        outer_entries["key"] = "value"
+        with memo.scope():
+            assert memo.entries() == {}
+            memo.entries()["other key"] = "other value"
+
+        assert memo.entries() is outer_entries
+        assert outer_entries == {}
+
+
+@pytest.mark.helper
+def test_scope_thread():
+    """
+    GIVEN scoped memo with an active context
+    WHEN entries is called in another thread
+    THEN None is returned.
+    """
+    memo = helpers.memo.ScopedMemo()
+
+    with memo.scope():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            returned_entries = executor.submit(memo.entries).result()
+
+    assert returned_entries is None
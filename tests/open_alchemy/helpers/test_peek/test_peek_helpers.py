@@ -111,6 +111,54 @@ def test_peek_key_skip_ref(schema, schemas, expected_value):
     assert returned_type == expected_value
 
 
+@pytest.mark.helper
+def test_peek_key_cache():
+    """
+    GIVEN schema with a $ref
+    WHEN peek_key is called within a cache context, the referenced schema is changed
+        and peek_key is called again within and after the context
+    THEN the first value is returned within the context and the new value after it.
+    """
+    schema = {"$ref": "#/components/schemas/RefSchema"}
+    schemas = {"RefSchema": {"key": "value 1"}}
+
+    with helpers.peek.cache():
+        first_value = helpers.peek.peek_key(schema=schema, schemas=schemas, key="key")
+        schemas["RefSchema"] = {"key": "value 2"}
+        cached_value = helpers.peek.peek_key(schema=schema, schemas=schemas, key="key")
+        other_key_value = helpers.peek.peek_key(
+            schema=schema, schemas=schemas, key="other"
+        )
+    after_value = helpers.peek.peek_key(schema=schema, schemas=schemas, key="key")
+
+    assert first_value == "value 1"
+    assert cached_value == "value 1"
+    assert other_key_value is None
+    assert after_value == "value 2"
+
+
+@pytest.mark.helper
+def test_peek_key_cache_nested():
+    """
+    GIVEN schema
+    WHEN peek_key is called within a cache context and the schema is changed within a
+        nested cache context
+    THEN the new value is returned in the nested context and after it.
+    """
+    schema = {"key": "value 1"}
+
+    with helpers.peek.cache():
+        first_value = helpers.peek.peek_key(schema=schema, schemas={}, key="key")
+        with helpers.peek.cache():
+            schema["key"] = "value 2"
+            nested_value = helpers.peek.peek_key(schema=schema, schemas={}, key="key")
+        after_value = helpers.peek.peek_key(schema=schema, schemas={}, key="key")
+
+    assert first_value == "value 1"
+    assert nested_value == "value 2"
+    assert after_value == "value 2"
+
+
 @pytest.mark.parametrize(
     "schema, schemas",
     [
@@ -1,5 +1,6 @@
 """Tests for ref."""
 
+import concurrent.futures
 import os
 import sys
 from unittest import mock
@@ -417,8 +418,24 @@ class TestAddRemoteContext:
                 "key2": {"$ref": "doc.ext#/Schema2"},
             },
         ),
+        (
+            {"allOf": [{"$ref": "#/Schema1"}, {"key": "value"}]},
+            {"allOf": [{"$ref": "doc.ext#/Schema1"}, {"key": "value"}]},
+        ),
+        ({"$ref": True}, {"$ref": True}),
+        (
+            {"properties": {"$ref": {"type": "string"}}},
+            {"properties": {"$ref": {"type": "string"}}},
+        ),
+    ],
+    ids=[
+        "no update",
+        "single update",
+        "multiple update",
+        "list update",
+        "not string",
+        "property named $ref",
     ],
-    ids=["no update", "single update", "multiple update"],
 )
 @pytest.mark.helper
 def test_map_remote_schema_ref(schema, expected_schema):
@@ -435,8 +452,23 @@ def test_map_remote_schema_ref(schema, expected_schema):
     assert returned_schema == expected_schema
 
 
+@pytest.mark.helper
+def test_map_remote_schema_ref_copy():
+    """
+    GIVEN schema with a $ref
+    WHEN _map_remote_schema_ref is called with the schema
+    THEN the schema is not modified.
+    """
+    # pylint: disable=protected-access
+    schema = {"allOf": [{"$ref": "#/Schema1"}]}
+
+    helpers.ref._map_remote_schema_ref(schema=schema, context="doc.ext")
+
+    assert schema == {"allOf": [{"$ref": "#/Schema1"}]}
+
+
 class TestRemoteSchemaStore:
-    """Tests for _RemoteSchemaStore."""
+    """Tests for RemoteSchemaStore."""
 
     # pylint: disable=protected-access
 
@@ -445,12 +477,15 @@ class TestRemoteSchemaStore:
     def test_init():
         """
         GIVEN
-        WHEN _RemoteSchemaStore is initialized
+        WHEN RemoteSchemaStore is initialized
         THEN empty store is created.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
 
         assert store._schemas == {}
+        assert store._mapped_schemas == {}
+        assert store._refs == {}
+        assert store.stats == {}
         assert store.spec_context is None
 
     @staticmethod
@@ -461,24 +496,30 @@ class TestRemoteSchemaStore:
         WHEN reset is called
         THEN the state is removed.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store._schemas["key"] = "value"
+        store._mapped_schemas[("key", "path")] = ("name", {})
+        store._refs["key#path"] = ("key", ("name", {}))
+        store.stats["key"] = helpers.ref.RemoteFileStats()
         store.spec_context = "path 1"
 
         store.reset()
 
         assert store._schemas == {}
+        assert store._mapped_schemas == {}
+        assert store._refs == {}
+        assert store.stats == {}
         assert store.spec_context is None
 
     @staticmethod
     @pytest.mark.helper
     def test_context_not_set():
         """
-        GIVEN _RemoteSchemaStore without spec context set
+        GIVEN RemoteSchemaStore without spec context set
         WHEN get_schemas is called
         THEN MissingArgumentError is raised.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
 
         with pytest.raises(exceptions.MissingArgumentError):
             store.get_schemas(context="doc.ext")
@@ -494,7 +535,7 @@ class TestRemoteSchemaStore:
         WHEN get_schemas is called
         THEN SchemaNotFoundError is raised.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = "doc.ext"
 
         with pytest.raises(exceptions.SchemaNotFoundError):
@@ -513,7 +554,7 @@ class TestRemoteSchemaStore:
         directory.mkdir()
         schemas_file = directory / "original.json"
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         with pytest.raises(exceptions.SchemaNotFoundError):
@@ -539,7 +580,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = directory / remote_context
         remote_schemas_file.write_text(contents)
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         with pytest.raises(exceptions.SchemaNotFoundError):
@@ -571,7 +612,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = directory / remote_context
         remote_schemas_file.write_text(contents)
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         remote_schemas = store.get_schemas(context=remote_context)
@@ -594,7 +635,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = directory / "remote.json"
         remote_schemas_file.write_text('{"key": "value"}')
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         store.get_schemas(context="remote.json")
@@ -620,7 +661,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = remote_directory / "remote.json"
         remote_schemas_file.write_text('{"key": "value"}')
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         remote_schemas = store.get_schemas(context="remote/remote.json")
@@ -642,7 +683,7 @@ class TestRemoteSchemaStore:
         response_cm.__enter__.return_value = response_cm
         mocked_urlopen.return_value = response_cm
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = "path1"
         remote_context = "http://host.com/doc.json"
 
@@ -663,7 +704,7 @@ class TestRemoteSchemaStore:
             url="some url", code=404, msg="message", hdrs="headers", fp="fp"
         )
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = "path1"
         remote_context = "http://host.com/doc.json"
 
@@ -799,6 +840,64 @@ def test_get_remote_ref_ref(tmp_path, _clean_remote_schemas_store):
     assert name == "Schema1"
 
 
+@pytest.mark.helper
+def test_get_remote_ref_cached(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN remote $ref and file with the remote schemas
+    WHEN get_remote_ref is called with the $ref twice, the second time after the
+        file has been removed
+    THEN the same remote schema is returned both times.
+    """
+    # Create file
+    directory = tmp_path / "base"
+    directory.mkdir()
+    schemas_file = directory / "original.json"
+    remote_schemas_file = directory / "remote.json"
+    remote_schemas_file.write_text('{"Schema1": {"$ref": "#/Schema2"}}')
+    # Set up remote schemas store
+    helpers.ref.set_context(path=str(schemas_file))
+    # Calculate $ref
+    ref = "remote.json#/Schema1"
+
+    first_name_schema = helpers.ref.get_remote_ref(ref=ref)
+    remote_schemas_file.unlink()
+    second_name_schema = helpers.ref.get_remote_ref(ref=ref)
+
+    assert first_name_schema == ("Schema1", {"$ref": "remote.json#/Schema2"})
+    assert second_name_schema[1] is first_name_schema[1]
+
+
+@pytest.mark.helper
+def test_get_remote_stats(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN file with the remote schemas
+    WHEN get_remote_ref is called with a $ref, the same $ref and a $ref to the same
+        schema that is not normalized and get_remote_stats is called
+    THEN the file is loaded once, the schema is retrieved once and the other
+        references are hits.
+    """
+    # Create file
+    directory = tmp_path / "base"
+    directory.mkdir()
+    (directory / "subdir").mkdir()
+    schemas_file = directory / "original.json"
+    remote_schemas_file = directory / "remote.json"
+    remote_schemas_file.write_text('{"Schema1": {"key": "value"}}')
+    # Set up remote schemas store
+    helpers.ref.set_context(path=str(schemas_file))
+    helpers.ref.get_remote_ref(ref="remote.json#/Schema1")
+    helpers.ref.get_remote_ref(ref="remote.json#/Schema1")
+    helpers.ref.get_remote_ref(ref="subdir/../remote.json#/Schema1")
+
+    returned_stats = helpers.ref.get_remote_stats()
+
+    assert list(returned_stats) == ["remote.json"]
+    stats = returned_stats["remote.json"]
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.load_seconds >= 0
+
+
 @pytest.mark.xfail(
     condition=sys.platform == "win32", reason="feature not supported on Windows"
 )
@@ -892,3 +991,148 @@ def test_set_spec_context(_clean_remote_schemas_store):
     helpers.ref.set_context(path="path1")
 
     assert helpers.ref._remote_schema_store.spec_context == "path1"
+
+
+@pytest.mark.parametrize(
+    "schemas, context, expected_contexts",
+    [
+        pytest.param({}, None, set(), id="empty"),
+        pytest.param({"$ref": "#/Schema1"}, None, set(), id="local"),
+        pytest.param({"$ref": True}, None, set(), id="not string"),
+        pytest.param({"$ref": "doc.ext"}, None, set(), id="invalid"),
+        pytest.param(
+            {"$ref": "doc.ext#/Schema1"}, None, {"doc.ext"}, id="single remote"
+        ),
+        pytest.param(
+            {"allOf": [{"$ref": "dir/../doc1.ext#/Schema1"}, {"$ref": "doc2.ext#/S"}]},
+            None,
+            {"doc1.ext", "doc2.ext"},
+            id="multiple remote normalized",
+        ),
+        pytest.param(
+            {"$ref": "#/Schema1"}, "dir/doc1.ext", {"dir/doc1.ext"}, id="local context"
+        ),
+        pytest.param(
+            {"$ref": "doc2.ext#/Schema1"},
+            "dir/doc1.ext",
+            {"dir/doc2.ext"},
+            id="remote context",
+        ),
+    ],
+)
+@pytest.mark.xfail(
+    condition=sys.platform == "win32", reason="feature not supported on Windows"
+)
+@pytest.mark.helper
+def test_calculate_remote_contexts(schemas, context, expected_contexts):
+    """
+    GIVEN schemas and the context of the schemas
+    WHEN _calculate_remote_contexts is called with the schemas and context
+    THEN the expected contexts are returned.
+    """
+    # pylint: disable=protected-access
+    returned_contexts = helpers.ref._calculate_remote_contexts(
+        schemas=schemas, context=context
+    )
+
+    assert returned_contexts == expected_contexts
+
+
+@pytest.mark.helper
+def test_prefetch(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN schemas with a remote $ref to a file with a remote $ref to another file
+    WHEN prefetch is called with the schemas and the files are removed
+    THEN the $ref to the other file can be resolved.
+    """
+    # pylint: disable=protected-access
+    # Create files
+    directory = tmp_path / "base"
+    directory.mkdir()
+    sub_directory = directory / "subdir"
+    sub_directory.mkdir()
+    schemas_file = directory / "original.json"
+    remote_schemas_file = directory / "remote.json"
+    remote_schemas_file.write_text('{"Schema1": {"$ref": "subdir/remote.json#/S2"}}')
+    sub_remote_schemas_file = sub_directory / "remote.json"
+    sub_remote_schemas_file.write_text('{"S2": {"key": "value"}}')
+    helpers.ref.set_context(path=str(schemas_file))
+    schemas = {"Schema": {"$ref": "remote.json#/Schema1"}}
+
+    helpers.ref.prefetch(schemas=schemas)
+
+    remote_schemas_file.unlink()
+    sub_remote_schemas_file.unlink()
+    assert helpers.ref.get_remote_ref(ref="subdir/remote.json#/S2") == (
+        "S2",
+        {"key": "value"},
+    )
+    assert set(helpers.ref.get_remote_stats()) == {"remote.json", "subdir/remote.json"}
+
+
+@pytest.mark.helper
+def test_prefetch_not_found(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN schemas with a remote $ref to a file that does not exist
+    WHEN prefetch is called with the schemas
+    THEN no error is raised until the $ref is resolved.
+    """
+    directory = tmp_path / "base"
+    directory.mkdir()
+    helpers.ref.set_context(path=str(directory / "original.json"))
+    schemas = {"Schema": {"$ref": "remote.json#/Schema1"}}
+
+    helpers.ref.prefetch(schemas=schemas)
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        helpers.ref.get_remote_ref(ref="remote.json#/Schema1")
+
+
+@pytest.mark.helper
+def test_prefetch_context_not_set(_clean_remote_schemas_store):
+    """
+    GIVEN schemas with a remote $ref and the context is not set
+    WHEN prefetch is called with the schemas
+    THEN nothing is loaded.
+    """
+    schemas = {"Schema": {"$ref": "remote.json#/Schema1"}}
+
+    helpers.ref.prefetch(schemas=schemas)
+
+    assert helpers.ref.get_remote_stats() == {}
+
+
+@pytest.mark.helper
+def test_use_store(_clean_remote_schemas_store):
+    """
+    GIVEN store
+    WHEN use_store is called with the store and the context is set within it
+    THEN the store is used within the context and the context is only set on the
+        store.
+    """
+    store = helpers.ref.RemoteSchemaStore(spec_context="path 1")
+
+    with helpers.ref.use_store(store=store):
+        assert helpers.ref.get_store() is store
+        assert helpers.ref.get_context() == "path 1"
+        helpers.ref.set_context(path="path 2")
+
+    assert store.spec_context == "path 2"
+    assert helpers.ref.get_store() is not store
+    assert helpers.ref.get_context() is None
+
+
+@pytest.mark.helper
+def test_use_store_thread(_clean_remote_schemas_store):
+    """
+    GIVEN store that is in use
+    WHEN get_store is called in another thread
+    THEN the default store is returned.
+    """
+    store = helpers.ref.RemoteSchemaStore()
+
+    with helpers.ref.use_store(store=store):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            returned_store = executor.submit(helpers.ref.get_store).result()
+
+    assert returned_store is not store
@@ -0,0 +1,46 @@
+"""Tests for loading YAML documents."""
+
+import pytest
+import yaml
+
+from open_alchemy import helpers
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        pytest.param("key: [1, 2]\n", id="str"),
+        pytest.param(b"key: [1, 2]\n", id="bytes"),
+    ],
+)
+@pytest.mark.helper
+def test_load(stream):
+    """
+    GIVEN YAML document
+    WHEN load is called with the document
+    THEN the loaded document is returned.
+    """
+    assert helpers.yaml_.load(stream) == {"key": [1, 2]}
+
+
+@pytest.mark.helper
+def test_load_unsafe():
+    """
+    GIVEN YAML document with a python object tag
+    WHEN load is called with the document
+    THEN yaml.YAMLError is raised.
+    """
+    with pytest.raises(yaml.YAMLError):
+        helpers.yaml_.load("!!python/object/apply:os.getcwd []\n")
+
+
+@pytest.mark.helper
+def test_load_pure_python(monkeypatch):
+    """
+    GIVEN PyYAML without libyaml
+    WHEN load is called with a document
+    THEN the loaded document is returned.
+    """
+    monkeypatch.delattr(yaml, "CSafeLoader")
+
+    assert helpers.yaml_.load("key: value\n") == {"key": "value"}
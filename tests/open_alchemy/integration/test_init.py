@@ -1,6 +1,10 @@
 """Integration tests for initialization."""
 
+import concurrent.futures
+import copy
 import json
+import logging
+import os
 import sys
 from unittest import mock
 
@@ -9,6 +13,7 @@ import yaml
 
 import open_alchemy
 from open_alchemy import facades
+from open_alchemy import models_file as models_file_module
 
 
 @pytest.mark.integration
@@ -30,6 +35,13 @@ def test_init_optional_base_none_call(
         spec=spec,
         models_filename=None,
         spec_path=None,
+        validation_level=open_alchemy.ValidationLevel.FULL,
+        cache_dir=None,
+        lazy=False,
+        profile=None,
+        registry=None,
+        json_codec=None,
+        workers=None,
     )
 
 
@@ -64,7 +76,17 @@ def test_init_optional_base_def_call(mocked_init_model_factory: mock.MagicMock):
     open_alchemy._init_optional_base(base=base, spec=spec)
 
     mocked_init_model_factory.assert_called_once_with(
-        base=base, spec=spec, models_filename=None, spec_path=None
+        base=base,
+        spec=spec,
+        models_filename=None,
+        spec_path=None,
+        validation_level=open_alchemy.ValidationLevel.FULL,
+        cache_dir=None,
+        lazy=False,
+        profile=None,
+        registry=None,
+        json_codec=None,
+        workers=None,
     )
 
 
@@ -237,6 +259,44 @@ def test_init_json(engine, sessionmaker, tmp_path):
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_json_json_codec(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN specification stored in a JSON file with a remote reference to another JSON
+        file and the name of a JSON codec
+    WHEN init_json is called with the file and codec
+    THEN the models encode and decode JSON using the codec.
+    """
+    pytest.importorskip("orjson")
+    base_spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {"column": {"$ref": "remote_spec.json#/Column"}},
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    remote_spec = {"Column": {"type": "integer", "x-primary-key": True}}
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.json"
+    spec_file.write_text(json.dumps(base_spec))
+    remote_spec_file = directory / "remote_spec.json"
+    remote_spec_file.write_text(json.dumps(remote_spec))
+
+    _, model_factory = open_alchemy.init_json(
+        str(spec_file), json_codec="orjson", registry=open_alchemy.ModelRegistry()
+    )
+    model = model_factory(name="Table")
+
+    instance = model.from_str(memoryview(b'{"column": 1}'))
+    assert instance.column == 1
+    assert instance.to_str() == '{"column":1}'
+
+
 @pytest.mark.integration
 def test_init_json_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_store):
     """
@@ -285,6 +345,53 @@ def test_init_json_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_json_remote_concurrent(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN two specifications stored in JSON files in different folders with a remote
+        reference to a file with the same name but different contents
+    WHEN init_json is called with each file in different threads at the same time
+    THEN each model factory resolves the remote reference relative to its own
+        specification.
+    """
+    base_spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {"column": {"$ref": "remote_spec.json#/Column"}},
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    column_types = {"integer": int, "string": str}
+    spec_files = {}
+    for column_type in column_types:
+        directory = tmp_path / column_type
+        directory.mkdir()
+        spec_file = directory / "spec.json"
+        spec_file.write_text(json.dumps(base_spec))
+        remote_spec = {"Column": {"type": column_type, "x-primary-key": True}}
+        (directory / "remote_spec.json").write_text(json.dumps(remote_spec))
+        spec_files[column_type] = str(spec_file)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(spec_files)) as executor:
+        futures = {
+            column_type: executor.submit(open_alchemy.init_json, spec_file)
+            for column_type, spec_file in spec_files.items()
+        }
+        models = {
+            column_type: executor.submit(future.result()[1], name="Table").result()
+            for column_type, future in futures.items()
+        }
+
+    for column_type, expected_python_type in column_types.items():
+        column = models[column_type].__table__.c.column
+        assert column.type.python_type == expected_python_type
+    assert open_alchemy.helpers.ref.get_context() is None
+
+
 @pytest.mark.integration
 def test_init_yaml(engine, sessionmaker, tmp_path):
     """
@@ -316,6 +423,221 @@ def test_init_yaml(engine, sessionmaker, tmp_path):
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_yaml_workers(engine, sessionmaker, tmp_path, monkeypatch):
+    """
+    GIVEN specification stored in a YAML file
+    WHEN init_yaml is called with the file and workers
+    THEN the schemas are validated using the workers and a valid model factory is
+        returned.
+    """
+    # pylint: disable=protected-access
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    map_models = open_alchemy._schemas_module.validation.parallel.map_models
+    mock_map_models = mock.MagicMock(side_effect=map_models)
+    monkeypatch.setattr(
+        open_alchemy._schemas_module.validation.parallel,
+        "map_models",
+        mock_map_models,
+    )
+
+    base, model_factory = open_alchemy.init_yaml(
+        str(spec_file), workers=2, registry=open_alchemy.ModelRegistry()
+    )
+
+    _, kwargs = mock_map_models.call_args
+    assert kwargs["workers"] == 2
+    model = model_factory(name="Table")
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(model.from_dict(column=1))
+    session.flush()
+    assert session.query(model).first().to_dict() == {"column": 1}
+
+
+@pytest.mark.parametrize("cache", [False, True], ids=["no cache", "cache"])
+@pytest.mark.integration
+def test_init_yaml_workers_models_file(tmp_path, monkeypatch, cache):
+    """
+    GIVEN specification stored in a YAML file
+    WHEN init_yaml is called with the file, a models file and workers with and without
+        a cache directory
+    THEN the models file is generated using the workers and is the same as without
+        workers.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    expected_models_file = tmp_path / "expected_models.py"
+    open_alchemy.init_yaml(
+        str(spec_file),
+        models_filename=str(expected_models_file),
+        registry=open_alchemy.ModelRegistry(),
+    )
+    map_models = models_file_module.parallel.map_models
+    mock_map_models = mock.MagicMock(side_effect=map_models)
+    monkeypatch.setattr(models_file_module.parallel, "map_models", mock_map_models)
+    models_file = tmp_path / "models.py"
+
+    open_alchemy.init_yaml(
+        str(spec_file),
+        models_filename=str(models_file),
+        cache_dir=str(tmp_path / "cache") if cache else None,
+        workers=2,
+        registry=open_alchemy.ModelRegistry(),
+    )
+
+    _, kwargs = mock_map_models.call_args
+    assert kwargs["workers"] == 2
+    assert models_file.read_text() == expected_models_file.read_text()
+
+
+@pytest.mark.integration
+def test_init_yaml_cache(engine, sessionmaker, tmp_path, monkeypatch):
+    """
+    GIVEN specification stored in a YAML file
+    WHEN init_yaml is called twice with the file, a cache directory and a models file
+    THEN the specification is only parsed and the schemas are only processed the first
+        time and the same models and models file are produced both times.
+    """
+    # pylint: disable=protected-access
+    # Generate spec file
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    cache_dir = tmp_path / "cache"
+    models_file = directory / "models.py"
+
+    # Populate the cache
+    open_alchemy.init_yaml(
+        str(spec_file), cache_dir=str(cache_dir), models_filename=str(models_file)
+    )
+    first_models_file_contents = models_file.read_text()
+    models_file.unlink()
+
+    # Creating model factory from the cache
+    mock_process = mock.MagicMock()
+    monkeypatch.setattr(open_alchemy._schemas_module, "process", mock_process)
+    mock_yaml_load = mock.MagicMock()
+    monkeypatch.setattr(open_alchemy._helpers.yaml_, "load", mock_yaml_load)
+    base, model_factory = open_alchemy.init_yaml(
+        str(spec_file), cache_dir=str(cache_dir), models_filename=str(models_file)
+    )
+    model = model_factory(name="Table")
+
+    mock_process.assert_not_called()
+    mock_yaml_load.assert_not_called()
+    assert models_file.read_text() == first_models_file_contents
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating model instance
+    value = 0
+    model_instance = model.from_dict(column=value)
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+
+    # Querying session
+    queried_model = session.query(model).first()
+    assert queried_model.to_dict() == {"column": value}
+
+
+@pytest.mark.integration
+def test_init_yaml_cache_models_file(tmp_path, monkeypatch):
+    """
+    GIVEN specification with two models stored in a YAML file
+    WHEN init_yaml is called with the file, a cache directory and a models file, then
+        one of the models changes and init_yaml is called twice more
+    THEN only the changed model is generated again and the models file is only
+        written when it changes.
+    """
+    # pylint: disable=protected-access
+    spec = copy.deepcopy(BASIC_SPEC)
+    spec["components"]["schemas"]["Other"] = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "other",
+        "type": "object",
+    }
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(spec))
+    cache_dir = str(tmp_path / "cache")
+    models_file = tmp_path / "models.py"
+    open_alchemy.init_yaml(
+        str(spec_file), cache_dir=cache_dir, models_filename=str(models_file)
+    )
+    spec["components"]["schemas"]["Other"]["description"] = "Changed description."
+    spec_file.write_text(yaml.dump(spec))
+    generated_names = []
+    generate = models_file_module._model.generate
+
+    def _generate(*, artifacts, name):
+        generated_names.append(name)
+        return generate(artifacts=artifacts, name=name)
+
+    monkeypatch.setattr(models_file_module._model, "generate", _generate)
+
+    open_alchemy.init_yaml(
+        str(spec_file), cache_dir=cache_dir, models_filename=str(models_file)
+    )
+    assert generated_names == ["Other"]
+    assert "Changed description." in models_file.read_text()
+    os.utime(models_file, (0, 0))
+    open_alchemy.init_yaml(
+        str(spec_file), cache_dir=cache_dir, models_filename=str(models_file)
+    )
+
+    assert models_file.stat().st_mtime == 0
+    assert generated_names == ["Other"]
+
+
+@pytest.mark.integration
+def test_init_yaml_cache_remote(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN specification stored in a YAML file with a remote reference to another YAML
+        file
+    WHEN init_yaml is called with the file and a cache directory, then the remote file
+        changes and init_yaml is called again
+    THEN the schemas are processed again and the model reflects the change.
+    """
+    base_spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {"column": {"$ref": "remote_spec.yaml#/Column"}},
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(base_spec))
+    remote_spec_file = tmp_path / "remote_spec.yaml"
+    remote_spec_file.write_text(
+        yaml.dump({"Column": {"type": "integer", "x-primary-key": True}})
+    )
+    cache_dir = str(tmp_path / "cache")
+    open_alchemy.init_yaml(
+        str(spec_file),
+        cache_dir=cache_dir,
+        registry=open_alchemy.ModelRegistry(),
+    )
+    remote_spec_file.write_text(
+        yaml.dump({"Column": {"type": "string", "x-primary-key": True}})
+    )
+
+    _, model_factory = open_alchemy.init_yaml(
+        str(spec_file),
+        cache_dir=cache_dir,
+        registry=open_alchemy.ModelRegistry(),
+    )
+
+    model = model_factory(name="Table")
+    assert model.column.type.python_type is str
+    assert len(list((tmp_path / "cache").glob("*[0-9a-f].pickle"))) == 2
+
+
 @pytest.mark.integration
 def test_init_yaml_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_store):
     """
@@ -364,6 +686,54 @@ def test_init_yaml_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_yaml_remote_stats(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN specification stored in a YAML file with remote references to another YAML
+        file
+    WHEN init_yaml is called with the file and a registry and get_remote_stats is
+        called with and without the registry
+    THEN the stats of the references resolved by the initialization are returned
+        with the registry.
+    """
+    base_spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {
+                        "column": {"$ref": "remote_spec.yaml#/Column"},
+                        "other": {"$ref": "remote_spec.yaml#/Other"},
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    remote_spec = {
+        "Column": {"type": "integer", "x-primary-key": True},
+        "Other": {"type": "string"},
+    }
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(base_spec))
+    (tmp_path / "remote_spec.yaml").write_text(yaml.dump(remote_spec))
+    registry = open_alchemy.ModelRegistry()
+
+    open_alchemy.init_yaml(str(spec_file), registry=registry)
+
+    returned_stats = open_alchemy.helpers.ref.get_remote_stats(registry=registry)
+    assert list(returned_stats) == ["remote_spec.yaml"]
+    stats = returned_stats["remote_spec.yaml"]
+    assert stats.misses == 2
+    assert stats.hits > 0
+    assert stats.load_seconds >= 0
+    assert open_alchemy.helpers.ref.get_remote_stats() == {}
+    assert (
+        open_alchemy.helpers.ref.get_remote_stats(registry=open_alchemy.ModelRegistry())
+        == {}
+    )
+
+
 @pytest.mark.integration
 def test_init_yaml_import_error():
     """
@@ -602,9 +972,9 @@ class TTable({expected_model_base}):
         ...
 
     @classmethod
-    def from_str(cls, value: str) -> "TTable":
+    def from_str(cls, value: typing.Union[str, bytes]) -> "TTable":
         """
-        Construct from a JSON string (eg. a POST payload).
+        Construct from a JSON string or bytes (eg. a POST payload).
 
         Returns:
             Model instance based on the JSON string.
@@ -612,6 +982,22 @@ class TTable({expected_model_base}):
         """
         ...
 
+    @classmethod
+    def from_dicts(
+        cls,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        errors: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> typing.Iterator["TTable"]:
+        """
+        Construct from dictionaries (eg. a batch of POST payloads).
+
+        Returns:
+            Iterator with a model instance based on each dictionary.
+
+        """
+        ...
+
     def to_dict(self) -> TableDict:
         """
         Convert to a dictionary (eg. to send back for a GET request).
@@ -622,6 +1008,41 @@ class TTable({expected_model_base}):
         """
         ...
 
+    @classmethod
+    def to_dicts(
+        cls,
+        instances: typing.Iterable["TTable"],
+        *,
+        errors: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> typing.Iterator[TableDict]:
+        """
+        Convert model instances to dictionaries (eg. to send back for a GET request).
+
+        Returns:
+            Iterator with a dictionary based on each model instance.
+
+        """
+        ...
+
+    @classmethod
+    def stream_json(
+        cls,
+        instances: typing.Iterable["TTable"],
+        fp: typing.TextIO,
+        *,
+        chunk_size: int = 1000,
+        ndjson: bool = False,
+        errors: typing.Optional[typing.List[typing.Any]] = None,
+    ) -> int:
+        """
+        Write model instances to a file as JSON (eg. to send back for a GET request).
+
+        Returns:
+            The number of instances written.
+
+        """
+        ...
+
     def to_str(self) -> str:
         """
         Convert to a JSON string (eg. to send back for a GET request).
@@ -794,3 +1215,39 @@ def test_build_yaml_import_error():
     with mock.patch.dict("sys.modules", {"yaml": None}):
         with pytest.raises(ImportError):
             open_alchemy.build_yaml("some file", "some package", "some path")
+
+
+@pytest.mark.integration
+def test_init_yaml_profile(tmp_path, caplog, monkeypatch):
+    """
+    GIVEN specification stored in a YAML file and the profiling environment variable
+    WHEN init_yaml is called with the file, a models file and a profile
+    THEN each stage and model is recorded in the profile and the profile is logged.
+    """
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    models_file = directory / "models.py"
+    monkeypatch.setenv(open_alchemy.profiling.ENV_VAR, "1")
+    profile = open_alchemy.Profile()
+
+    with caplog.at_level(logging.INFO, logger="open_alchemy.profiling"):
+        open_alchemy.init_yaml(
+            str(spec_file), models_filename=str(models_file), profile=profile
+        )
+
+    assert list(profile.stages) == [
+        "load_spec",
+        "remote_prefetch",
+        "schemas.validation",
+        "schemas.backref",
+        "schemas.foreign_key",
+        "schemas.association",
+        "artifacts",
+        "models_file",
+        "define_all",
+    ]
+    assert all(timing.calls == 1 for timing in profile.stages.values())
+    assert list(profile.models) == ["Table"]
+    assert "startup profile" in caplog.text
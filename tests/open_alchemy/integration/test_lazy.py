@@ -0,0 +1,215 @@
+"""Integration tests for defining models lazily."""
+
+import copy
+import json
+import threading
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import models
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "type": "object",
+                "x-tablename": "employee",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/Division"},
+                            {"x-backref": "employees"},
+                        ]
+                    },
+                },
+            },
+            "Division": {
+                "type": "object",
+                "x-tablename": "division",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+            },
+            "Parent": {
+                "type": "object",
+                "x-tablename": "parent",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            },
+            "Child": {
+                "allOf": [
+                    {
+                        "type": "object",
+                        "x-inherits": True,
+                        "x-tablename": "child",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "parent.id",
+                            },
+                        },
+                    },
+                    {"$ref": "#/components/schemas/Parent"},
+                ]
+            },
+            "Unrelated": {
+                "type": "object",
+                "x-tablename": "unrelated",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            },
+        }
+    }
+}
+
+
+@pytest.mark.integration
+def test_lazy_not_defined():
+    """
+    GIVEN specification
+    WHEN init_model_factory is called with lazy
+    THEN no models are defined.
+    """
+    base = declarative.declarative_base()
+
+    open_alchemy.init_model_factory(base=base, spec=copy.deepcopy(SPEC), lazy=True)
+
+    assert not base.metadata.tables
+    assert "Employee" not in models.__dict__
+
+
+@pytest.mark.integration
+def test_lazy_access(engine, sessionmaker):
+    """
+    GIVEN specification
+    WHEN init_model_factory is called with lazy and a model is accessed on models
+    THEN the model and the models it is related to are defined and can be used.
+    """
+    base = declarative.declarative_base()
+    open_alchemy.init_model_factory(base=base, spec=copy.deepcopy(SPEC), lazy=True)
+
+    from open_alchemy.models import (  # pylint: disable=import-outside-toplevel
+        Division,
+    )
+
+    assert set(base.metadata.tables) == {"employee", "division"}
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    division = Division.from_dict(id=1, name="engineering")
+    session.add(division)
+    session.add(models.Employee(id=2, division=division))
+    session.flush()
+    queried_division = session.query(Division).first()
+    assert [employee.id for employee in queried_division.employees] == [2]
+
+
+@pytest.mark.integration
+def test_lazy_inheritance():
+    """
+    GIVEN specification with a child schema
+    WHEN init_model_factory is called with lazy and the child is accessed
+    THEN the parent is defined before the child.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base, spec=copy.deepcopy(SPEC), lazy=True
+    )
+
+    child = model_factory(name="Child")
+
+    assert issubclass(child, models.Parent)
+    assert set(base.metadata.tables) == {"parent", "child"}
+
+
+@pytest.mark.integration
+def test_lazy_missing():
+    """
+    GIVEN specification
+    WHEN init_model_factory is called with lazy and a model that is not in the
+        specification is accessed
+    THEN AttributeError is raised.
+    """
+    open_alchemy.init_model_factory(
+        base=declarative.declarative_base(), spec=copy.deepcopy(SPEC), lazy=True
+    )
+
+    assert getattr(models, "Missing", None) is None
+    with pytest.raises(AttributeError):
+        models.Missing  # pylint: disable=pointless-statement
+
+
+@pytest.mark.integration
+def test_lazy_threads():
+    """
+    GIVEN specification
+    WHEN init_model_factory is called with lazy and a model is accessed concurrently
+    THEN the model is defined once.
+    """
+    base = declarative.declarative_base()
+    open_alchemy.init_model_factory(base=base, spec=copy.deepcopy(SPEC), lazy=True)
+    accessed = []
+
+    def access():
+        accessed.append(models.Unrelated)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(accessed) == 8
+    assert all(model is accessed[0] for model in accessed)
+
+
+@pytest.mark.integration
+def test_not_lazy_after_lazy():
+    """
+    GIVEN init_model_factory has been called with lazy
+    WHEN init_model_factory is called without lazy
+    THEN all models are defined and models are no longer defined on access.
+    """
+    open_alchemy.init_model_factory(
+        base=declarative.declarative_base(), spec=copy.deepcopy(SPEC), lazy=True
+    )
+
+    base = declarative.declarative_base()
+    open_alchemy.init_model_factory(base=base, spec=copy.deepcopy(SPEC))
+
+    assert len(base.metadata.tables) == 5
+    assert "__getattr__" not in models.__dict__
+
+
+@pytest.mark.integration
+def test_lazy_remote_thread(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN specification with a remote reference
+    WHEN init_model_factory is called with lazy and the path to the specification
+        and the model is accessed in another thread
+    THEN the remote reference is resolved relative to the specification.
+    """
+    remote_schemas = {
+        "Table": {
+            "type": "object",
+            "x-tablename": "table",
+            "properties": {"column": {"type": "string", "x-primary-key": True}},
+        }
+    }
+    (tmp_path / "remote.json").write_text(json.dumps(remote_schemas))
+    spec = {"components": {"schemas": {"Table": {"$ref": "remote.json#/Table"}}}}
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base, spec=spec, spec_path=str(tmp_path / "spec.json"), lazy=True
+    )
+    defined_models = []
+
+    thread = threading.Thread(
+        target=lambda: defined_models.append(model_factory(name="Table"))
+    )
+    thread.start()
+    thread.join()
+
+    assert defined_models[0].__table__.c.column.type.python_type == str
@@ -0,0 +1,126 @@
+"""Integration tests for loading specifications into separate registries."""
+
+import concurrent.futures
+import copy
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "type": "object",
+                "x-tablename": "employee",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/Division"},
+                            {"x-backref": "employees"},
+                        ]
+                    },
+                },
+            },
+            "Division": {
+                "type": "object",
+                "x-tablename": "division",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+            },
+            "Manager": {
+                "allOf": [
+                    {
+                        "type": "object",
+                        "x-inherits": True,
+                        "x-tablename": "manager",
+                        "properties": {
+                            "id": {
+                                "type": "integer",
+                                "x-primary-key": True,
+                                "x-foreign-key": "employee.id",
+                            },
+                        },
+                    },
+                    {"$ref": "#/components/schemas/Employee"},
+                ]
+            },
+        }
+    }
+}
+
+
+def _init(*, lazy: bool) -> open_alchemy.ModelRegistry:
+    """Initialize the specification into a new registry."""
+    registry = open_alchemy.ModelRegistry()
+    open_alchemy.init_model_factory(
+        base=declarative.declarative_base(),
+        spec=copy.deepcopy(SPEC),
+        lazy=lazy,
+        registry=registry,
+    )
+    return registry
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.integration
+def test_registries_separate(lazy):
+    """
+    GIVEN specification
+    WHEN init_model_factory is called twice with a different registry
+    THEN each registry has its own models that refer to the models in the same
+        registry.
+    """
+    first = _init(lazy=lazy)
+    second = _init(lazy=lazy)
+
+    for registry in (first, second):
+        assert registry.Manager.__mro__[1] is registry.Employee
+        employee = registry.Employee.from_dict(
+            id=1, division={"id": 2, "name": "division 1"}
+        )
+        assert isinstance(employee.division, registry.Division)
+        manager = registry.Manager.from_dict(id=3)
+        assert manager.to_dict() == {"id": 3}
+        assert registry.Base.metadata.tables.keys() >= {"employee", "division"}
+    assert first.Employee is not second.Employee
+    assert first.Base is not second.Base
+    assert getattr(open_alchemy.models, "Employee", None) not in (
+        first.Employee,
+        second.Employee,
+    )
+
+
+@pytest.mark.integration
+def test_registries_lazy_threads():
+    """
+    GIVEN specification
+    WHEN init_model_factory is called lazily with a different registry in different
+        threads and the models are accessed at the same time
+    THEN each registry has its own models.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        registries = list(executor.map(lambda _: _init(lazy=True), range(2)))
+        managers = list(executor.map(lambda registry: registry.Manager, registries))
+
+    for registry, manager in zip(registries, managers):
+        assert manager is registry.Manager
+        assert manager.__mro__[1] is registry.Employee
+    assert managers[0] is not managers[1]
+
+
+@pytest.mark.integration
+def test_registry_missing():
+    """
+    GIVEN specification initialized lazily into a registry
+    WHEN a model that is not in the specification is accessed
+    THEN AttributeError is raised.
+    """
+    registry = _init(lazy=True)
+
+    with pytest.raises(AttributeError):
+        registry.Missing  # pylint: disable=pointless-statement
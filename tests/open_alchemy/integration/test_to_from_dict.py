@@ -1,6 +1,11 @@
 """Integration tests for from_dict and to_dict."""
 
+import io
+import json
+from unittest import mock
+
 import pytest
+from sqlalchemy import orm
 from sqlalchemy.ext import declarative
 
 import open_alchemy
@@ -587,3 +592,279 @@ def test_inheritance(engine, sessionmaker):
     assert queried_employee.to_dict() == employee_dict
     queried_manager = session.query(manager).first()
     assert queried_manager.to_dict() == manager_dict
+
+
+@pytest.mark.integration
+def test_to_from_dicts(engine, sessionmaker):
+    """
+    GIVEN specification that has a schema
+    WHEN model is defined based on schema and constructed using from_dicts
+    THEN when to_dicts is called the construction dictionaries are returned.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to dictionaries
+    model_dicts = [{"id": 1, "name": "name 1"}, {"id": 2, "name": "name 2"}]
+    session = sessionmaker()
+    session.add_all(model.from_dicts(model_dicts))
+    session.flush()
+    queried_instances = session.query(model).order_by(model.id)
+    assert list(model.to_dicts(queried_instances)) == model_dicts
+
+
+@pytest.mark.parametrize(
+    "validation_level, value, expected_exception",
+    [
+        pytest.param(
+            open_alchemy.ValidationLevel.FULL,
+            "a" * 11,
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="full",
+        ),
+        pytest.param(open_alchemy.ValidationLevel.TYPES, "a" * 11, None, id="types"),
+        pytest.param(
+            open_alchemy.ValidationLevel.TYPES,
+            1,
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="types wrong type",
+        ),
+        pytest.param(
+            open_alchemy.ValidationLevel.NONE,
+            1,
+            open_alchemy.exceptions.InvalidInstanceError,
+            id="none wrong type",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_from_dict_validation_level(validation_level, value, expected_exception):
+    """
+    GIVEN specification with a schema with a string property with a maxLength and a
+        validation level
+    WHEN model is defined with the validation level and from_dict is called
+    THEN the expected exception is raised or the instance is constructed.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string", "maxLength": 10},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+        validation_level=validation_level,
+    )
+    model = model_factory(name="Table")
+
+    if expected_exception is not None:
+        with pytest.raises(expected_exception):
+            model.from_dict(id=1, name=value)
+    else:
+        instance = model.from_dict(id=1, name=value)
+        assert instance.name == value
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({}, id="required missing"),
+        pytest.param({"id": "1"}, id="integer string"),
+        pytest.param({"id": True}, id="integer boolean"),
+        pytest.param({"id": None}, id="integer None"),
+        pytest.param({"id": 1, "name": 1}, id="string integer"),
+        pytest.param({"id": 1, "name": None}, id="string nullable None"),
+        pytest.param({"id": 1, "ref_name": None}, id="string $ref nullable None"),
+        pytest.param({"id": 1, "all_of_name": None}, id="string allOf nullable None"),
+        pytest.param({"id": 1, "salary": 1}, id="number integer"),
+        pytest.param({"id": 1, "salary": "1.1"}, id="number string"),
+        pytest.param({"id": 1, "active": 1}, id="boolean integer"),
+    ],
+)
+@pytest.mark.integration
+def test_from_dict_validation_level_consistent(kwargs):
+    """
+    GIVEN specification with a schema and an invalid dictionary
+    WHEN models are defined with the types and full validation levels and from_dict
+        is called with the dictionary
+    THEN the same exception is raised for both validation levels.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Name": {"type": "string", "nullable": True},
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string", "nullable": True},
+                        "ref_name": {"$ref": "#/components/schemas/Name"},
+                        "all_of_name": {
+                            "allOf": [{"type": "string"}, {"nullable": True}]
+                        },
+                        "salary": {"type": "number"},
+                        "active": {"type": "boolean"},
+                    },
+                    "required": ["id"],
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    exceptions = []
+    for validation_level in (
+        open_alchemy.ValidationLevel.TYPES,
+        open_alchemy.ValidationLevel.FULL,
+    ):
+        model_factory = open_alchemy.init_model_factory(
+            base=declarative.declarative_base(),
+            spec=spec,
+            validation_level=validation_level,
+        )
+        model = model_factory(name="Table")
+
+        with pytest.raises(open_alchemy.exceptions.BaseError) as exc:
+            model.from_dict(**kwargs)
+        exceptions.append(exc.type)
+
+    assert exceptions[0] == exceptions[1]
+
+
+@pytest.mark.integration
+def test_stream_json_query(engine, sessionmaker):
+    """
+    GIVEN specification that has a schema and instances of the model in the database
+    WHEN stream_json is called with a query for the instances
+    THEN the query is consumed in chunks and the JSON of the instances is written.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    base.metadata.create_all(engine)
+    model_dicts = [{"id": index, "name": f"name {index}"} for index in range(1, 6)]
+    session = sessionmaker()
+    session.add_all(model.from_dicts(model_dicts))
+    session.flush()
+    query = session.query(model).order_by(model.id)
+    fp = io.StringIO()
+
+    with mock.patch.object(
+        type(query), "yield_per", autospec=True, side_effect=type(query).yield_per
+    ) as mocked_yield_per:
+        count = model.stream_json(query, fp, chunk_size=2, ndjson=True)
+
+    mocked_yield_per.assert_called_once_with(query, 2)
+    assert count == len(model_dicts)
+    assert [json.loads(line) for line in fp.getvalue().splitlines()] == model_dicts
+
+
+@pytest.mark.parametrize(
+    "load_option",
+    [
+        pytest.param(orm.joinedload, id="joined"),
+        pytest.param(orm.subqueryload, id="subquery"),
+        pytest.param(orm.selectinload, id="selectin"),
+    ],
+)
+@pytest.mark.integration
+def test_stream_json_query_eager_load(engine, sessionmaker, load_option):
+    """
+    GIVEN specification that has a schema with a one to many relationship and
+        instances of the model in the database
+    WHEN stream_json is called with a query for the instances that eagerly loads the
+        relationship
+    THEN the JSON of the instances with the relationship is written.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "RefTable": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                        },
+                        "x-tablename": "ref_table",
+                        "type": "object",
+                    },
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "ref_tables": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/RefTable"},
+                            },
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    base.metadata.create_all(engine)
+    model_dicts = [
+        {"id": 1, "ref_tables": [{"id": 11}, {"id": 12}]},
+        {"id": 2, "ref_tables": [{"id": 21}]},
+        {"id": 3, "ref_tables": []},
+    ]
+    session = sessionmaker()
+    session.add_all(model.from_dicts(model_dicts))
+    session.flush()
+    session.expire_all()
+    query = (
+        session.query(model).options(load_option(model.ref_tables)).order_by(model.id)
+    )
+    fp = io.StringIO()
+
+    count = model.stream_json(query, fp, chunk_size=2, ndjson=True)
+
+    assert count == len(model_dicts)
+    assert [json.loads(line) for line in fp.getvalue().splitlines()] == model_dicts
@@ -0,0 +1,260 @@
+"""Tests for generating the models file incrementally and writing it."""
+# pylint: disable=protected-access
+
+import shutil
+
+import pytest
+
+import open_alchemy
+
+from open_alchemy import models_file
+from open_alchemy.schemas import artifacts as schemas_artifacts
+
+
+def _construct_model_artifacts(description):
+    """Construct model artifacts"""
+    return schemas_artifacts.types.ModelArtifacts(
+        tablename="tablename",
+        inherits=None,
+        parent=None,
+        description=description,
+        mixins=None,
+        kwargs=None,
+        composite_index=None,
+        composite_unique=None,
+        backrefs=[],
+        properties=[],
+    )
+
+
+@pytest.mark.parametrize(
+    "name_1, description_1, name_2, description_2, expected_equal",
+    [
+        pytest.param("Model", "model", "Model", "model", True, id="same"),
+        pytest.param("Model", "model", "Model2", "model", False, id="name different"),
+        pytest.param(
+            "Model", "model", "Model", "model 2", False, id="artifacts different"
+        ),
+    ],
+)
+@pytest.mark.models_file
+def test_calculate_model_key(
+    name_1, description_1, name_2, description_2, expected_equal
+):
+    """
+    GIVEN the names and artifacts of two models
+    WHEN calculate_model_key is called with each model
+    THEN the keys are equal if expected.
+    """
+    key_1 = models_file.calculate_model_key(
+        name=name_1, artifacts=_construct_model_artifacts(description_1)
+    )
+    key_2 = models_file.calculate_model_key(
+        name=name_2, artifacts=_construct_model_artifacts(description_2)
+    )
+
+    assert (key_1 == key_2) == expected_equal
+
+
+@pytest.fixture
+def templates_directory(tmp_path, monkeypatch):
+    """Use a copy of the templates to calculate the key of the models."""
+    directory = tmp_path / "models_file"
+    shutil.copytree(models_file._TEMPLATES_DIRECTORY, directory)
+    monkeypatch.setattr(models_file, "_TEMPLATES_DIRECTORY", str(directory))
+    models_file._calculate_templates_hash.cache_clear()
+    yield directory
+    models_file._calculate_templates_hash.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "template, expected_equal",
+    [
+        pytest.param(None, True, id="unchanged"),
+        pytest.param("model/sqlalchemy.j2", False, id="model template changed"),
+        pytest.param("models/template.j2", False, id="models template changed"),
+    ],
+)
+@pytest.mark.models_file
+def test_calculate_model_key_template(templates_directory, template, expected_equal):
+    """
+    GIVEN model and the template that changes
+    WHEN calculate_model_key is called before and after the template changes
+    THEN the keys are equal if expected.
+    """
+    artifacts = _construct_model_artifacts("model")
+    key_1 = models_file.calculate_model_key(name="Model", artifacts=artifacts)
+    if template is not None:
+        with open(templates_directory / template, "a") as out_file:
+            out_file.write("{# changed #}\n")
+    models_file._calculate_templates_hash.cache_clear()
+
+    key_2 = models_file.calculate_model_key(name="Model", artifacts=artifacts)
+
+    assert (key_1 == key_2) == expected_equal
+
+
+@pytest.mark.models_file
+def test_calculate_model_key_version(monkeypatch):
+    """
+    GIVEN model
+    WHEN calculate_model_key is called before and after the version of OpenAlchemy
+        changes
+    THEN the keys are different.
+    """
+    artifacts = _construct_model_artifacts("model")
+    key_1 = models_file.calculate_model_key(name="Model", artifacts=artifacts)
+    monkeypatch.setattr(open_alchemy, "__version__", "0.0.0")
+
+    key_2 = models_file.calculate_model_key(name="Model", artifacts=artifacts)
+
+    assert key_1 != key_2
+
+
+@pytest.mark.models_file
+def test_generate_incremental_template_changed(templates_directory, monkeypatch):
+    """
+    GIVEN artifacts of models
+    WHEN generate_incremental is called, then a template changes and
+        generate_incremental is called with the returned model sources
+    THEN all the models are generated again.
+    """
+    artifacts = {
+        "Model1": _construct_model_artifacts("model 1"),
+        "Model2": _construct_model_artifacts("model 2"),
+    }
+    _, model_sources = models_file.generate_incremental(
+        artifacts=artifacts, model_sources={}
+    )
+    with open(templates_directory / "model" / "template.j2", "a") as out_file:
+        out_file.write("{# changed #}\n")
+    models_file._calculate_templates_hash.cache_clear()
+    generated_names = []
+    generate = models_file._model.generate
+
+    def _generate(*, artifacts, name):
+        generated_names.append(name)
+        return generate(artifacts=artifacts, name=name)
+
+    monkeypatch.setattr(models_file._model, "generate", _generate)
+
+    _, changed_model_sources = models_file.generate_incremental(
+        artifacts=artifacts, model_sources=model_sources
+    )
+
+    assert generated_names == ["Model1", "Model2"]
+    assert set(changed_model_sources).isdisjoint(model_sources)
+
+
+@pytest.mark.models_file
+def test_generate_incremental(monkeypatch):
+    """
+    GIVEN artifacts of models
+    WHEN generate_incremental is called, then one of the models changes and
+        generate_incremental is called with the returned model sources
+    THEN only the changed model is generated again and the models file is the same as
+        the one returned by generate.
+    """
+    artifacts = {
+        "Model1": _construct_model_artifacts("model 1"),
+        "Model2": _construct_model_artifacts("model 2"),
+    }
+    source, model_sources = models_file.generate_incremental(
+        artifacts=artifacts, model_sources={}
+    )
+    artifacts["Model2"] = _construct_model_artifacts("model 2 changed")
+    expected_source = models_file.generate(artifacts=artifacts)
+    generated_names = []
+    generate = models_file._model.generate
+
+    def _generate(*, artifacts, name):
+        generated_names.append(name)
+        return generate(artifacts=artifacts, name=name)
+
+    monkeypatch.setattr(models_file._model, "generate", _generate)
+
+    changed_source, changed_model_sources = models_file.generate_incremental(
+        artifacts=artifacts, model_sources=model_sources
+    )
+
+    assert source != changed_source
+    assert changed_source == expected_source
+    assert generated_names == ["Model2"]
+    assert len(changed_model_sources) == 2
+    assert list(changed_model_sources.values())[0] == list(model_sources.values())[0]
+    assert list(changed_model_sources.keys())[1] not in model_sources
+
+
+@pytest.mark.parametrize(
+    "contents, expected_written",
+    [
+        pytest.param(None, True, id="missing"),
+        pytest.param("old source", True, id="different"),
+        pytest.param("source", False, id="same"),
+    ],
+)
+@pytest.mark.models_file
+def test_write(tmp_path, contents, expected_written):
+    """
+    GIVEN models file with contents
+    WHEN write is called with the source
+    THEN the file is only written if the contents differ.
+    """
+    models_filename = tmp_path / "models.py"
+    if contents is not None:
+        models_filename.write_text(contents)
+
+    written = models_file.write(filename=str(models_filename), source="source")
+
+    assert written == expected_written
+    assert models_filename.read_text() == "source"
+
+
+@pytest.mark.parametrize(
+    "workers",
+    [pytest.param(None, id="sequential"), pytest.param(2, id="parallel")],
+)
+@pytest.mark.models_file
+def test_generate_workers_timings(workers):
+    """
+    GIVEN artifacts of models and workers
+    WHEN generate is called with the artifacts, workers and timings
+    THEN the same models file is returned as without workers and the time taken to
+        generate each model is recorded in the order of the models.
+    """
+    artifacts = {
+        f"Model{index}": _construct_model_artifacts(f"model {index}")
+        for index in range(5)
+    }
+    expected_source = models_file.generate(artifacts=artifacts)
+    timings = []
+
+    source = models_file.generate(artifacts=artifacts, workers=workers, timings=timings)
+
+    assert source == expected_source
+    assert [timing.name for timing in timings] == list(artifacts)
+    assert all(timing.seconds >= 0 for timing in timings)
+
+
+@pytest.mark.models_file
+def test_generate_incremental_timings():
+    """
+    GIVEN artifacts of models and the source of one of the models
+    WHEN generate_incremental is called with the artifacts, sources and timings
+    THEN only the time taken to generate the other model is recorded.
+    """
+    artifacts = {
+        "Model1": _construct_model_artifacts("model 1"),
+        "Model2": _construct_model_artifacts("model 2"),
+    }
+    _, model_sources = models_file.generate_incremental(
+        artifacts=artifacts, model_sources={}
+    )
+    del model_sources[list(model_sources)[1]]
+    timings = []
+
+    models_file.generate_incremental(
+        artifacts=artifacts, model_sources=model_sources, timings=timings
+    )
+
+    assert [timing.name for timing in timings] == ["Model2"]
@@ -0,0 +1,131 @@
+"""Tests for the models related to each model."""
+
+import copy
+
+import pytest
+
+from open_alchemy import schemas as schemas_module
+from open_alchemy.schemas import artifacts
+
+SCHEMAS = {
+    "Employee": {
+        "type": "object",
+        "x-tablename": "employee",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "division": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Division"},
+                    {"x-backref": "employees"},
+                ]
+            },
+            "projects": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/Project"},
+            },
+            "manager_id": {"type": "integer", "x-foreign-key": "manager.id"},
+        },
+    },
+    "Division": {
+        "type": "object",
+        "x-tablename": "division",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "Project": {
+        "type": "object",
+        "x-tablename": "project",
+        "x-secondary": "employee_project",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "Manager": {
+        "type": "object",
+        "x-tablename": "manager",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "Parent": {
+        "type": "object",
+        "x-tablename": "parent",
+        "x-kwargs": {"__mapper_args__": {"polymorphic_on": "type"}},
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "type": {"type": "string"},
+        },
+    },
+    "Child": {
+        "allOf": [
+            {
+                "type": "object",
+                "x-inherits": True,
+                "properties": {"value": {"type": "string"}},
+            },
+            {"$ref": "#/components/schemas/Parent"},
+        ]
+    },
+    "Unrelated": {
+        "type": "object",
+        "x-tablename": "unrelated",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def related():
+    """Calculate the related models for the schemas."""
+    schemas = copy.deepcopy(SCHEMAS)
+    schemas_module.process(schemas=schemas)
+    models_artifacts = artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+    return artifacts.related.get(artifacts=models_artifacts)
+
+
+@pytest.mark.parametrize(
+    "name, expected_related",
+    [
+        pytest.param(
+            "Employee",
+            {"Division", "Project", "EmployeeProject", "Manager"},
+            id="relationships and foreign key",
+        ),
+        pytest.param("Division", {"Employee"}, id="backref"),
+        pytest.param("Project", set(), id="many-to-many without backref"),
+        pytest.param("EmployeeProject", {"Employee", "Project"}, id="association"),
+        pytest.param("Manager", set(), id="foreign key target"),
+        pytest.param("Parent", {"Child"}, id="parent"),
+        pytest.param("Child", {"Parent"}, id="child"),
+        pytest.param("Unrelated", set(), id="unrelated"),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.artifacts
+def test_get(related, name, expected_related):
+    """
+    GIVEN schemas and the name of a model
+    WHEN get is called with the artifacts of the schemas
+    THEN the expected related models are returned for the model.
+    """
+    assert related[name] == expected_related
+
+
+@pytest.mark.parametrize(
+    "name, expected_names",
+    [
+        pytest.param("Unrelated", {"Unrelated"}, id="unrelated"),
+        pytest.param(
+            "Division",
+            {"Division", "Employee", "Project", "EmployeeProject", "Manager"},
+            id="transitive",
+        ),
+        pytest.param("Manager", {"Manager"}, id="no outgoing"),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.artifacts
+def test_closure(related, name, expected_names):
+    """
+    GIVEN related models and the name of a model
+    WHEN closure is called with the name and related models
+    THEN the expected names are returned.
+    """
+    assert artifacts.related.closure(name=name, related=related) == expected_names
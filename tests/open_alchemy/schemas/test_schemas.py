@@ -1,8 +1,11 @@
 """Tests for schemas."""
 
+from unittest import mock
+
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import schemas as schemas_module
 from open_alchemy.schemas import process
 
 
@@ -19,6 +22,51 @@ def test_process_invalid():
         process(schemas=schemas)
 
 
+@pytest.mark.parametrize(
+    "workers, expected_calls",
+    [
+        pytest.param(None, [mock.call(schemas={})], id="workers not passed"),
+        pytest.param(2, [mock.call(schemas={}, workers=2)], id="workers passed"),
+    ],
+)
+@pytest.mark.schemas
+def test_process_workers(monkeypatch, workers, expected_calls):
+    """
+    GIVEN number of workers
+    WHEN process is called with the workers
+    THEN the validation stage is called with the workers if they are passed.
+    """
+    mock_validation = mock.MagicMock()
+    monkeypatch.setattr(
+        schemas_module,
+        "STAGES",
+        (
+            schemas_module.Stage(
+                name="validation",
+                process=mock_validation,
+                process_parallel=mock_validation,
+            ),
+        ),
+    )
+
+    process(schemas={}, workers=workers)
+
+    assert mock_validation.call_args_list == expected_calls
+
+
+@pytest.mark.schemas
+def test_process_workers_invalid():
+    """
+    GIVEN invalid schemas
+    WHEN process is called with the schemas and workers
+    THEN MalformedSchemaError is raised.
+    """
+    schemas = {"Schema": {"x-tablename": "schema"}}
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        process(schemas=schemas, workers=2)
+
+
 @pytest.mark.schemas
 def test_process_backref_foreign_key():
     """
@@ -173,3 +221,30 @@ def test_process_association():
         },
     }
     assert schemas == expected_schemas
+
+
+@pytest.mark.schemas
+def test_process_timings():
+    """
+    GIVEN schemas and timings list
+    WHEN process is called with the schemas and timings
+    THEN the time taken by each stage is appended to the timings.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "schema",
+            "type": "object",
+            "properties": {"id": {"type": "integer"}},
+        }
+    }
+    timings = []
+
+    process(schemas=schemas, timings=timings)
+
+    assert [timing.name for timing in timings] == [
+        "validation",
+        "backref",
+        "foreign_key",
+        "association",
+    ]
+    assert all(timing.seconds >= 0 for timing in timings)
@@ -259,6 +259,58 @@ def test_process(schemas, raises):
         validation.process(schemas=schemas)
 
 
+@pytest.mark.parametrize("schemas, raises", PROCESS_TESTS)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_workers(schemas, raises):
+    """
+    GIVEN schemas and whether an exception is expected
+    WHEN process is called with the schemas and workers
+    THEN MalformedSchemaError is raised is raises is set otherwise it is not.
+    """
+    if raises:
+        with pytest.raises(exceptions.MalformedSchemaError):
+            validation.process(schemas=schemas, workers=2)
+    else:
+        validation.process(schemas=schemas, workers=2)
+
+
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_workers_error():
+    """
+    GIVEN schemas with multiple invalid models and models with invalid properties
+    WHEN process is called with the schemas with and without workers
+    THEN the same error is raised.
+    """
+    valid_schema = {
+        "type": "object",
+        "x-tablename": "table",
+        "properties": {"prop_1": {"type": "integer"}},
+    }
+    schemas = {
+        **{
+            f"Schema{index}": {**valid_schema, "x-tablename": f"table_{index}"}
+            for index in range(8)
+        },
+        "InvalidProperties1": {
+            **valid_schema,
+            "x-tablename": "invalid_properties_1",
+            "properties": {"prop_1": {}},
+        },
+        "InvalidModel1": {"x-tablename": "invalid_model_1", "type": "object"},
+        "InvalidModel2": {"x-tablename": "invalid_model_2", "type": "object"},
+    }
+
+    with pytest.raises(exceptions.MalformedSchemaError) as sequential_exc:
+        validation.process(schemas=schemas)
+    with pytest.raises(exceptions.MalformedSchemaError) as parallel_exc:
+        validation.process(schemas=schemas, workers=3)
+
+    assert str(parallel_exc.value) == str(sequential_exc.value)
+    assert str(parallel_exc.value).startswith("InvalidModel1 :: ")
+
+
 CHECK_TESTS = [
     pytest.param(
         True,
@@ -656,3 +708,17 @@ def test_check(spec, expected_result):
     returned_result = validation.check(spec=spec)
 
     assert returned_result == expected_result
+
+
+@pytest.mark.parametrize("spec, expected_result", CHECK_TESTS)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_check_workers(spec, expected_result):
+    """
+    GIVEN spec and the expected result
+    WHEN check is called with the spec and workers
+    THEN the expected result is returned.
+    """
+    returned_result = validation.check(spec=spec, workers=2)
+
+    assert returned_result == expected_result
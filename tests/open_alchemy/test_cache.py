@@ -0,0 +1,243 @@
+"""Tests for the cache of processed schemas and artifacts."""
+
+import os
+import stat
+
+import pytest
+
+import open_alchemy
+from open_alchemy import cache
+from open_alchemy import helpers
+
+
+@pytest.mark.parametrize(
+    "spec_1, spec_2, expected_equal",
+    [
+        pytest.param({"key": "value 1"}, {"key": "value 1"}, True, id="same"),
+        pytest.param(
+            {"key_1": "value 1", "key_2": "value 2"},
+            {"key_2": "value 2", "key_1": "value 1"},
+            True,
+            id="same different order",
+        ),
+        pytest.param({"key": "value 1"}, {"key": "value 2"}, False, id="different"),
+    ],
+)
+@pytest.mark.cache
+def test_calculate_key(spec_1, spec_2, expected_equal):
+    """
+    GIVEN two specifications and whether their keys are expected to be equal
+    WHEN calculate_key is called with each specification
+    THEN the keys are equal if expected.
+    """
+    key_1 = cache.calculate_key(spec=spec_1)
+    key_2 = cache.calculate_key(spec=spec_2)
+
+    assert (key_1 == key_2) == expected_equal
+
+
+@pytest.mark.parametrize(
+    "remote_documents_1, remote_documents_2, expected_equal",
+    [
+        pytest.param(None, {}, True, id="none"),
+        pytest.param(
+            {"remote.yaml": {"key": "value 1"}},
+            {"remote.yaml": {"key": "value 1"}},
+            True,
+            id="same",
+        ),
+        pytest.param(None, {"remote.yaml": {"key": "value 1"}}, False, id="added"),
+        pytest.param(
+            {"remote.yaml": {"key": "value 1"}},
+            {"remote.yaml": {"key": "value 2"}},
+            False,
+            id="different",
+        ),
+    ],
+)
+@pytest.mark.cache
+def test_calculate_key_remote_documents(
+    remote_documents_1, remote_documents_2, expected_equal
+):
+    """
+    GIVEN specification and two sets of remote documents and whether their keys are
+        expected to be equal
+    WHEN calculate_key is called with the specification and each set of documents
+    THEN the keys are equal if expected.
+    """
+    spec = {"key": "value"}
+
+    key_1 = cache.calculate_key(spec=spec, remote_documents=remote_documents_1)
+    key_2 = cache.calculate_key(spec=spec, remote_documents=remote_documents_2)
+
+    assert (key_1 == key_2) == expected_equal
+
+
+@pytest.mark.cache
+def test_calculate_key_version(monkeypatch):
+    """
+    GIVEN specification
+    WHEN calculate_key is called before and after the version of OpenAlchemy changes
+    THEN the keys are different.
+    """
+    spec = {"key": "value"}
+    key_1 = cache.calculate_key(spec=spec)
+    monkeypatch.setattr(open_alchemy, "__version__", "0.0.0")
+
+    key_2 = cache.calculate_key(spec=spec)
+
+    assert key_1 != key_2
+
+
+@pytest.mark.cache
+def test_store_load(tmp_path):
+    """
+    GIVEN entry
+    WHEN store is called with the entry and then load is called with the key
+    THEN an equal entry is returned.
+    """
+    directory = str(tmp_path / "cache")
+    entry = cache.Entry(
+        schemas={"Schema": {"key": "value"}}, artifacts={}, models_file_artifacts={}
+    )
+
+    cache.store(directory=directory, key="key 1", entry=entry)
+    returned_entry = cache.load(directory=directory, key="key 1")
+
+    assert returned_entry == entry
+    assert [path.suffix for path in (tmp_path / "cache").iterdir()] == [".pickle"]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param(b"", id="empty"),
+        pytest.param(b"not a pickle", id="invalid"),
+    ],
+)
+@pytest.mark.cache
+def test_load_miss(tmp_path, contents):
+    """
+    GIVEN cache directory with an entry file with the contents
+    WHEN load is called with the key
+    THEN None is returned.
+    """
+    if contents is not None:
+        (tmp_path / "key 1.pickle").write_bytes(contents)
+
+    returned_entry = cache.load(directory=str(tmp_path), key="key 1")
+
+    assert returned_entry is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+@pytest.mark.cache
+def test_store_private(tmp_path):
+    """
+    GIVEN cache directory that does not exist
+    WHEN store is called
+    THEN the directory is created so that only the current user can access it.
+    """
+    directory = tmp_path / "cache"
+    entry = cache.Entry(schemas={}, artifacts={}, models_file_artifacts={})
+
+    cache.store(directory=str(directory), key="key 1", entry=entry)
+
+    assert stat.S_IMODE(directory.stat().st_mode) & 0o077 == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+@pytest.mark.cache
+def test_load_not_private(tmp_path):
+    """
+    GIVEN entry in a cache directory that others can write to
+    WHEN load is called with the key
+    THEN None is returned.
+    """
+    directory = tmp_path / "cache"
+    entry = cache.Entry(schemas={}, artifacts={}, models_file_artifacts={})
+    cache.store(directory=str(directory), key="key 1", entry=entry)
+    directory.chmod(0o777)
+
+    returned_entry = cache.load(directory=str(directory), key="key 1")
+
+    assert returned_entry is None
+
+
+@pytest.mark.cache
+def test_load_yaml(tmp_path, monkeypatch):
+    """
+    GIVEN YAML file
+    WHEN load_yaml is called twice, then the file is changed and load_yaml is called
+        again
+    THEN the file is only parsed for the first call and after it changed.
+    """
+    directory = str(tmp_path / "cache")
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text("key: value 1\n")
+    calls = []
+    load = helpers.yaml_.load
+
+    def _load(stream):
+        calls.append(stream)
+        return load(stream)
+
+    monkeypatch.setattr(helpers.yaml_, "load", _load)
+
+    first = cache.load_yaml(directory=directory, filename=str(yaml_file))
+    second = cache.load_yaml(directory=directory, filename=str(yaml_file))
+    yaml_file.write_text("key: value 2\n")
+    changed = cache.load_yaml(directory=directory, filename=str(yaml_file))
+
+    assert first == {"key": "value 1"}
+    assert second == {"key": "value 1"}
+    assert changed == {"key": "value 2"}
+    assert len(calls) == 2
+
+
+@pytest.mark.cache
+def test_load_yaml_invalid_entry(tmp_path):
+    """
+    GIVEN YAML file and cache directory where the entry for the file is invalid
+    WHEN load_yaml is called
+    THEN the file is parsed and the entry is replaced.
+    """
+    directory = tmp_path / "cache"
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text("key: value\n")
+    cache.load_yaml(directory=str(directory), filename=str(yaml_file))
+    (entry_path,) = directory.iterdir()
+    entry_path.write_bytes(b"not a pickle")
+
+    document = cache.load_yaml(directory=str(directory), filename=str(yaml_file))
+
+    assert document == {"key": "value"}
+    assert entry_path.read_bytes() != b"not a pickle"
+
+
+@pytest.mark.cache
+def test_store_load_model_sources(tmp_path):
+    """
+    GIVEN model sources stored for a models file
+    WHEN load_model_sources is called for the models file and another models file
+    THEN the model sources are returned for the models file and nothing for the other
+        models file.
+    """
+    directory = str(tmp_path / "cache")
+    model_sources = {"key 1": "source 1"}
+    cache.store_model_sources(
+        directory=directory,
+        models_filename=str(tmp_path / "models.py"),
+        model_sources=model_sources,
+    )
+
+    returned_model_sources = cache.load_model_sources(
+        directory=directory, models_filename=str(tmp_path / "models.py")
+    )
+    other_model_sources = cache.load_model_sources(
+        directory=directory, models_filename=str(tmp_path / "other_models.py")
+    )
+
+    assert returned_model_sources == model_sources
+    assert other_model_sources == {}
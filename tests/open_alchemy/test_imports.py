@@ -0,0 +1,115 @@
+"""Tests for the modules imported by importing open_alchemy."""
+
+import json
+import subprocess  # nosec: only runs the current interpreter
+import sys
+
+import pytest
+
+# The modules that are imported when they are first used
+_LAZY_MODULES = [
+    "jinja2",
+    "jsonschema",
+    "orjson",
+    "rapidjson",
+    "ujson",
+    "urllib.request",
+    "yaml",
+    "open_alchemy.build",
+    "open_alchemy.cli",
+    "open_alchemy.models_file",
+]
+
+_SPEC = {
+    "components": {
+        "schemas": {
+            "Table": {
+                "type": "object",
+                "x-tablename": "table",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            }
+        }
+    }
+}
+
+
+def _imported_modules(code: str) -> list:
+    """Run the code in a new interpreter and return the lazy modules it imported."""
+    code = (
+        f"import json, sys; {code}; "
+        f"sys.stdout.write(json.dumps([name for name in {_LAZY_MODULES!r} "
+        "if name in sys.modules]))"
+    )
+    result = subprocess.run(  # nosec: only runs the current interpreter
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.init
+def test_import():
+    """
+    GIVEN new interpreter
+    WHEN open_alchemy is imported
+    THEN none of the modules that are imported when they are first used are imported.
+    """
+    assert _imported_modules("import open_alchemy") == []
+
+
+@pytest.mark.init
+def test_import_first_use():
+    """
+    GIVEN new interpreter
+    WHEN open_alchemy is imported, the model factory is initialized and a model is
+        constructed from a dictionary
+    THEN jsonschema is imported when it is first used and the modules for the models
+        file and packages are not imported.
+    """
+    code = (
+        "import open_alchemy; "
+        "from sqlalchemy.ext import declarative; "
+        "factory = open_alchemy.init_model_factory("
+        f"base=declarative.declarative_base(), spec={_SPEC!r}); "
+        "factory(name='Table').from_dict(id=1)"
+    )
+
+    imported_modules = _imported_modules(code)
+
+    assert "jsonschema" in imported_modules
+    assert not {
+        "jinja2",
+        "yaml",
+        "open_alchemy.build",
+        "open_alchemy.models_file",
+    } & set(imported_modules)
+
+
+@pytest.mark.parametrize(
+    "from_dict, expected_jsonschema",
+    [
+        pytest.param(False, False, id="models constructed"),
+        pytest.param(True, True, id="from_dict called"),
+    ],
+)
+@pytest.mark.init
+def test_import_cache(tmp_path, from_dict, expected_jsonschema):
+    """
+    GIVEN new interpreter and cache directory with the processed specification
+    WHEN open_alchemy is imported and the model factory is initialized from the cache
+        with and without constructing a model from a dictionary
+    THEN jsonschema is only imported when a model is constructed from a dictionary.
+    """
+    code = (
+        "import open_alchemy; "
+        "from sqlalchemy.ext import declarative; "
+        "factory = open_alchemy.init_model_factory("
+        f"base=declarative.declarative_base(), spec={_SPEC!r}, "
+        f"cache_dir={str(tmp_path)!r})"
+    )
+    _imported_modules(code)
+    if from_dict:
+        code = f"{code}; factory(name='Table').from_dict(id=1)"
+
+    imported_modules = _imported_modules(code)
+
+    assert ("jsonschema" in imported_modules) == expected_jsonschema
@@ -1,5 +1,7 @@
 """Tests for functions in OpenAlchemy __init__."""
 
+import pathlib
+import re
 from unittest import mock
 
 import pytest
@@ -44,7 +46,9 @@ class TestGetBase:
         name = "Schema"
 
         with pytest.raises(exception):
-            open_alchemy._get_base(name=name, schemas=schemas)
+            open_alchemy._get_base(
+                name=name, schemas=schemas, registry=open_alchemy.models
+            )
 
     @staticmethod
     @pytest.mark.parametrize(
@@ -63,7 +67,9 @@ class TestGetBase:
         setattr(open_alchemy.models, "Base", base)
         name = "Schema"
 
-        returned_base = open_alchemy._get_base(name=name, schemas=schemas)
+        returned_base = open_alchemy._get_base(
+            name=name, schemas=schemas, registry=open_alchemy.models
+        )
 
         assert returned_base == base
 
@@ -103,6 +109,58 @@ class TestGetBase:
         parent = mock.MagicMock()
         setattr(open_alchemy.models, "Parent", parent)
 
-        returned_base = open_alchemy._get_base(name=name, schemas=schemas)
+        returned_base = open_alchemy._get_base(
+            name=name, schemas=schemas, registry=open_alchemy.models
+        )
 
         assert returned_base == parent
+
+
+@pytest.mark.init
+def test_version():
+    """
+    GIVEN pyproject.toml
+    WHEN __version__ and the version of the source of open_alchemy are compared with
+        the version in pyproject.toml
+    THEN they are equal.
+    """
+    # pylint: disable=protected-access
+    path = pathlib.Path(open_alchemy.__file__).parent.parent / "pyproject.toml"
+    match = re.search(r'^version = "(.*)"$', path.read_text(), re.MULTILINE)
+
+    assert match is not None
+    assert open_alchemy.__version__ == match.group(1)
+    assert open_alchemy._VERSION == match.group(1)
+
+
+@pytest.mark.parametrize(
+    "version",
+    [pytest.param("1.2.3", id="installed"), pytest.param(None, id="not installed")],
+)
+@pytest.mark.init
+def test_version_metadata(monkeypatch, version):
+    """
+    GIVEN the version of the installed distribution or that it is not installed
+    WHEN __version__ of open_alchemy is retrieved
+    THEN the version of the distribution or of the source is returned.
+    """
+    # pylint: disable=protected-access
+
+    def _version(name):
+        assert name == "OpenAlchemy"
+        if version is None:
+            raise metadata.PackageNotFoundError(name)
+        return version
+
+    metadata = pytest.importorskip("importlib.metadata")
+    monkeypatch.setattr(metadata, "version", _version)
+    # Other tests may have set __version__ which hides __getattr__
+    monkeypatch.delattr(open_alchemy, "__version__", raising=False)
+    open_alchemy._get_version.cache_clear()
+
+    try:
+        assert open_alchemy.__version__ == (
+            open_alchemy._VERSION if version is None else version
+        )
+    finally:
+        open_alchemy._get_version.cache_clear()
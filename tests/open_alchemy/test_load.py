@@ -0,0 +1,329 @@
+"""Tests for loading the instances of a model from a JSON file."""
+# pylint: disable=redefined-outer-name
+
+import io
+import json
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import load
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "type": "object",
+                "x-tablename": "division",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+            },
+            "Employee": {
+                "type": "object",
+                "x-tablename": "employee",
+                "required": ["id", "name"],
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "joined": {"type": "string", "format": "date", "nullable": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+            },
+        }
+    }
+}
+
+EMPLOYEES = [
+    {"id": 1, "name": "employee 1", "joined": "2020-01-01"},
+    {"id": 2, "name": "employee 2"},
+    {"id": 3, "name": "employee 3", "joined": "2020-01-03"},
+]
+
+
+@pytest.fixture
+def model(engine):
+    """Construct the employee model and create the tables."""
+    base = declarative.declarative_base()
+    registry = open_alchemy.ModelRegistry()
+    open_alchemy.init_model_factory(base=base, spec=SPEC, registry=registry)
+    base.metadata.create_all(engine)
+    return registry.Employee
+
+
+def _query(model, session):
+    """Query the employees as dictionaries."""
+    return list(model.to_dicts(session.query(model).order_by(model.id)))
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        pytest.param("\n".join(json.dumps(value) for value in EMPLOYEES), id="ndjson"),
+        pytest.param(
+            "\n\n".join(json.dumps(value) for value in EMPLOYEES) + "\n\n",
+            id="ndjson blank lines",
+        ),
+        pytest.param(json.dumps(EMPLOYEES), id="array"),
+        pytest.param(json.dumps(EMPLOYEES, indent=4), id="array indented"),
+        pytest.param(
+            "  \n" + json.dumps(EMPLOYEES, separators=(",", ":")) + "\n",
+            id="array compact whitespace",
+        ),
+    ],
+)
+@pytest.mark.parametrize("binary", [False, True], ids=["text", "binary"])
+@pytest.mark.parametrize(
+    "read_size", [1, 3, 1 << 16], ids=["character reads", "small reads", "one read"]
+)
+@pytest.mark.parametrize("core", [False, True], ids=["orm", "core"])
+@pytest.mark.load
+def test_load_ndjson(
+    monkeypatch, model, sessionmaker, contents, binary, read_size, core
+):
+    """
+    GIVEN file with employees and the size the file is read in
+    WHEN load_ndjson is called with the file
+    THEN the employees are loaded in batches.
+    """
+    monkeypatch.setattr(load, "_READ_SIZE", read_size)
+    stream = io.BytesIO(contents.encode()) if binary else io.StringIO(contents)
+    session = sessionmaker()
+
+    result = open_alchemy.load_ndjson(model, stream, session, batch_size=2, core=core)
+
+    assert result.rows == 3
+    assert result.batches == 2
+    assert result.seconds >= 0
+    assert _query(model, session) == [
+        {"id": 1, "name": "employee 1", "joined": "2020-01-01"},
+        {"id": 2, "name": "employee 2", "joined": None},
+        {"id": 3, "name": "employee 3", "joined": "2020-01-03"},
+    ]
+
+
+@pytest.mark.parametrize("contents", ["", "  \n", "[]", " [ ] "])
+@pytest.mark.load
+def test_load_ndjson_empty(model, sessionmaker, contents):
+    """
+    GIVEN file without any employees
+    WHEN load_ndjson is called with the file
+    THEN nothing is loaded.
+    """
+    session = sessionmaker()
+
+    result = open_alchemy.load_ndjson(model, io.StringIO(contents), session)
+
+    assert result.rows == 0
+    assert result.batches == 0
+    assert _query(model, session) == []
+
+
+@pytest.mark.load
+def test_load_ndjson_path(model, sessionmaker, tmp_path):
+    """
+    GIVEN file written by stream_json
+    WHEN load_ndjson is called with the path to the file
+    THEN the employees are loaded.
+    """
+    instances = list(
+        model.from_dicts({**value, "joined": "2020-01-01"} for value in EMPLOYEES)
+    )
+    path = tmp_path / "employees.json"
+    with open(path, "w") as out_file:
+        model.stream_json(instances, out_file)
+    session = sessionmaker()
+
+    result = open_alchemy.load_ndjson(model, path, session)
+
+    assert result.rows == 3
+    assert [value["id"] for value in _query(model, session)] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "line, expected_message",
+    [
+        pytest.param("{", "not valid JSON", id="invalid JSON"),
+        pytest.param("[1]", "must be an object", id="not object"),
+        pytest.param('{"id": 4}', "", id="invalid object"),
+    ],
+)
+@pytest.mark.load
+def test_load_ndjson_invalid(model, sessionmaker, line, expected_message):
+    """
+    GIVEN newline delimited JSON with an invalid line
+    WHEN load_ndjson is called with the file with and without errors
+    THEN MalformedModelDictionaryError is raised without errors and the error is
+        recorded and the other employees are loaded with errors.
+    """
+    contents = "\n".join([json.dumps(EMPLOYEES[0]), line, json.dumps(EMPLOYEES[1])])
+    session = sessionmaker()
+
+    with pytest.raises(
+        exceptions.MalformedModelDictionaryError, match=expected_message
+    ):
+        open_alchemy.load_ndjson(model, io.StringIO(contents), session)
+
+    errors = []
+    result = open_alchemy.load_ndjson(
+        model, io.StringIO(contents), sessionmaker(), errors=errors
+    )
+
+    assert result.rows == 2
+    assert len(errors) == 1
+    (error,) = errors
+    assert error.position == 1
+    assert isinstance(error.error, exceptions.MalformedModelDictionaryError)
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        pytest.param('[{"id": 1, "name": "employee 1"}', id="not closed"),
+        pytest.param('[{"id": 1, "name": "employee 1"} {"id": 2}]', id="comma missing"),
+        pytest.param('[{"id": 1, "name": "employee 1"}, {"id": ]', id="invalid"),
+        pytest.param(
+            '[{"id": 1, "name": "employee 1"}] garbage', id="trailing garbage"
+        ),
+        pytest.param(
+            '[{"id": 1, "name": "employee 1"}]\n[{"id": 2, "name": "employee 2"}]',
+            id="trailing array",
+        ),
+        pytest.param('[{"id": 1, "name": "employee 1"}]]', id="trailing bracket"),
+    ],
+)
+@pytest.mark.parametrize("read_size", [3, 1 << 16], ids=["small reads", "one read"])
+@pytest.mark.load
+def test_load_ndjson_array_invalid(
+    monkeypatch, model, sessionmaker, contents, read_size
+):
+    """
+    GIVEN JSON array that is not valid and the size the file is read in
+    WHEN load_ndjson is called with the file and errors
+    THEN MalformedModelDictionaryError is raised.
+    """
+    monkeypatch.setattr(load, "_READ_SIZE", read_size)
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        open_alchemy.load_ndjson(
+            model, io.StringIO(contents), sessionmaker(), errors=[]
+        )
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        pytest.param('{"id": tx}', id="literal"),
+        pytest.param('{"id" 1}', id="colon missing"),
+        pytest.param('{"id": "\\x"}', id="escape"),
+    ],
+)
+@pytest.mark.load
+def test_load_ndjson_array_invalid_item_not_read(
+    monkeypatch, model, sessionmaker, item
+):
+    """
+    GIVEN JSON array with an invalid item followed by many items
+    WHEN load_ndjson is called with the file
+    THEN MalformedModelDictionaryError is raised without reading the rest of the file.
+    """
+    monkeypatch.setattr(load, "_READ_SIZE", 16)
+    items = [json.dumps(EMPLOYEES[0])] * 1000
+    stream = io.StringIO(f"[{item}, {', '.join(items)}]")
+
+    with pytest.raises(
+        exceptions.MalformedModelDictionaryError, match="not valid JSON"
+    ):
+        open_alchemy.load_ndjson(model, stream, sessionmaker())
+
+    assert stream.tell() <= 2 * 16
+
+
+@pytest.mark.load
+def test_load_ndjson_core_relationship(model, sessionmaker):
+    """
+    GIVEN employee with a division
+    WHEN load_ndjson is called with the employee using core inserts
+    THEN FeatureNotImplementedError is raised.
+    """
+    contents = json.dumps({"id": 1, "name": "employee 1", "division": {"id": 2}})
+
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        open_alchemy.load_ndjson(
+            model, io.StringIO(contents), sessionmaker(), core=True
+        )
+
+
+@pytest.mark.parametrize(
+    "rows, seconds, expected_rows_per_second",
+    [
+        pytest.param(0, 0.0, 0.0, id="no time"),
+        pytest.param(10, 2.0, 5.0, id="time"),
+    ],
+)
+@pytest.mark.load
+def test_load_result_rows_per_second(rows, seconds, expected_rows_per_second):
+    """
+    GIVEN number of rows and time taken
+    WHEN rows_per_second of the result is retrieved
+    THEN the expected rate is returned.
+    """
+    result = open_alchemy.LoadResult(rows=rows, batches=1, seconds=seconds)
+
+    assert result.rows_per_second == expected_rows_per_second
+
+
+@pytest.mark.load
+def test_load_ndjson_core_inheritance(engine, sessionmaker):
+    """
+    GIVEN model that inherits from another model
+    WHEN load_ndjson is called with the model using core inserts
+    THEN FeatureNotImplementedError is raised.
+    """
+    base = declarative.declarative_base()
+    registry = open_alchemy.ModelRegistry()
+    open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Employee": {
+                        "type": "object",
+                        "x-tablename": "employee",
+                        "x-kwargs": {
+                            "__mapper_args__": {"polymorphic_identity": "employee"}
+                        },
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "type": {"type": "string"},
+                        },
+                    },
+                    "Manager": {
+                        "allOf": [
+                            {
+                                "type": "object",
+                                "x-inherits": True,
+                                "x-kwargs": {
+                                    "__mapper_args__": {
+                                        "polymorphic_identity": "manager"
+                                    }
+                                },
+                                "properties": {"name": {"type": "string"}},
+                            },
+                            {"$ref": "#/components/schemas/Employee"},
+                        ]
+                    },
+                }
+            }
+        },
+        registry=registry,
+    )
+    base.metadata.create_all(engine)
+
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        open_alchemy.load_ndjson(
+            registry.Manager, io.StringIO('{"id": 1}'), sessionmaker(), core=True
+        )
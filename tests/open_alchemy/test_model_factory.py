@@ -11,6 +11,7 @@ from sqlalchemy import schema as sql_schema
 
 from open_alchemy import exceptions
 from open_alchemy import model_factory
+from open_alchemy import types
 from open_alchemy.facades import sqlalchemy
 from open_alchemy.schemas import artifacts as schemas_artifacts
 
@@ -437,6 +438,8 @@ def test_schema(schemas, expected_schema):
     )
 
     assert model._schema == expected_schema
+    assert model._to_dict_plan.schema is model._schema
+    assert model._from_dict_plan.schema is model._schema
 
 
 @pytest.mark.model
@@ -795,3 +798,43 @@ class TestPrepareModelDict:
         returned_dict = model_factory._prepare_model_dict(schema=schema)
 
         assert expected_dict == returned_dict
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_level",
+    [
+        pytest.param({}, types.ValidationLevel.FULL, id="default"),
+        pytest.param(
+            {"validation_level": types.ValidationLevel.TYPES},
+            types.ValidationLevel.TYPES,
+            id="types",
+        ),
+    ],
+)
+@pytest.mark.model
+def test_validation_level(kwargs, expected_level):
+    """
+    GIVEN schemas and validation level
+    WHEN model_factory is called with the schemas and the validation level
+    THEN a model with the from_dict plan for the validation level is returned.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        }
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    model = model_factory.model_factory(
+        name="Schema",
+        get_base=_mock_get_base,
+        schemas=schemas,
+        artifacts=artifacts,
+        **kwargs,
+    )
+
+    assert model._from_dict_plan.validation_level == expected_level
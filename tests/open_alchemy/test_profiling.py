@@ -0,0 +1,114 @@
+"""Tests for profiling the initialization of the models."""
+
+import pytest
+
+from open_alchemy import profiling
+
+
+@pytest.mark.profiling
+def test_profile_add_stage():
+    """
+    GIVEN profile
+    WHEN add_stage is called multiple times
+    THEN the seconds and calls are accumulated per stage.
+    """
+    profile = profiling.Profile()
+
+    profile.add_stage(name="stage 1", seconds=1.0)
+    profile.add_stage(name="stage 2", seconds=2.0)
+    profile.add_stage(name="stage 1", seconds=3.0)
+
+    assert profile.stages == {
+        "stage 1": profiling.Timing(seconds=4.0, calls=2),
+        "stage 2": profiling.Timing(seconds=2.0, calls=1),
+    }
+    assert profile.seconds == 6.0
+
+
+@pytest.mark.profiling
+def test_profile_add_model():
+    """
+    GIVEN profile
+    WHEN add_model is called
+    THEN the model is recorded without contributing to the total seconds.
+    """
+    profile = profiling.Profile()
+
+    profile.add_model(name="Model", seconds=1.0)
+
+    assert profile.models == {"Model": profiling.Timing(seconds=1.0, calls=1)}
+    assert profile.seconds == 0.0
+
+
+@pytest.mark.profiling
+def test_profile_stage_error():
+    """
+    GIVEN profile
+    WHEN the body of the stage context raises an error
+    THEN the stage is still recorded.
+    """
+    profile = profiling.Profile()
+
+    with pytest.raises(ValueError):
+        with profile.stage("stage 1"):
+            raise ValueError
+
+    assert profile.stages["stage 1"].calls == 1
+
+
+@pytest.mark.profiling
+def test_profile_to_dict():
+    """
+    GIVEN profile with a stage and a model
+    WHEN to_dict is called
+    THEN the dictionary representation is returned.
+    """
+    profile = profiling.Profile()
+    profile.add_stage(name="stage 1", seconds=1.0)
+    profile.add_model(name="Model", seconds=2.0)
+
+    returned_dict = profile.to_dict()
+
+    assert returned_dict == {
+        "seconds": 1.0,
+        "stages": {"stage 1": {"seconds": 1.0, "calls": 1}},
+        "models": {"Model": {"seconds": 2.0, "calls": 1}},
+    }
+
+
+@pytest.mark.parametrize(
+    "value, expected_enabled",
+    [
+        pytest.param(None, False, id="not set"),
+        pytest.param("", False, id="empty"),
+        pytest.param("1", True, id="set"),
+    ],
+)
+@pytest.mark.profiling
+def test_enabled(monkeypatch, value, expected_enabled):
+    """
+    GIVEN value of the environment variable
+    WHEN enabled is called
+    THEN whether profiling is enabled is returned.
+    """
+    if value is None:
+        monkeypatch.delenv(profiling.ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(profiling.ENV_VAR, value)
+
+    assert profiling.enabled() == expected_enabled
+
+
+@pytest.mark.profiling
+def test_stage_no_profile():
+    """
+    GIVEN no profile
+    WHEN stage is used as a context manager
+    THEN the body is executed.
+    """
+    executed = False
+
+    with profiling.stage(None, "stage 1"):
+        executed = True
+
+    assert executed
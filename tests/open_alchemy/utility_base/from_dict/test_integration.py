@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import utility_base
 
 
@@ -98,3 +99,121 @@ def test_convert_array(mocked_facades_models):
         mocked_facades_models.get_model.return_value.from_dict.return_value
     ]
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema, exception",
+    [
+        pytest.param({}, exceptions.TypeMissingError, id="no type"),
+        pytest.param(
+            {"type": "string", "readOnly": True},
+            exceptions.MalformedModelDictionaryError,
+            id="readOnly",
+        ),
+        pytest.param(
+            {"type": "unsupported"},
+            exceptions.FeatureNotImplementedError,
+            id="unsupported",
+        ),
+        pytest.param(
+            {"type": "object"}, exceptions.MalformedSchemaError, id="object no de-ref"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_convert_invalid(schema, exception):
+    """
+    GIVEN invalid schema and expected exception
+    WHEN compile_convert is called with the schema and the result with a value
+    THEN the expected exception is raised when the value is converted.
+    """
+    convert = utility_base.from_dict.compile_convert(schema=schema)
+
+    with pytest.raises(exception):
+        convert(mock.MagicMock())
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected_value",
+    [
+        pytest.param({"type": "integer"}, 1, 1, id="simple"),
+        pytest.param({"type": "integer"}, None, None, id="simple None"),
+        pytest.param(
+            {"type": "string", "format": "binary"}, "value 1", b"value 1", id="format"
+        ),
+        pytest.param(
+            {"type": "object", "x-json": True},
+            {"key": "value"},
+            {"key": "value"},
+            id="json",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_convert(schema, value, expected_value):
+    """
+    GIVEN schema, value and expected value
+    WHEN compile_convert is called with the schema and the result with the value
+    THEN the expected value is returned.
+    """
+    convert = utility_base.from_dict.compile_convert(schema=schema)
+
+    assert convert(value) == expected_value
+
+
+@pytest.mark.utility_base
+def test_compile_convert_array(mocked_facades_models):
+    """
+    GIVEN schema for array property and value
+    WHEN compile_convert is called with the schema and the result with the value
+    THEN the models are looked up when the value is converted.
+    """
+    schema = {"type": "array", "items": {"type": "object", "x-de-$ref": "RefModel"}}
+
+    convert = utility_base.from_dict.compile_convert(schema=schema)
+    mocked_facades_models.get_model.assert_not_called()
+
+    returned_value = convert([{"key": "value"}])
+
+    expected_value = [
+        mocked_facades_models.get_model.return_value.from_dict.return_value
+    ]
+    assert returned_value == expected_value
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="RefModel", registry=None
+    )
+
+
+@pytest.mark.utility_base
+def test_compile():
+    """
+    GIVEN model schema
+    WHEN compile_ is called with the schema
+    THEN a plan that validates and converts the properties is returned.
+    """
+    schema = {
+        "type": "object",
+        "properties": {"prop_1": {"type": "integer"}},
+        "required": ["prop_1"],
+    }
+
+    plan = utility_base.from_dict.compile_(schema=schema)
+
+    assert plan.schema is schema
+    assert list(plan.properties) == ["prop_1"]
+    assert plan.properties["prop_1"].schema == {"type": "integer"}
+    assert plan.properties["prop_1"].convert(1) == 1
+    plan.validate({"prop_1": 1})
+    with pytest.raises(facades.jsonschema.ValidationError):
+        plan.validate({})
+
+
+@pytest.mark.utility_base
+def test_compile_no_properties():
+    """
+    GIVEN model schema without properties
+    WHEN compile_ is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError):
+        utility_base.from_dict.compile_(schema={})
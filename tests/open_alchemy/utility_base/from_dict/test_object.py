@@ -53,7 +53,9 @@ def test_convert_valid(mocked_facades_models):
 
     returned_value = utility_base.from_dict.object_.convert(value, schema=schema)
 
-    mocked_facades_models.get_model.assert_called_once_with(name="RefModel")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="RefModel", registry=None
+    )
     mocked_facades_models.get_model.return_value.from_dict.assert_called_once_with(
         **{"key": "value"}
     )
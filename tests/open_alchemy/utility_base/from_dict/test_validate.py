@@ -0,0 +1,141 @@
+"""Tests for the validation of dictionaries passed to from_dict."""
+
+import pytest
+
+from open_alchemy import facades
+from open_alchemy import types
+from open_alchemy import utility_base
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string", "nullable": True},
+        "salary": {"type": "number"},
+        "active": {"type": "boolean"},
+        "address": {"type": "object"},
+        "tags": {"type": "array"},
+        "unknown": {"type": "type 1"},
+    },
+    "required": ["id"],
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        pytest.param({}, id="required missing"),
+        pytest.param({"id": "1"}, id="integer string"),
+        pytest.param({"id": 1.1}, id="integer float"),
+        pytest.param({"id": True}, id="integer boolean"),
+        pytest.param({"id": None}, id="integer not nullable None"),
+        pytest.param({"id": 1, "name": 1}, id="string integer"),
+        pytest.param({"id": 1, "name": None}, id="string nullable None"),
+        pytest.param({"id": 1, "salary": "1.1"}, id="number string"),
+        pytest.param({"id": 1, "salary": False}, id="number boolean"),
+        pytest.param({"id": 1, "active": 1}, id="boolean integer"),
+        pytest.param({"id": 1, "address": []}, id="object list"),
+        pytest.param({"id": 1, "tags": {}}, id="array dict"),
+    ],
+)
+@pytest.mark.utility_base
+def test_types_invalid(instance):
+    """
+    GIVEN schema and invalid instance
+    WHEN the validator from types is called with the instance
+    THEN ValidationError is raised.
+    """
+    validate = utility_base.from_dict.validate.types_(schema=SCHEMA)
+
+    with pytest.raises(facades.jsonschema.ValidationError):
+        validate(instance)
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        pytest.param({"id": 1}, id="required only"),
+        pytest.param({"id": 1, "name": "name 1"}, id="string"),
+        pytest.param({"id": 1, "salary": 1.1}, id="number float"),
+        pytest.param({"id": 1, "salary": 1}, id="number integer"),
+        pytest.param({"id": 1, "active": True}, id="boolean"),
+        pytest.param({"id": 1, "address": {}}, id="object"),
+        pytest.param({"id": 1, "tags": []}, id="array"),
+        pytest.param({"id": 1, "unknown": "value 1"}, id="unsupported type"),
+        pytest.param({"id": 1, "other": "value 1"}, id="not a property"),
+    ],
+)
+@pytest.mark.utility_base
+def test_types_valid(instance):
+    """
+    GIVEN schema and valid instance
+    WHEN the validator from types is called with the instance
+    THEN ValidationError is not raised.
+    """
+    validate = utility_base.from_dict.validate.types_(schema=SCHEMA)
+
+    validate(instance)
+
+
+@pytest.mark.parametrize(
+    "level, instance, expected_raises",
+    [
+        pytest.param(
+            types.ValidationLevel.FULL,
+            {"id": 1, "name": "a" * 256},
+            False,
+            id="full valid",
+        ),
+        pytest.param(types.ValidationLevel.FULL, {"id": "1"}, True, id="full invalid"),
+        pytest.param(types.ValidationLevel.TYPES, {"id": 1}, False, id="types valid"),
+        pytest.param(
+            types.ValidationLevel.TYPES, {"id": "1"}, True, id="types invalid"
+        ),
+        pytest.param(types.ValidationLevel.NONE, {"id": "1"}, False, id="none"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_(level, instance, expected_raises):
+    """
+    GIVEN validation level, instance and whether validation is expected to fail
+    WHEN compile_ is called with the level and the validator is called
+    THEN ValidationError is raised if it is expected.
+    """
+    schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    }
+    validate = utility_base.from_dict.validate.compile_(schema=schema, level=level)
+
+    if expected_raises:
+        with pytest.raises(facades.jsonschema.ValidationError):
+            validate(instance)
+    else:
+        validate(instance)
+
+
+@pytest.mark.utility_base
+def test_full(monkeypatch):
+    """
+    GIVEN schema
+    WHEN full is called with the schema and the validator is called twice
+    THEN the jsonschema validator is only constructed when the validator is first
+        called.
+    """
+    constructed = []
+    validator = facades.jsonschema.validator
+
+    def _validator(*, schema):
+        constructed.append(schema)
+        return validator(schema=schema)
+
+    monkeypatch.setattr(facades.jsonschema, "validator", _validator)
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+    validate = utility_base.from_dict.validate.full(schema=schema)
+
+    assert constructed == []
+    validate({"id": 1})
+    with pytest.raises(facades.jsonschema.ValidationError):
+        validate({"id": "1"})
+    assert constructed == [schema]
@@ -240,7 +240,9 @@ def test_from_dict_inheritance_call(mocked_facades_models, __init__):
 
     model.from_dict(**{"key": "value", "parent_key": "parent value"})
 
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", registry=None
+    )
     check_func = mocked_facades_models.get_model.return_value.construct_from_dict_init
     check_func.assert_called_once_with(**{"parent_key": "parent value"})
 
@@ -269,15 +271,24 @@ def test_from_dict_inheritance_return(mocked_facades_models, __init__):
 
     instance = model.from_dict(**{"key": "value", "parent_key": "parent value"})
 
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", registry=None
+    )
     assert instance.key == "value"  # pylint: disable=no-member
     assert instance.parent_key == "parent value"  # pylint: disable=no-member
 
 
 @pytest.mark.parametrize(
     "value",
-    [1, "hi", '"hi"', '{"key_2": 2}'],
-    ids=["not string", "invalid JSON", "not dictionary", "invalid dictionary"],
+    [1, "hi", '"hi"', '{"key_2": 2}', b"hi", b"\xff"],
+    ids=[
+        "not string",
+        "invalid JSON",
+        "not dictionary",
+        "invalid dictionary",
+        "bytes invalid JSON",
+        "bytes invalid UTF-8",
+    ],
 )
 @pytest.mark.utility_base
 def test_from_str_invalid(__init__, value):
@@ -299,10 +310,18 @@ def test_from_str_invalid(__init__, value):
         model.from_str(value)
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param('{"key_1": 1}', id="str"),
+        pytest.param(b'{"key_1": 1}', id="bytes"),
+        pytest.param(memoryview(b'{"key_1": 1}'), id="memoryview"),
+    ],
+)
 @pytest.mark.utility_base
-def test_from_str(__init__):
+def test_from_str(__init__, value):
     """
-    GIVEN schema and JSON string
+    GIVEN schema and JSON string or bytes
     WHEN model is defined with the schema and constructed with from_str
     THEN the instance has the properties from the JSON string.
     """
@@ -315,6 +334,105 @@ def test_from_str(__init__):
         },
     )
 
-    instance = model.from_str('{"key_1": 1}')
+    instance = model.from_str(value)
 
     assert getattr(instance, "key_1") == 1
+
+
+@pytest.mark.utility_base
+def test_from_dict_plan_cached(__init__):
+    """
+    GIVEN class that derives from UtilityBase with a schema
+    WHEN from_dict is called multiple times and after the schema is changed
+    THEN the plan is calculated once per schema.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+
+    assert model.from_dict(key_1=1).key_1 == 1
+    plan = model._from_dict_plan  # pylint: disable=protected-access
+    assert model.from_dict(key_1=2).key_1 == 2
+    assert model._from_dict_plan is plan  # pylint: disable=protected-access
+
+    model._schema = {  # pylint: disable=protected-access
+        "properties": {"key_2": {"type": "string"}}
+    }
+
+    assert model.from_dict(key_2="value 2").key_2 == "value 2"
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(key_1=1)
+
+
+def _model_from_dicts(__init__):
+    """Construct a model for the from_dicts tests."""
+    return type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+
+
+@pytest.mark.utility_base
+def test_from_dicts(__init__):
+    """
+    GIVEN class that derives from UtilityBase and dictionaries
+    WHEN from_dicts is called with the dictionaries
+    THEN an instance for each dictionary is returned.
+    """
+    model = _model_from_dicts(__init__)
+
+    instances = model.from_dicts([{"key": 1}, {"key": 2}])
+
+    assert [instance.key for instance in instances] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param("value", id="not dictionary"),
+        pytest.param({"key": "value"}, id="not valid"),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dicts_invalid(__init__, value):
+    """
+    GIVEN class that derives from UtilityBase and an invalid value
+    WHEN from_dicts is called with the value
+    THEN MalformedModelDictionaryError is raised when the iterator is consumed.
+    """
+    model = _model_from_dicts(__init__)
+
+    instances = model.from_dicts([{"key": 1}, value])
+
+    assert next(instances).key == 1
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        next(instances)
+
+
+@pytest.mark.utility_base
+def test_from_dicts_errors(__init__):
+    """
+    GIVEN class that derives from UtilityBase and valid and invalid dictionaries
+    WHEN from_dicts is called with the dictionaries and errors
+    THEN instances for the valid dictionaries are returned and errors are recorded for
+        the invalid dictionaries.
+    """
+    model = _model_from_dicts(__init__)
+    errors = []
+
+    instances = list(
+        model.from_dicts([{"key": 1}, {"key": "value"}, {"key": 3}], errors=errors)
+    )
+
+    assert [instance.key for instance in instances] == [1, 3]
+    assert len(errors) == 1
+    (error,) = errors
+    assert error.position == 1
+    assert error.value == {"key": "value"}
+    assert isinstance(error.error, exceptions.MalformedModelDictionaryError)
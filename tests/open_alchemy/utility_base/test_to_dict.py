@@ -1,10 +1,13 @@
 """Tests for UtilityBase."""
 
+import io
+import json
 from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import utility_base
 
 
@@ -165,7 +168,9 @@ def test_to_dict_inheritance_call(mocked_facades_models, __init__):
     returned_dict = instance.to_dict()
 
     assert returned_dict == {"key": "value", "parent_key": "parent value"}
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", registry=None
+    )
     check_func = mocked_facades_models.get_model.return_value.instance_to_dict
     check_func.assert_called_once_with(instance)
 
@@ -192,3 +197,244 @@ def test_to_str(__init__):
     assert returned_str == '{"key_1": 1}'
     assert str(instance) == '{"key_1": 1}'
     assert repr(instance) == "open_alchemy.models.Model(key_1=1)"
+
+
+@pytest.mark.utility_base
+def test_to_str_json_codec(__init__):
+    """
+    GIVEN class that derives from UtilityBase with a schema and a JSON codec
+    WHEN to_str is called
+    THEN the properties are encoded using the codec.
+    """
+    model = type(
+        "Model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "integer"}}},
+            "_json_codec": facades.json_codec.Codec(
+                name=facades.json_codec.CodecName.JSON,
+                dumps=lambda value: f"encoded {value}",
+                loads=lambda value: value,
+            ),
+            "__init__": __init__,
+        },
+    )
+    instance = model(key_1=1)
+
+    returned_str = instance.to_str()
+
+    assert returned_str == "encoded {'key_1': 1}"
+
+
+@pytest.mark.utility_base
+def test_to_dict_plan_cached(__init__):
+    """
+    GIVEN class that derives from UtilityBase with a schema
+    WHEN to_dict is called multiple times and after the schema is changed
+    THEN the plan is calculated once per schema.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    instance = model(key_1=1, key_2="value 2")
+
+    assert instance.to_dict() == {"key_1": 1}
+    plan = model._to_dict_plan  # pylint: disable=protected-access
+    assert instance.to_dict() == {"key_1": 1}
+    assert model._to_dict_plan is plan  # pylint: disable=protected-access
+
+    model._schema = {  # pylint: disable=protected-access
+        "properties": {"key_2": {"type": "string"}}
+    }
+
+    assert instance.to_dict() == {"key_2": "value 2"}
+
+
+def _model_to_dicts(__init__):
+    """Construct a model for the to_dicts tests."""
+    return type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+
+
+@pytest.mark.utility_base
+def test_to_dicts(__init__):
+    """
+    GIVEN class that derives from UtilityBase and instances
+    WHEN to_dicts is called with the instances
+    THEN a dictionary for each instance is returned.
+    """
+    model = _model_to_dicts(__init__)
+
+    dicts = model.to_dicts([model(key=1), model(key=2)])
+
+    assert list(dicts) == [{"key": 1}, {"key": 2}]
+
+
+@pytest.mark.parametrize(
+    "get_value, exception",
+    [
+        pytest.param(
+            lambda _: "value", exceptions.InvalidModelInstanceError, id="not instance"
+        ),
+        pytest.param(
+            lambda model: model(key="value"),
+            exceptions.InvalidInstanceError,
+            id="not valid",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_to_dicts_invalid(__init__, get_value, exception):
+    """
+    GIVEN class that derives from UtilityBase and an invalid value
+    WHEN to_dicts is called with the value
+    THEN the expected exception is raised when the iterator is consumed.
+    """
+    model = _model_to_dicts(__init__)
+
+    dicts = model.to_dicts([model(key=1), get_value(model)])
+
+    assert next(dicts) == {"key": 1}
+    with pytest.raises(exception):
+        next(dicts)
+
+
+@pytest.mark.utility_base
+def test_to_dicts_errors(__init__):
+    """
+    GIVEN class that derives from UtilityBase and valid and invalid instances
+    WHEN to_dicts is called with the instances and errors
+    THEN dictionaries for the valid instances are returned and errors are recorded for
+        the invalid instances.
+    """
+    model = _model_to_dicts(__init__)
+    errors = []
+    invalid_instance = model(key="value")
+
+    dicts = list(
+        model.to_dicts([model(key=1), invalid_instance, model(key=3)], errors=errors)
+    )
+
+    assert dicts == [{"key": 1}, {"key": 3}]
+    assert len(errors) == 1
+    (error,) = errors
+    assert error.position == 1
+    assert error.value is invalid_instance
+    assert isinstance(error.error, exceptions.InvalidInstanceError)
+
+
+@pytest.mark.parametrize(
+    "keys, ndjson, expected_value",
+    [
+        pytest.param([], False, "[]", id="array empty"),
+        pytest.param([1], False, '[{"key": 1}]', id="array single"),
+        pytest.param(
+            [1, 2, 3], False, '[{"key": 1},{"key": 2},{"key": 3}]', id="array multiple"
+        ),
+        pytest.param([], True, "", id="ndjson empty"),
+        pytest.param([1], True, '{"key": 1}\n', id="ndjson single"),
+        pytest.param(
+            [1, 2, 3],
+            True,
+            '{"key": 1}\n{"key": 2}\n{"key": 3}\n',
+            id="ndjson multiple",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_stream_json(__init__, keys, ndjson, expected_value):
+    """
+    GIVEN class that derives from UtilityBase and instances
+    WHEN stream_json is called with the instances, a file and ndjson
+    THEN the JSON for the instances is written to the file and the number of instances
+        is returned.
+    """
+    model = _model_to_dicts(__init__)
+    fp = io.StringIO()
+
+    count = model.stream_json(
+        (model(key=key) for key in keys), fp, chunk_size=2, ndjson=ndjson
+    )
+
+    assert count == len(keys)
+    assert fp.getvalue() == expected_value
+
+
+@pytest.mark.utility_base
+def test_stream_json_chunks(__init__):
+    """
+    GIVEN class that derives from UtilityBase and instances
+    WHEN stream_json is called with the instances and a chunk size
+    THEN the instances are converted as they are written, chunk size at a time.
+    """
+    model = _model_to_dicts(__init__)
+    fp = mock.MagicMock()
+    consumed = []
+
+    def _instances():
+        """Record the keys of the instances as they are consumed."""
+        for key in range(5):
+            consumed.append(key)
+            yield model(key=key)
+
+    def _write(value):
+        """Record the number of instances that had been consumed."""
+        writes.append((value, len(consumed)))
+
+    writes = []
+    fp.write.side_effect = _write
+
+    model.stream_json(_instances(), fp, chunk_size=2)
+
+    assert writes == [
+        ("[", 0),
+        ('{"key": 0},{"key": 1}', 2),
+        (',{"key": 2},{"key": 3}', 4),
+        (',{"key": 4}', 5),
+        ("]", 5),
+    ]
+    assert json.loads("".join(value for value, _ in writes)) == [
+        {"key": key} for key in range(5)
+    ]
+
+
+@pytest.mark.utility_base
+def test_stream_json_invalid(__init__):
+    """
+    GIVEN class that derives from UtilityBase and an invalid value
+    WHEN stream_json is called with the value
+    THEN InvalidModelInstanceError is raised.
+    """
+    model = _model_to_dicts(__init__)
+
+    with pytest.raises(exceptions.InvalidModelInstanceError):
+        model.stream_json([model(key=1), "value"], io.StringIO())
+
+
+@pytest.mark.utility_base
+def test_stream_json_errors(__init__):
+    """
+    GIVEN class that derives from UtilityBase and valid and invalid instances
+    WHEN stream_json is called with the instances and errors
+    THEN the valid instances are written and errors are recorded for the invalid
+        instances.
+    """
+    model = _model_to_dicts(__init__)
+    errors = []
+    fp = io.StringIO()
+
+    count = model.stream_json(
+        [model(key="value"), model(key=2), "value", model(key=4)], fp, errors=errors
+    )
+
+    assert count == 2
+    assert json.loads(fp.getvalue()) == [{"key": 2}, {"key": 4}]
+    assert [error.position for error in errors] == [0, 2]
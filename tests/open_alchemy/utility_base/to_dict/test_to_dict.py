@@ -1,7 +1,10 @@
 """Tests for to_dict."""
 
+from unittest import mock
+
 import pytest
 
+from open_alchemy import exceptions
 from open_alchemy.utility_base import to_dict
 
 
@@ -72,3 +75,118 @@ def test_return_none(schema, expected_result):
     result = to_dict.return_none(schema=schema, property_name="prop_1")
 
     assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected_value",
+    [
+        pytest.param({"type": "integer"}, 1, 1, id="simple"),
+        pytest.param(
+            {"type": "string", "format": "binary"}, b"value 1", "value 1", id="format"
+        ),
+        pytest.param(
+            {"type": "object", "x-json": True},
+            {"key": "value"},
+            {"key": "value"},
+            id="json",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "readOnly": True,
+                "properties": {"key": {"type": "integer"}},
+            },
+            mock.MagicMock(key=1),
+            {"key": 1},
+            id="object readOnly",
+        ),
+        pytest.param(
+            {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "readOnly": True,
+                    "properties": {"key": {"type": "integer"}},
+                },
+            },
+            [mock.MagicMock(key=1)],
+            [{"key": 1}],
+            id="array",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_convert(schema, value, expected_value):
+    """
+    GIVEN schema, value and expected value
+    WHEN compile_convert is called with the schema and the result with the value
+    THEN the expected value is returned.
+    """
+    convert = to_dict.compile_convert(schema=schema)
+
+    assert convert(value) == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema, exception",
+    [
+        pytest.param({}, exceptions.TypeMissingError, id="no type"),
+        pytest.param(
+            {"type": "unsupported"},
+            exceptions.FeatureNotImplementedError,
+            id="unsupported type",
+        ),
+        pytest.param({"type": "array"}, exceptions.MalformedSchemaError, id="no items"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_convert_invalid(schema, exception):
+    """
+    GIVEN schema that can't be converted
+    WHEN compile_convert is called with the schema and the result with a value
+    THEN the expected exception is raised when the value is converted.
+    """
+    convert = to_dict.compile_convert(schema=schema)
+
+    with pytest.raises(exception):
+        convert(mock.MagicMock())
+
+
+@pytest.mark.utility_base
+def test_compile():
+    """
+    GIVEN model schema with required, nullable and writeOnly properties
+    WHEN compile_ is called with the schema
+    THEN a plan with the expected properties is returned.
+    """
+    schema = {
+        "properties": {
+            "prop_1": {"type": "integer"},
+            "prop_2": {"type": "integer", "nullable": True},
+            "prop_3": {"type": "integer", "writeOnly": True},
+            "prop_4": {"type": "integer"},
+        },
+        "required": ["prop_1"],
+    }
+
+    plan = to_dict.compile_(schema=schema)
+
+    assert plan.schema is schema
+    assert [(prop.name, prop.return_none) for prop in plan.properties] == [
+        ("prop_1", True),
+        ("prop_2", True),
+        ("prop_4", False),
+    ]
+    assert plan.properties[0].schema == {"type": "integer"}
+    assert plan.properties[0].convert(1) == 1
+
+
+@pytest.mark.utility_base
+def test_compile_no_properties():
+    """
+    GIVEN model schema without properties
+    WHEN compile_ is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError):
+        to_dict.compile_(schema={})
@@ -73,6 +73,11 @@ def test_validate_specfile_does_not_exist(tmp_path):
             ["specfile='specfile.yaml'", "output='models.py'"],
             id="cli generate command",
         ),
+        pytest.param(
+            ["openalchemy", "generate", "specfile.yaml", "models.py", "--workers", "2"],
+            ["specfile='specfile.yaml'", "output='models.py'", "workers=2"],
+            id="cli generate command workers",
+        ),
     ],
 )
 @pytest.mark.cli
@@ -120,6 +125,8 @@ def test_generate(tmp_path):
     args = argparse.Namespace(
         specfile=f"{pathlib.Path.cwd() / 'examples' / 'simple' / 'example-spec.yml'}",
         output=str(model_file),
+        cache_dir=None,
+        workers=None,
     )
 
     cli.generate(args)
@@ -127,6 +134,55 @@ def test_generate(tmp_path):
     assert "Autogenerated SQLAlchemy models" in model_file.read_text()
 
 
+@pytest.mark.cli
+def test_generate_cache_dir(tmp_path):
+    """
+    GIVEN arguments from the parser with a cache directory
+    WHEN they are passed to the generate() function
+    THEN the function generate models and caches them in the directory
+    """
+    model_file = tmp_path / "models.py"
+    cache_dir = tmp_path / "cache"
+    args = argparse.Namespace(
+        specfile=f"{pathlib.Path.cwd() / 'examples' / 'simple' / 'example-spec.yml'}",
+        output=str(model_file),
+        cache_dir=str(cache_dir),
+        workers=None,
+    )
+
+    cli.generate(args)
+
+    assert "Autogenerated SQLAlchemy models" in model_file.read_text()
+    assert any(path.name.endswith(".models.pickle") for path in cache_dir.iterdir())
+
+
+@pytest.mark.cli
+def test_generate_workers(tmp_path):
+    """
+    GIVEN arguments from the parser with workers
+    WHEN they are passed to the generate() function
+    THEN the function generate the same models as without workers
+    """
+    specfile = f"{pathlib.Path.cwd() / 'examples' / 'simple' / 'example-spec.yml'}"
+    expected_model_file = tmp_path / "expected_models.py"
+    cli.generate(
+        argparse.Namespace(
+            specfile=specfile,
+            output=str(expected_model_file),
+            cache_dir=None,
+            workers=None,
+        )
+    )
+    model_file = tmp_path / "models.py"
+    args = argparse.Namespace(
+        specfile=specfile, output=str(model_file), cache_dir=None, workers=2
+    )
+
+    cli.generate(args)
+
+    assert model_file.read_text() == expected_model_file.read_text()
+
+
 @pytest.mark.parametrize(
     "command, expected_file",
     [